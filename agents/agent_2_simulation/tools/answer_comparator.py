@@ -2,135 +2,823 @@
 Tool: Compare model answers with benchmark answers
 """
 
-from typing import List, Dict
+from typing import List, Dict, Iterator, Tuple, Optional, Union
+from array import array
+from itertools import compress
+import hashlib
 import logging
-from difflib import SequenceMatcher
+
+from agents.shared.lru_cache import LRUCache
+
+from .answer_extractor import AnswerExtractor
+from .canonical_answers import CanonicalAnswer, normalize_answer
+from .mcq_scorer import MCQScorer, encode_categories, category_accuracy
+from .option_tables import OptionTable, option_tables_for
+from .parallel_scoring import ParallelScorer
+from .reference_index import ReferenceIndex
+from .vector_scorer import HashedVectorScorer
+from .similarity import get_similarity_backend
 
 logger = logging.getLogger(__name__)
 
+# Cache keys longer than this are replaced by a digest, so a memoized entry
+# costs a bounded amount of memory however long the model completion is
+MAX_CACHE_KEY_CHARS = 256
+
+# Approximate per-entry overhead (key, tuple, dict slot) in bytes
+_CACHE_ENTRY_OVERHEAD = 200
+
+
+def _cache_key(text: str) -> Union[str, bytes]:
+    """Short strings as-is, long ones as a 16-byte digest."""
+    if len(text) <= MAX_CACHE_KEY_CHARS:
+        return text
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+class BatchComparison:
+    """
+    Array-backed results of a batched answer comparison.
+
+    Correctness flags and similarity scores are stored in compact arrays;
+    per-question dicts are only built when details are requested. When the
+    batch was scored without exact similarities, ``similarity`` is None and
+    details report 1.0 for correct and 0.0 for incorrect pairs.
+    """
+
+    __slots__ = (
+        "model_answers",
+        "benchmark_answers",
+        "questions",
+        "correct",
+        "similarity",
+        "_domains",
+        "_difficulties",
+    )
+
+    def __init__(
+        self,
+        model_answers: List[str],
+        benchmark_answers: List[str],
+        questions: List[Dict],
+        correct: array,
+        similarity: Optional[array] = None
+    ):
+        """
+        Initialize Batch Comparison
+
+        Args:
+            model_answers: Answers generated by model
+            benchmark_answers: Correct benchmark answers
+            questions: Original questions
+            correct: Byte array of correctness flags (1 = correct)
+            similarity: Double array of similarity scores (optional)
+        """
+        self.model_answers = model_answers
+        self.benchmark_answers = benchmark_answers
+        self.questions = questions
+        self.correct = correct
+        self.similarity = similarity
+        self._domains = None
+        self._difficulties = None
+
+    def __len__(self) -> int:
+        return len(self.correct)
+
+    @property
+    def correct_count(self) -> int:
+        return sum(self.correct)
+
+    @property
+    def incorrect_count(self) -> int:
+        return len(self.correct) - self.correct_count
+
+    @property
+    def accuracy(self) -> float:
+        return self.correct_count / len(self.correct) if len(self.correct) else 0
+
+    @property
+    def correct_indices(self) -> List[int]:
+        return list(compress(range(len(self.correct)), self.correct))
+
+    @property
+    def incorrect_indices(self) -> List[int]:
+        return [i for i, flag in enumerate(self.correct) if not flag]
+
+    def accuracy_by_domain(self) -> Dict[str, float]:
+        """
+        Accuracy per question domain
+
+        Returns:
+            Dictionary of domain -> accuracy
+        """
+        if self._domains is None:
+            self._domains = encode_categories(
+                self._question_field(i, "domain", "unknown") for i in range(len(self.correct))
+            )
+        return category_accuracy(*self._domains, self.correct)
+
+    def accuracy_by_difficulty(self) -> Dict[str, float]:
+        """
+        Accuracy per question difficulty
+
+        Returns:
+            Dictionary of difficulty -> accuracy
+        """
+        if self._difficulties is None:
+            self._difficulties = encode_categories(
+                self._question_field(i, "difficulty", "medium") for i in range(len(self.correct))
+            )
+        return category_accuracy(*self._difficulties, self.correct)
+
+    def _question_field(self, index: int, field: str, default: str) -> str:
+        if index < len(self.questions):
+            return self.questions[index].get(field, default)
+        return default
+
+    def iter_details(self) -> Iterator[Dict]:
+        """
+        Lazily build the per-question comparison dicts
+
+        Yields:
+            Detailed comparison dictionary for each answer pair
+        """
+        questions = self.questions
+        similarity = self.similarity
+        for i in range(len(self.correct)):
+            question = questions[i] if i < len(questions) else {}
+            yield {
+                "index": i,
+                "question_id": question.get("question_id", f"Q{i+1}"),
+                "model_answer": self.model_answers[i],
+                "benchmark_answer": self.benchmark_answers[i],
+                "is_correct": bool(self.correct[i]),
+                "similarity_score": (
+                    similarity[i] if similarity is not None else float(self.correct[i])
+                ),
+                "domain": question.get("domain", "unknown"),
+                "difficulty": question.get("difficulty", "medium")
+            }
+
+    def to_dict(self, include_details: bool = True) -> Dict:
+        """
+        Convert to the dictionary format returned by AnswerComparator.compare
+
+        Args:
+            include_details: Whether to materialize detailed_comparisons
+
+        Returns:
+            Dictionary with comparison results
+        """
+        correct_indices = self.correct_indices
+        total = len(self.correct)
+
+        return {
+            "correct_indices": correct_indices,
+            "incorrect_indices": self.incorrect_indices,
+            "correct_count": len(correct_indices),
+            "incorrect_count": total - len(correct_indices),
+            "total_count": total,
+            "accuracy": len(correct_indices) / total if total else 0,
+            "detailed_comparisons": list(self.iter_details()) if include_details else []
+        }
+
+
+class ComparisonSummary:
+    """
+    Running aggregate over streamed comparison results.
+
+    Keeps only counters, so memory stays constant however many rows are
+    streamed through it.
+    """
+
+    def __init__(self):
+        """Initialize Comparison Summary"""
+        self.correct_count = 0
+        self.total_count = 0
+        self.error_count = 0
+        self._by_domain: Dict[str, List[int]] = {}
+        self._by_difficulty: Dict[str, List[int]] = {}
+
+    def add(self, comparison: Dict) -> None:
+        """
+        Add one detailed comparison
+
+        Args:
+            comparison: Detailed comparison dict (see BatchComparison.iter_details)
+        """
+        is_correct = 1 if comparison["is_correct"] else 0
+        self.correct_count += is_correct
+        self.total_count += 1
+        for table, key in (
+            (self._by_domain, comparison["domain"]),
+            (self._by_difficulty, comparison["difficulty"]),
+        ):
+            counts = table.setdefault(key, [0, 0])
+            counts[0] += is_correct
+            counts[1] += 1
+
+    def add_error(self) -> None:
+        """Count a row that could not be scored."""
+        self.error_count += 1
+
+    def to_dict(self) -> Dict:
+        """
+        Summary in the shape of the non-streaming comparison result
+
+        Returns:
+            Dictionary with counts, accuracy and per-category accuracy
+        """
+        return {
+            "correct_count": self.correct_count,
+            "incorrect_count": self.total_count - self.correct_count,
+            "total_count": self.total_count,
+            "error_count": self.error_count,
+            "accuracy": self.correct_count / self.total_count if self.total_count else 0,
+            "accuracy_by_domain": {
+                key: correct / total for key, (correct, total) in self._by_domain.items()
+            },
+            "accuracy_by_difficulty": {
+                key: correct / total for key, (correct, total) in self._by_difficulty.items()
+            },
+        }
+
 
 class AnswerComparator:
     """
     Compare model-generated answers with benchmark correct answers
     """
-    
+
     def __init__(self, config=None):
         """
         Initialize Answer Comparator
-        
+
         Args:
             config: Configuration object
         """
         self.config = config
         self.similarity_threshold = 0.8
-        logger.info("AnswerComparator initialized")
-    
+        self.similarity_backend = get_similarity_backend(
+            getattr(config, "similarity_backend", "difflib") if config else "difflib"
+        )
+
+        # Memoize normalized strings and free-text pair scores across requests,
+        # bounded by entry count and, for normalized strings, by bytes
+        cache_size = getattr(config, "comparison_cache_size", 100_000) if config else 100_000
+        default_bytes = 32 * 1024 * 1024
+        cache_bytes = getattr(config, "comparison_cache_bytes", default_bytes) if config else default_bytes
+        self._normalize_cache = LRUCache(
+            max_size=cache_size,
+            max_weight=cache_bytes,
+            weigher=lambda normalized: len(normalized) + _CACHE_ENTRY_OVERHEAD,
+        )
+        self._score_cache = LRUCache(max_size=cache_size)
+        self._reference_cache = LRUCache(max_size=max(1, cache_size // 10) if cache_size else 0)
+
+        # Batched hashed word-vector cosine scoring for the "vector" mode
+        self.vector_scorer = HashedVectorScorer()
+        self.vector_threshold = getattr(config, "vector_threshold", 0.7) if config else 0.7
+
+        # Pulls option letters out of verbose MCQ completions
+        self.answer_extractor = AnswerExtractor()
+        self.mcq_scorer = MCQScorer(self.answer_extractor)
+
+        # Optional process pool for large free-text batches
+        parallel_workers = getattr(config, "parallel_workers", 0) if config else 0
+        self.parallel_scorer = ParallelScorer(
+            max_workers=parallel_workers,
+            min_batch_size=getattr(config, "parallel_min_batch", 5_000),
+            chunk_size=getattr(config, "parallel_chunk_size", 2_000),
+            similarity_backend=self.similarity_backend.name,
+            cache_size=cache_size,
+        ) if parallel_workers > 0 else None
+
+        logger.info(
+            "AnswerComparator initialized (similarity backend: %s, cache size: %d)",
+            self.similarity_backend.name,
+            cache_size,
+        )
+
     def compare(
         self,
         model_answers: List[str],
         benchmark_answers: List[str],
-        questions: List[Dict]
+        questions: List[Dict],
+        accepted_answers: Optional[List[List[str]]] = None
     ) -> Dict:
         """
         Compare model answers with benchmark answers
-        
+
         Args:
             model_answers: Answers generated by model
             benchmark_answers: Correct benchmark answers
             questions: Original questions
-            
+            accepted_answers: Optional acceptable alternates per question
+
         Returns:
             Dictionary with comparison results
         """
+        results = self.compare_batch(
+            model_answers, benchmark_answers, questions, accepted_answers=accepted_answers
+        ).to_dict()
+
+        logger.info(
+            f"Comparison completed: {results['correct_count']} correct, "
+            f"{results['incorrect_count']} incorrect"
+        )
+
+        return results
+
+    def compare_batch(
+        self,
+        model_answers: List[str],
+        benchmark_answers: List[str],
+        questions: List[Dict],
+        with_scores: bool = True,
+        accepted_answers: Optional[List[List[str]]] = None
+    ) -> BatchComparison:
+        """
+        Compare a batch of answer pairs in a single pass
+
+        Each distinct answer string is normalized once per batch, and the
+        similarity computed for the correctness check is reused as the
+        reported similarity score. For multiple choice questions the chosen
+        option letter is extracted first, so verbose completions reduce to
+        a letter compare. Batches above the configured size are scored in
+        chunks across a process pool when parallel workers are enabled.
+
+        Args:
+            model_answers: Answers generated by model
+            benchmark_answers: Correct benchmark answers
+            questions: Original questions
+            with_scores: Compute exact similarity scores; when False only
+                the threshold decision is made, which allows early exit
+            accepted_answers: Optional acceptable alternates per question,
+                matched through a per-question ReferenceIndex
+
+        Returns:
+            BatchComparison with array-backed results
+        """
         logger.info(f"Comparing {len(model_answers)} answer pairs")
-        
+
         if len(model_answers) != len(benchmark_answers):
             raise ValueError(
                 f"Answer count mismatch: {len(model_answers)} vs {len(benchmark_answers)}"
             )
-        
-        correct_indices = []
-        incorrect_indices = []
-        detailed_comparisons = []
-        
+        if accepted_answers is not None and len(accepted_answers) != len(model_answers):
+            raise ValueError(
+                f"Accepted answer count mismatch: {len(accepted_answers)} vs {len(model_answers)}"
+            )
+
+        options = self._row_option_tables(questions, len(model_answers))
+
+        if self.parallel_scorer and self.parallel_scorer.should_parallelize(len(model_answers)):
+            correct, similarity = self.parallel_scorer.score(
+                model_answers,
+                benchmark_answers,
+                options,
+                with_scores,
+                self.similarity_threshold,
+                accepted_answers,
+            )
+        else:
+            correct, similarity = self._score_rows(
+                model_answers, benchmark_answers, options, with_scores, accepted_answers
+            )
+
+        return BatchComparison(
+            model_answers=model_answers,
+            benchmark_answers=benchmark_answers,
+            questions=questions,
+            correct=correct,
+            similarity=similarity
+        )
+
+    def _score_rows(
+        self,
+        model_answers: List[str],
+        benchmark_answers: List[str],
+        options: List[Optional[OptionTable]],
+        with_scores: bool = True,
+        accepted_answers: Optional[List[List[str]]] = None
+    ) -> Tuple[array, Optional[array]]:
+        """
+        Score aligned answer rows in-process
+
+        Args:
+            model_answers: Answers generated by model
+            benchmark_answers: Correct benchmark answers
+            options: Option table per row (or None)
+            with_scores: Compute exact similarity scores
+            accepted_answers: Optional acceptable alternates per row
+
+        Returns:
+            Tuple of (correctness flags, similarity scores or None)
+        """
+        normalized: Dict[str, str] = {}
+        correct = array("b", bytes(len(model_answers)))
+        similarity = array("d", bytes(8 * len(model_answers))) if with_scores else None
+
         for i, (model_ans, bench_ans) in enumerate(zip(model_answers, benchmark_answers)):
-            # Compare answers
-            is_correct = self._is_correct(model_ans, bench_ans)
-            
-            # Calculate similarity score
-            similarity = self._calculate_similarity(model_ans, bench_ans)
-            
-            comparison = {
-                "index": i,
-                "question_id": questions[i].get("question_id", f"Q{i+1}"),
-                "model_answer": model_ans,
-                "benchmark_answer": bench_ans,
-                "is_correct": is_correct,
-                "similarity_score": similarity,
-                "domain": questions[i].get("domain", "unknown"),
-                "difficulty": questions[i].get("difficulty", "medium")
-            }
-            
-            detailed_comparisons.append(comparison)
-            
-            if is_correct:
-                correct_indices.append(i)
-            else:
-                incorrect_indices.append(i)
-        
-        results = {
-            "correct_indices": correct_indices,
-            "incorrect_indices": incorrect_indices,
-            "correct_count": len(correct_indices),
-            "incorrect_count": len(incorrect_indices),
-            "total_count": len(model_answers),
-            "accuracy": len(correct_indices) / len(model_answers) if model_answers else 0,
-            "detailed_comparisons": detailed_comparisons
-        }
-        
-        logger.info(f"Comparison completed: {len(correct_indices)} correct, {len(incorrect_indices)} incorrect")
-        
-        return results
-    
-    def _is_correct(self, model_answer: str, benchmark_answer: str) -> bool:
+            model_norm, bench_norm = self._prepare_pair(model_ans, bench_ans, options[i], normalized)
+
+            is_correct, score = self._score_normalized(model_norm, bench_norm, with_scores)
+
+            if not is_correct and accepted_answers is not None and accepted_answers[i]:
+                matched = self._match_alternates(model_norm, accepted_answers[i])
+                if matched is not None:
+                    is_correct = True
+                    if with_scores:
+                        score = self.similarity_backend.ratio(model_norm, matched)
+
+            correct[i] = is_correct
+            if with_scores:
+                similarity[i] = score
+
+        return correct, similarity
+
+    @staticmethod
+    def _row_option_tables(questions: List[Dict], rows: int) -> List[Optional[OptionTable]]:
+        """Option table per answer row (None past the end of questions)."""
+        tables = option_tables_for(questions)[:rows]
+        if len(tables) < rows:
+            tables = tables + [None] * (rows - len(tables))
+        return tables
+
+    def _prepare_pair(
+        self,
+        model_answer: str,
+        benchmark_answer: str,
+        options: Optional[OptionTable],
+        normalized: Dict[str, str]
+    ) -> Tuple[str, str]:
+        """
+        Normalize a pair (memoized per batch) and resolve option letters
+
+        CanonicalAnswer benchmarks (see BenchmarkLoader canonical=True)
+        are used as-is; only the model side is normalized.
+
+        Args:
+            model_answer: Raw model answer
+            benchmark_answer: Raw benchmark answer
+            options: Question options, if any
+            normalized: Per-batch normalization memo
+
+        Returns:
+            Tuple of (model_norm, bench_norm)
+        """
+        model_norm = normalized.get(model_answer)
+        if model_norm is None:
+            model_norm = normalized[model_answer] = self._normalize_answer(model_answer)
+
+        is_canonical = isinstance(benchmark_answer, CanonicalAnswer)
+        if is_canonical:
+            bench_norm = benchmark_answer.canonical
+        else:
+            bench_norm = normalized.get(benchmark_answer)
+            if bench_norm is None:
+                bench_norm = normalized[benchmark_answer] = self._normalize_answer(benchmark_answer)
+
+        if model_norm != bench_norm:
+            model_norm, bench_norm = self._resolve_choices(
+                model_answer,
+                model_norm,
+                benchmark_answer,
+                bench_norm,
+                options,
+                resolve_benchmark=not is_canonical,
+            )
+
+        return model_norm, bench_norm
+
+    def compare_vector(
+        self,
+        model_answers: List[str],
+        benchmark_answers: List[str],
+        questions: List[Dict],
+        accepted_answers: Optional[List[List[str]]] = None
+    ) -> BatchComparison:
+        """
+        Compare answers with batched hashed word-vector cosine similarity
+
+        Vectors are sublinear term frequencies (TF only: the scorer is
+        built without IDF weights), so scores depend only on the pair.
+
+        Exact and option-letter matches are decided directly; all remaining
+        free-text pairs are vectorized together and scored in one pass.
+        A pair is correct when its cosine reaches vector_threshold.
+
+        Args:
+            model_answers: Answers generated by model
+            benchmark_answers: Correct benchmark answers
+            questions: Original questions
+            accepted_answers: Optional acceptable alternates per question
+
+        Returns:
+            BatchComparison with cosine similarity scores
+        """
+        logger.info(f"Comparing {len(model_answers)} answer pairs (vector mode)")
+
+        if len(model_answers) != len(benchmark_answers):
+            raise ValueError(
+                f"Answer count mismatch: {len(model_answers)} vs {len(benchmark_answers)}"
+            )
+
+        normalized: Dict[str, str] = {}
+        correct = array("b", bytes(len(model_answers)))
+        similarity = array("d", bytes(8 * len(model_answers)))
+        pending: List[Tuple[int, str, str]] = []
+
+        options = self._row_option_tables(questions, len(model_answers))
+        for i, (model_ans, bench_ans) in enumerate(zip(model_answers, benchmark_answers)):
+            model_norm, bench_norm = self._prepare_pair(model_ans, bench_ans, options[i], normalized)
+
+            if model_norm == bench_norm:
+                correct[i] = True
+                similarity[i] = 1.0
+            elif len(model_norm) != 1 or len(bench_norm) != 1:
+                pending.append((i, model_norm, bench_norm))
+
+        scores = self.vector_scorer.score_pairs(
+            [model_norm for _, model_norm, _ in pending],
+            [bench_norm for _, _, bench_norm in pending],
+        )
+
+        for (i, model_norm, _), score in zip(pending, scores):
+            similarity[i] = score
+            correct[i] = score >= self.vector_threshold
+            if not correct[i] and accepted_answers and accepted_answers[i]:
+                correct[i] = self._match_alternates(model_norm, accepted_answers[i]) is not None
+
+        return BatchComparison(
+            model_answers=model_answers,
+            benchmark_answers=benchmark_answers,
+            questions=questions,
+            correct=correct,
+            similarity=similarity
+        )
+
+    def compare_mcq(
+        self,
+        model_answers: List[str],
+        benchmark_answers: List[str],
+        questions: List[Dict],
+        accepted_answers: Optional[List[List[str]]] = None
+    ) -> BatchComparison:
+        """
+        Compare multiple choice answers as integer option codes
+
+        Answers are encoded to option indexes once and compared as arrays;
+        rows whose benchmark answer is not an option fall back to the
+        free-text path. Similarity scores are not computed.
+
+        Args:
+            model_answers: Answers generated by model
+            benchmark_answers: Correct benchmark answers
+            questions: Original questions
+            accepted_answers: Optional acceptable alternates per question,
+                used for rows scored by the free-text fallback
+
+        Returns:
+            BatchComparison without similarity scores
+        """
+        logger.info(f"Comparing {len(model_answers)} MCQ answer pairs")
+
+        if len(model_answers) != len(benchmark_answers):
+            raise ValueError(
+                f"Answer count mismatch: {len(model_answers)} vs {len(benchmark_answers)}"
+            )
+
+        def fallback(i: int) -> bool:
+            question = questions[i] if i < len(questions) else None
+            accepted = accepted_answers[i] if accepted_answers else None
+            return self._is_correct(model_answers[i], benchmark_answers[i], question, accepted)
+
+        correct, _, _ = self.mcq_scorer.score(
+            model_answers, benchmark_answers, questions, fallback=fallback
+        )
+
+        return BatchComparison(
+            model_answers=model_answers,
+            benchmark_answers=benchmark_answers,
+            questions=questions,
+            correct=correct
+        )
+
+    def _score_normalized(
+        self,
+        model_norm: str,
+        bench_norm: str,
+        with_score: bool = True
+    ) -> Tuple[bool, Optional[float]]:
+        """
+        Score a pair of already-normalized answers
+
+        Args:
+            model_norm: Normalized model answer
+            bench_norm: Normalized benchmark answer
+            with_score: Compute the exact similarity score
+
+        Returns:
+            Tuple of (is_correct, similarity_score); the score is None when
+            with_score is False and the pair needed a similarity check
+        """
+        # Exact match
+        if model_norm == bench_norm:
+            return True, 1.0
+
+        # Check if it's a multiple choice answer (A, B, C, D)
+        if len(model_norm) == 1 and len(bench_norm) == 1:
+            return False, 0.0
+
+        # Check for similarity (for free-text answers)
+        key = (_cache_key(model_norm), _cache_key(bench_norm))
+        cached = self._score_cache.get(key)
+        if cached is not None and (cached[1] is not None or not with_score):
+            return cached
+
+        if with_score:
+            similarity = self.similarity_backend.ratio(model_norm, bench_norm)
+            result = (similarity >= self.similarity_threshold, similarity)
+        else:
+            result = (
+                self.similarity_backend.at_least(
+                    model_norm, bench_norm, self.similarity_threshold
+                ),
+                None,
+            )
+
+        self._score_cache.put(key, result)
+        return result
+
+    def _resolve_choices(
+        self,
+        model_answer: str,
+        model_norm: str,
+        benchmark_answer: str,
+        bench_norm: str,
+        options: Optional[Union[List[str], OptionTable]],
+        resolve_benchmark: bool = True
+    ) -> Tuple[str, str]:
+        """
+        Reduce multiple choice answers to their option letters
+
+        Only applies when the question has options or the benchmark is a
+        bare letter; otherwise the normalized answers are returned as-is
+        and free-text similarity is used.
+
+        Args:
+            model_answer: Raw model answer
+            model_norm: Normalized model answer
+            benchmark_answer: Raw benchmark answer
+            bench_norm: Normalized benchmark answer
+            options: Question options, if any
+            resolve_benchmark: Extract the benchmark's option letter too
+                (False when it was already resolved at load time)
+
+        Returns:
+            Tuple of (model_norm, bench_norm), letters where extracted
+        """
+        if not options and len(bench_norm) != 1:
+            return model_norm, bench_norm
+
+        if resolve_benchmark and options and len(bench_norm) != 1:
+            letter = self.answer_extractor.extract(benchmark_answer, options)
+            if letter:
+                bench_norm = letter.lower()
+
+        if len(model_norm) != 1 and len(bench_norm) == 1:
+            letter = self.answer_extractor.extract(model_answer, options)
+            if letter:
+                model_norm = letter.lower()
+
+        return model_norm, bench_norm
+
+    def _is_correct(
+        self,
+        model_answer: str,
+        benchmark_answer: str,
+        question: Optional[Dict] = None,
+        accepted_answers: Optional[List[str]] = None
+    ) -> bool:
         """
         Determine if model answer is correct
-        
+
         Args:
             model_answer: Model's answer
             benchmark_answer: Correct answer
-            
+            question: Original question (used for option extraction)
+            accepted_answers: Other acceptable answers for the question
+
         Returns:
             True if correct, False otherwise
         """
         # Normalize answers
         model_norm = self._normalize_answer(model_answer)
         bench_norm = self._normalize_answer(benchmark_answer)
-        
-        # Exact match
-        if model_norm == bench_norm:
+
+        if model_norm != bench_norm:
+            model_norm, bench_norm = self._resolve_choices(
+                model_answer,
+                model_norm,
+                benchmark_answer,
+                bench_norm,
+                (question or {}).get("options"),
+            )
+
+        if self._score_normalized(model_norm, bench_norm, with_score=False)[0]:
             return True
-        
-        # Check if it's a multiple choice answer (A, B, C, D)
-        if len(model_norm) == 1 and len(bench_norm) == 1:
-            return model_norm == bench_norm
-        
-        # Check for similarity (for free-text answers)
-        similarity = self._calculate_similarity(model_norm, bench_norm)
-        return similarity >= self.similarity_threshold
-    
+
+        if accepted_answers:
+            return self._match_alternates(model_norm, accepted_answers) is not None
+
+        return False
+
+    def _match_alternates(self, model_norm: str, accepted_answers: List[str]) -> Optional[str]:
+        """
+        Match a normalized model answer against acceptable alternates
+
+        Args:
+            model_norm: Normalized model answer
+            accepted_answers: Raw acceptable answers for the question
+
+        Returns:
+            The matching normalized alternate, or None
+        """
+        return self.reference_index(accepted_answers).match(
+            model_norm,
+            self.similarity_backend.at_least,
+            self.similarity_threshold,
+        )
+
+    def reference_index(self, accepted_answers: List[str]) -> ReferenceIndex:
+        """
+        Get the (memoized) reference index for a set of acceptable answers
+
+        Args:
+            accepted_answers: Raw acceptable answers
+
+        Returns:
+            ReferenceIndex over the normalized answers
+        """
+        key = tuple(_cache_key(answer) for answer in accepted_answers)
+        index = self._reference_cache.get(key)
+        if index is None:
+            index = ReferenceIndex([self._normalize_answer(a) for a in accepted_answers])
+            self._reference_cache.put(key, index)
+        return index
+
     def _normalize_answer(self, answer: str) -> str:
+        """
+        Normalize answer for comparison (memoized)
+
+        Args:
+            answer: Raw answer string
+
+        Returns:
+            Normalized answer
+        """
+        key = _cache_key(answer)
+        normalized = self._normalize_cache.get(key)
+        if normalized is None:
+            normalized = self._compute_normalized(answer)
+            self._normalize_cache.put(key, normalized)
+        return normalized
+
+    def _compute_normalized(self, answer: str) -> str:
         """
         Normalize answer for comparison
-        
+
         Args:
             answer: Raw answer string
-            
+
         Returns:
             Normalized answer
         """
-        # Convert to lowercase
-        normalized = answer.lower().strip()
-        
-        # Extract letter if it's a multiple choice answer
-        # e.g., "B)
\ No newline at end of file
+        if isinstance(answer, CanonicalAnswer):
+            return answer.normalized
+        return normalize_answer(answer)
+
+    def cache_stats(self) -> Dict[str, Dict]:
+        """
+        Get memoization statistics
+
+        Returns:
+            Hit/miss/eviction statistics for the normalization and score caches
+        """
+        return {
+            "normalized_answers": self._normalize_cache.stats(),
+            "pair_scores": self._score_cache.stats(),
+            "reference_indexes": self._reference_cache.stats(),
+        }
+
+    def clear_caches(self) -> None:
+        """Drop all memoized normalizations and scores."""
+        self._normalize_cache.clear()
+        self._score_cache.clear()
+        self._reference_cache.clear()
+
+    def close(self) -> None:
+        """Release the parallel scoring pool, if any."""
+        if self.parallel_scorer:
+            self.parallel_scorer.shutdown()
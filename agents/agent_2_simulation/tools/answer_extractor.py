@@ -0,0 +1,160 @@
+"""
+Tool: Extract the chosen option from verbose model completions
+"""
+
+from typing import List, Dict, Optional, Tuple, Union
+import re
+import logging
+
+from agents.shared.lru_cache import LRUCache
+
+from .option_tables import OPTION_LETTERS as _LETTERS, OptionTable
+
+logger = logging.getLogger(__name__)
+
+# A choice letter: "(b)", an uppercase "B" not followed by more letters, or a
+# lowercase "b" only when clearly standalone (so the article "a" is ignored).
+# Case-sensitive even inside the IGNORECASE patterns below.
+_LETTER = (
+    r"(?-i:\(\s*(?P<paren>[A-Ja-j])\s*\)"
+    r"|(?P<upper>[A-J])(?![A-Za-z])"
+    r"|(?P<lower>[a-j])(?=\)|[.,;:!]?\s*$|[.,;:!]\s))"
+)
+
+# "B) ...", "(B) ...", "B. ...", "B: ..." at the very start of the answer
+_LEADING_LETTER = re.compile(r"^\s*\(?(?P<upper>[A-Ja-j])\s*[\).:\]](?:\s|$)")
+
+# "the answer is B", "correct option: (c)", "I would choose D", "**B**"
+_EXPLICIT_CHOICE = re.compile(
+    r"(?:"
+    r"(?:answer|option|choice)(?:\s+(?:is|would\s+be|should\s+be))?\s*[:=\-]?\s*"
+    r"(?:option\s+|choice\s+)?"
+    r"|(?:choose|select|pick|go\s+with)\s+(?:option\s+|choice\s+)?"
+    r"|\*\*"
+    r")" + _LETTER,
+    re.IGNORECASE,
+)
+
+
+def _match_letter(match: "re.Match") -> str:
+    """Pull the letter out of whichever _LETTER branch matched."""
+    return (match.group("paren") or match.group("upper") or match.group("lower")).upper()
+
+
+class AnswerExtractor:
+    """
+    Pull the chosen option letter out of free-form model output.
+
+    Extraction runs, in order:
+      1. An exact option string or option text (O(1) table lookup)
+      2. A leading option letter ("B) Anterior STEMI", "(c)")
+      3. The last explicit choice statement ("... the answer is B")
+      4. A unique option-text mention ("... consistent with anterior STEMI")
+    """
+
+    def __init__(self, cache_size: int = 4096):
+        """
+        Initialize Answer Extractor
+
+        Args:
+            cache_size: Number of parsed option lists to keep
+        """
+        self._option_cache = LRUCache(max_size=cache_size)
+
+    def extract(
+        self,
+        answer: str,
+        options: Optional[Union[List[str], OptionTable]] = None
+    ) -> Optional[str]:
+        """
+        Extract the chosen option letter
+
+        Args:
+            answer: Raw model answer
+            options: Question options (e.g. ["A) ...", "B) ..."]) or their
+                precomputed OptionTable
+
+        Returns:
+            Uppercase option letter, or None if no choice could be found
+        """
+        if not answer:
+            return None
+
+        table = self._parse_options(options)
+        valid = (table.letters if table else "") or _LETTERS[:5]
+
+        stripped = answer.strip()
+        if len(stripped) == 1 and stripped.upper() in valid:
+            return stripped.upper()
+
+        if table:
+            letter = table.letter(stripped)
+            if letter:
+                return letter
+
+        match = _LEADING_LETTER.match(stripped)
+        if match and match.group("upper").upper() in valid:
+            return match.group("upper").upper()
+
+        letter = None
+        for match in _EXPLICIT_CHOICE.finditer(stripped):
+            candidate = _match_letter(match)
+            if candidate in valid:
+                letter = candidate
+        if letter:
+            return letter
+
+        if table and table.texts:
+            return self._match_option_text(stripped.lower(), table.texts)
+
+        return None
+
+    def _parse_options(
+        self,
+        options: Optional[Union[List[str], OptionTable]]
+    ) -> Optional[OptionTable]:
+        """
+        Option table for the options (memoized for raw option lists)
+
+        Returns:
+            OptionTable, or None if there are no options
+        """
+        if not options:
+            return None
+        if isinstance(options, OptionTable):
+            return options
+
+        key = tuple(options)
+        table = self._option_cache.get(key)
+        if table is None:
+            table = OptionTable(key)
+            self._option_cache.put(key, table)
+        return table
+
+    def _match_option_text(
+        self,
+        answer_lower: str,
+        option_texts: Tuple[Tuple[str, str], ...]
+    ) -> Optional[str]:
+        """
+        Find the single option whose text is mentioned in the answer
+
+        Options whose text is contained in another mentioned option
+        (e.g. "STEMI" inside "Anterior STEMI") are not counted separately.
+        """
+        mentioned: Dict[str, str] = {
+            letter: text for letter, text in option_texts if text in answer_lower
+        }
+        if len(mentioned) > 1:
+            mentioned = {
+                letter: text
+                for letter, text in mentioned.items()
+                if not any(text != other and text in other for other in mentioned.values())
+            }
+        if len(mentioned) == 1:
+            return next(iter(mentioned))
+        return None
+
+    def cache_stats(self) -> Dict:
+        """Statistics of the parsed-options cache."""
+        return self._option_cache.stats()
@@ -0,0 +1,196 @@
+"""
+Tool: Compact memory-mapped benchmark format
+
+Layout (little-endian):
+  header   magic b"BMK1", uint32 entry count
+  index    per entry: uint64 id offset, uint32 id length,
+                      uint64 answer offset, uint32 answer length
+           sorted by UTF-8 question id
+  blob     UTF-8 ids and answers (offsets are relative to the blob start)
+
+Convert an existing benchmark file with:
+  python -m agents.agent_2_simulation.tools.benchmark_binary benchmarks.json
+"""
+
+from collections.abc import Mapping
+from typing import Dict, Iterator, Optional
+import mmap
+import os
+import struct
+import tempfile
+import logging
+from pathlib import Path
+
+from .benchmark_stream import iter_benchmark_records
+
+logger = logging.getLogger(__name__)
+
+BINARY_EXTENSION = ".bmk"
+
+_MAGIC = b"BMK1"
+_HEADER = struct.Struct("<4sI")
+_ENTRY = struct.Struct("<QIQI")
+
+
+def write_binary_benchmark(benchmark_map: Dict[str, str], file_path: str) -> str:
+    """
+    Write a benchmark map in the binary format
+
+    The file is written to a temporary name and renamed into place, so
+    processes that already mapped the previous version keep a valid view.
+
+    Args:
+        benchmark_map: Dictionary of question_id -> answer
+        file_path: Destination path
+
+    Returns:
+        The destination path
+    """
+    items = sorted(
+        (str(qid).encode("utf-8"), str(ans).encode("utf-8"))
+        for qid, ans in benchmark_map.items()
+    )
+
+    index = bytearray(_HEADER.pack(_MAGIC, len(items)))
+    blob = bytearray()
+    for qid, ans in items:
+        id_offset = len(blob)
+        blob += qid
+        ans_offset = len(blob)
+        blob += ans
+        index += _ENTRY.pack(id_offset, len(qid), ans_offset, len(ans))
+
+    directory = os.path.dirname(os.path.abspath(file_path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(index)
+            f.write(blob)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+    logger.info("Wrote %d benchmarks to %s", len(items), file_path)
+    return file_path
+
+
+def convert_benchmark_file(source_path: str, output_path: Optional[str] = None) -> str:
+    """
+    Convert a JSON, JSON Lines or CSV benchmark file to the binary format
+
+    Args:
+        source_path: Existing benchmark file
+        output_path: Destination (defaults to the source path with .bmk)
+
+    Returns:
+        Path of the written binary file
+    """
+    output_path = output_path or str(Path(source_path).with_suffix(BINARY_EXTENSION))
+    return write_binary_benchmark(dict(iter_benchmark_records(source_path)), output_path)
+
+
+class MappedBenchmark(Mapping):
+    """
+    Read-only question_id -> answer mapping over a memory-mapped binary file.
+
+    Nothing is parsed up front: lookups binary-search the sorted index in
+    place (O(log n)) and decode only the matched answer. Pages live in the
+    OS page cache, so every worker process mapping the same file shares them.
+
+    The header and index size are checked against the file size on open,
+    and each entry's offsets when it is read; a truncated or corrupt file
+    raises ValueError.
+    """
+
+    def __init__(self, file_path: str):
+        """
+        Initialize Mapped Benchmark
+
+        Args:
+            file_path: Path to a .bmk benchmark file
+        """
+        self.file_path = file_path
+        with open(file_path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < _HEADER.size:
+                raise ValueError(f"Not a binary benchmark file: {file_path}")
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._size = size
+        magic, self._count = _HEADER.unpack_from(self._mm, 0)
+        self._blob_start = _HEADER.size + self._count * _ENTRY.size
+        if magic != _MAGIC:
+            self._mm.close()
+            raise ValueError(f"Not a binary benchmark file: {file_path}")
+        if self._blob_start > size:
+            self._mm.close()
+            raise ValueError(
+                f"Truncated binary benchmark file: {file_path} "
+                f"({self._count} entries need {self._blob_start} index bytes, "
+                f"file has {size})"
+            )
+
+    def _entry(self, position: int):
+        return _ENTRY.unpack_from(self._mm, _HEADER.size + position * _ENTRY.size)
+
+    def _blob(self, offset: int, length: int) -> bytes:
+        """Bytes of one id or answer, checked against the file size."""
+        start = self._blob_start + offset
+        if start + length > self._size:
+            raise ValueError(
+                f"Corrupt binary benchmark file: {self.file_path} "
+                f"(entry at {start} + {length} bytes past end of file)"
+            )
+        return self._mm[start:start + length]
+
+    def _key_at(self, position: int) -> bytes:
+        id_offset, id_len, _, _ = self._entry(position)
+        return self._blob(id_offset, id_len)
+
+    def _find(self, qid: str) -> int:
+        """Index position of qid, or -1."""
+        key = qid.encode("utf-8")
+        low, high = 0, self._count
+        while low < high:
+            mid = (low + high) // 2
+            if self._key_at(mid) < key:
+                low = mid + 1
+            else:
+                high = mid
+        if low < self._count and self._key_at(low) == key:
+            return low
+        return -1
+
+    def __getitem__(self, qid: str) -> str:
+        position = self._find(qid) if isinstance(qid, str) else -1
+        if position < 0:
+            raise KeyError(qid)
+        _, _, ans_offset, ans_len = self._entry(position)
+        return self._blob(ans_offset, ans_len).decode("utf-8")
+
+    def __contains__(self, qid) -> bool:
+        return isinstance(qid, str) and self._find(qid) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        for position in range(self._count):
+            yield self._key_at(position).decode("utf-8")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def close(self) -> None:
+        """Unmap the file."""
+        self._mm.close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Convert benchmark files to .bmk")
+    parser.add_argument("source", help="JSON, JSON Lines or CSV benchmark file")
+    parser.add_argument("output", nargs="?", help="Destination .bmk path")
+    args = parser.parse_args()
+
+    print(convert_benchmark_file(args.source, args.output))
@@ -0,0 +1,151 @@
+"""
+Tool: In-memory index of the benchmark data directory
+"""
+
+from typing import Dict, List, Optional
+import os
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Benchmark file formats in order of preference (memory-mapped binary first)
+BENCHMARK_EXTENSIONS = (".bmk", ".json", ".jsonl", ".csv")
+
+_DEFAULT_STEM = "benchmarks"
+_TAG_SUFFIX = "_benchmarks"
+
+
+class BenchmarkDirectoryIndex:
+    """
+    Maintained listing of the benchmark directory, keyed by domain tag.
+
+    The directory is scanned once and then re-scanned only when its mtime
+    changes (files added, removed or renamed). A daemon thread polls the
+    mtime, so resolving a benchmark file on the request path is a dict
+    lookup with no filesystem calls.
+
+    Resolution order matches the original per-call discovery:
+      1. benchmarks.<ext>
+      2. <domain_tag>_benchmarks.<ext>
+      3. any other benchmark file (first by name)
+    """
+
+    def __init__(self, directory: str, poll_interval: float = 2.0):
+        """
+        Initialize Benchmark Directory Index
+
+        Args:
+            directory: Benchmark data directory
+            poll_interval: Seconds between mtime checks; 0 disables the
+                polling thread and checks the mtime on every lookup instead
+        """
+        self.directory = directory
+        self.poll_interval = poll_interval
+
+        self._mtime_ns: Optional[int] = None
+        self._default: Optional[str] = None
+        self._by_tag: Dict[str, str] = {}
+        self._fallback: Optional[str] = None
+        self._lock = threading.Lock()
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.refresh()
+        if poll_interval > 0:
+            self._thread = threading.Thread(
+                target=self._poll,
+                name="benchmark-index",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Re-scan the directory if its mtime changed
+
+        Args:
+            force: Re-scan even if the mtime is unchanged
+
+        Returns:
+            True if the index was rebuilt
+        """
+        try:
+            mtime_ns = os.stat(self.directory).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+
+        if not force and mtime_ns == self._mtime_ns and mtime_ns is not None:
+            return False
+
+        files: Dict[str, Dict[str, str]] = {ext: {} for ext in BENCHMARK_EXTENSIONS}
+        if mtime_ns is not None:
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    stem, ext = os.path.splitext(entry.name)
+                    ext = ext.lower()
+                    if ext in files and entry.is_file():
+                        files[ext][stem] = entry.path
+
+        default = None
+        by_tag: Dict[str, str] = {}
+        fallback = None
+        for ext in BENCHMARK_EXTENSIONS:
+            stems = files[ext]
+            if default is None and _DEFAULT_STEM in stems:
+                default = stems[_DEFAULT_STEM]
+            for stem in stems:
+                if stem.endswith(_TAG_SUFFIX):
+                    by_tag.setdefault(stem[: -len(_TAG_SUFFIX)], stems[stem])
+            if fallback is None and stems:
+                fallback = stems[min(stems)]
+
+        # Publish the new view in one step; readers never see a partial index
+        with self._lock:
+            self._mtime_ns = mtime_ns
+            self._default = default
+            self._by_tag = by_tag
+            self._fallback = fallback
+
+        logger.info(
+            "Indexed benchmark directory %s (%d domain files)",
+            self.directory,
+            len(by_tag),
+        )
+        return True
+
+    def resolve(self, domain_tag: str) -> Optional[str]:
+        """
+        Benchmark file for a domain tag
+
+        Args:
+            domain_tag: Tag built from the question domains
+
+        Returns:
+            File path, or None if the directory has no benchmark files
+        """
+        if self._thread is None:
+            self.refresh()
+        with self._lock:
+            return self._default or self._by_tag.get(domain_tag) or self._fallback
+
+    def domain_tags(self) -> List[str]:
+        """Domain tags that have a dedicated benchmark file."""
+        with self._lock:
+            return sorted(self._by_tag)
+
+    def _poll(self) -> None:
+        """Background mtime polling loop."""
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.refresh()
+            except OSError as exc:
+                logger.warning("Benchmark directory scan failed: %s", exc)
+
+    def close(self) -> None:
+        """Stop the polling thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.poll_interval + 1)
+            self._thread = None
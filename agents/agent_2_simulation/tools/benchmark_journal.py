@@ -0,0 +1,271 @@
+"""
+Tool: Append-only benchmark journal with snapshot compaction
+"""
+
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+from contextlib import contextmanager
+import json
+import os
+import threading
+import logging
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows; compaction is then per-process only
+    fcntl = None
+
+from .benchmark_binary import MappedBenchmark, write_binary_benchmark
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_FILE = "journal.jsonl"
+COMPACTING_FILE = "journal.compacting.jsonl"
+SNAPSHOT_FILE = "snapshot.bmk"
+LOCK_FILE = "compact.lock"
+
+
+@contextmanager
+def _file_lock(path: str) -> Iterator[None]:
+    """Exclusive advisory lock on path, shared by every process using it."""
+    if fcntl is None:
+        yield
+        return
+    with open(path, "a") as f:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+class BenchmarkJournal:
+    """
+    Benchmark answers stored as a snapshot plus an append-only journal.
+
+    - append() writes one JSON line per new or updated answer, so a save
+      costs O(new entries) instead of rewriting every benchmark.
+    - Reads look up the journal tail first and fall back to the
+      memory-mapped snapshot. The tail is parsed incrementally: only bytes
+      appended since the last read are decoded.
+    - compact() merges the journal into a new snapshot. The journal is first
+      renamed aside, so appends made during compaction land in a fresh
+      journal and are never lost. A lock file serializes compaction across
+      processes sharing the directory.
+    - Entries without an answer are never written, and journal lines that
+      cannot be parsed (e.g. a torn write) are logged and skipped.
+    """
+
+    def __init__(self, directory: str, compact_bytes: int = 8 * 1024 * 1024):
+        """
+        Initialize Benchmark Journal
+
+        Args:
+            directory: Directory holding the snapshot and journal files
+            compact_bytes: Journal size that triggers background compaction
+                (0 disables automatic compaction)
+        """
+        self.directory = directory
+        self.compact_bytes = compact_bytes
+        self.journal_path = os.path.join(directory, JOURNAL_FILE)
+        self.compacting_path = os.path.join(directory, COMPACTING_FILE)
+        self.snapshot_path = os.path.join(directory, SNAPSHOT_FILE)
+        self.lock_path = os.path.join(directory, LOCK_FILE)
+
+        self._lock = threading.RLock()
+        self._compact_lock = threading.Lock()
+        self._compaction: Optional[threading.Thread] = None
+
+        # Parsed journal tails: path -> (inode, offset, entries)
+        self._tails: Dict[str, Tuple[int, int, Dict[str, str]]] = {}
+        self._snapshot: Optional[MappedBenchmark] = None
+        self._snapshot_key: Optional[Tuple[int, int]] = None
+
+    @property
+    def has_entries(self) -> bool:
+        """Whether any journal or snapshot file exists (written by any process)."""
+        return any(
+            os.path.exists(path)
+            for path in (self.journal_path, self.compacting_path, self.snapshot_path)
+        )
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+    def append(self, entries: Iterable[Tuple[str, str]]) -> int:
+        """
+        Append new or updated answers to the journal
+
+        Entries with no id or an empty answer are skipped.
+
+        Args:
+            entries: (question_id, answer) pairs
+
+        Returns:
+            Number of entries written
+        """
+        lines = [
+            json.dumps({"question_id": str(qid), "answer": str(ans)}, ensure_ascii=False)
+            for qid, ans in entries
+            if qid is not None and ans
+        ]
+        if not lines:
+            return 0
+
+        os.makedirs(self.directory, exist_ok=True)
+        with self._lock:
+            with open(self.journal_path, "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+                size = f.tell()
+
+        logger.info("Appended %d benchmarks to %s", len(lines), self.journal_path)
+
+        if self.compact_bytes and size >= self.compact_bytes:
+            self.compact_in_background()
+        return len(lines)
+
+    def compact(self) -> int:
+        """
+        Merge the journal into a new snapshot
+
+        Returns:
+            Number of benchmarks in the new snapshot
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        with self._compact_lock, _file_lock(self.lock_path):
+            with self._lock:
+                # Resume an interrupted compaction before starting a new one
+                if not os.path.exists(self.compacting_path):
+                    if not os.path.exists(self.journal_path):
+                        return len(self._get_snapshot() or ())
+                    os.replace(self.journal_path, self.compacting_path)
+                snapshot = self._get_snapshot()
+                pending = dict(self._read_tail(self.compacting_path))
+
+            merged: Dict[str, str] = dict(snapshot or {})
+            merged.update(pending)
+            write_binary_benchmark(merged, self.snapshot_path)
+
+            with self._lock:
+                try:
+                    os.unlink(self.compacting_path)
+                except FileNotFoundError:
+                    # Already merged by another process (no file locking here)
+                    pass
+                self._tails.pop(self.compacting_path, None)
+
+        logger.info("Compacted benchmark journal into %d-entry snapshot", len(merged))
+        return len(merged)
+
+    def compact_in_background(self) -> None:
+        """Start compaction in a daemon thread unless one is running."""
+        with self._lock:
+            if self._compaction is not None and self._compaction.is_alive():
+                return
+            self._compaction = threading.Thread(
+                target=self._compact_safely,
+                name="benchmark-journal-compaction",
+                daemon=True,
+            )
+            self._compaction.start()
+
+    def _compact_safely(self) -> None:
+        try:
+            self.compact()
+        except Exception as exc:
+            logger.error("Benchmark journal compaction failed: %s", exc)
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+    def lookup(self, question_ids: Iterable[str]) -> Dict[str, str]:
+        """
+        Current answers for the requested ids
+
+        Args:
+            question_ids: Question ids to look up
+
+        Returns:
+            Dictionary of question_id -> answer for ids that have one
+        """
+        with self._lock:
+            journal = self._read_tail(self.journal_path)
+            compacting = self._read_tail(self.compacting_path)
+            snapshot = self._get_snapshot()
+
+        found: Dict[str, str] = {}
+        for qid in question_ids:
+            if qid is None:
+                continue
+            key = str(qid)
+            for source in (journal, compacting, snapshot):
+                if source is not None and key in source:
+                    found[key] = source[key]
+                    break
+        return found
+
+    def _read_tail(self, path: str) -> Dict[str, str]:
+        """
+        Entries of a journal file, parsing only bytes added since last read
+
+        Unparseable lines and entries without an answer are skipped; the
+        offset still moves past them so they are not re-read.
+        """
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            self._tails.pop(path, None)
+            return {}
+
+        inode, offset, entries = self._tails.get(path, (None, 0, {}))
+        if inode != stat.st_ino or stat.st_size < offset:
+            inode, offset, entries = stat.st_ino, 0, {}
+
+        if stat.st_size > offset:
+            with open(path, "rb") as f:
+                f.seek(offset)
+                data = f.read(stat.st_size - offset)
+            # Only consume complete lines; a partial last line is re-read later
+            end = data.rfind(b"\n") + 1
+            for line in data[:end].splitlines():
+                if not line.strip():
+                    continue
+                try:
+                    item = json.loads(line)
+                    qid, answer = item["question_id"], item["answer"]
+                except (ValueError, KeyError, TypeError):
+                    logger.warning(
+                        "Skipping unreadable benchmark journal line in %s: %r",
+                        path,
+                        line[:200],
+                    )
+                    continue
+                if answer:
+                    entries[str(qid)] = str(answer)
+            offset += end
+
+        self._tails[path] = (inode, offset, entries)
+        return entries
+
+    def _get_snapshot(self) -> Optional[MappedBenchmark]:
+        """Memory-mapped snapshot, re-mapped when it is replaced."""
+        try:
+            stat = os.stat(self.snapshot_path)
+        except FileNotFoundError:
+            self._snapshot = self._snapshot_key = None
+            return None
+
+        key = (stat.st_ino, stat.st_mtime_ns)
+        if key != self._snapshot_key:
+            self._snapshot = MappedBenchmark(self.snapshot_path)
+            self._snapshot_key = key
+        return self._snapshot
+
+    def stats(self) -> Dict[str, int]:
+        """Sizes of the journal and snapshot."""
+        with self._lock:
+            journal = self._read_tail(self.journal_path)
+            snapshot = self._get_snapshot()
+        return {
+            "journal_entries": len(journal),
+            "snapshot_entries": len(snapshot) if snapshot is not None else 0,
+        }
@@ -2,24 +2,66 @@
 Tool: Load benchmark answers for comparison
 """
 
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional, Tuple
 import os
+import sys
 import json
 import csv
+import threading
 import logging
 from pathlib import Path
 from datetime import datetime
 
+from agents.shared.lru_cache import LRUCache
+
+from .answer_extractor import AnswerExtractor
+from .benchmark_binary import (
+    BINARY_EXTENSION,
+    MappedBenchmark,
+    convert_benchmark_file,
+    write_binary_benchmark,
+)
+from .benchmark_index import BenchmarkDirectoryIndex
+from .benchmark_journal import BenchmarkJournal
+from .benchmark_store import SQLiteBenchmarkStore
+from .option_tables import OptionTable, option_tables_for
+from .benchmark_stream import iter_benchmark_records, load_selected_benchmarks
+from .canonical_answers import CanonicalAnswer, canonicalize_answer
+
 logger = logging.getLogger(__name__)
 
+# Parsed benchmark maps are keyed by (absolute path, mtime_ns, size)
+BenchmarkKey = Tuple[str, int, int]
+
+
+def _benchmark_map_size(benchmark_map: Dict[str, str]) -> int:
+    """Approximate memory footprint of a parsed benchmark map in bytes."""
+    if isinstance(benchmark_map, MappedBenchmark):
+        # Mapped pages belong to the shared OS page cache
+        return sys.getsizeof(benchmark_map)
+    return sys.getsizeof(benchmark_map) + sum(
+        sys.getsizeof(qid) + sys.getsizeof(answer)
+        for qid, answer in benchmark_map.items()
+    )
+
+
+def _answers_by_id(questions: List[Dict], benchmark_map: Dict[str, str]) -> List[Optional[str]]:
+    """Answer per question from a str(question_id) keyed map (None when missing)."""
+    return [
+        benchmark_map.get(str(qid)) if qid is not None else None
+        for qid in (q.get("question_id") for q in questions)
+    ]
+
 
 class BenchmarkLoader:
     """
     Load benchmark (correct) answers for clinical simulation questions.
     Supports multiple sources:
       1. Extract from question objects (correct_answer field)
-      2. Load from JSON/CSV benchmark files
-      3. Integrate with MedAgentGym if available
+      2. Load from JSON/JSONL/CSV or memory-mapped .bmk benchmark files
+      3. Look up a versioned SQLite benchmark store (optional)
+      4. Read an append-only benchmark journal plus its compacted snapshot
+      5. Integrate with MedAgentGym if available
     """
 
     def __init__(self, config=None):
@@ -35,7 +77,58 @@ class BenchmarkLoader:
         ) if config else "data/benchmarks"
 
         os.makedirs(self.benchmark_data_path, exist_ok=True)
-        self._benchmark_cache: Dict[str, Dict] = {}
+        self._benchmark_index = BenchmarkDirectoryIndex(
+            self.benchmark_data_path,
+            poll_interval=getattr(
+                config, "benchmark_index_poll_interval", 2.0
+            ) if config else 2.0,
+        )
+
+        # Parsed benchmark files, invalidated when mtime or size changes and
+        # evicted least-recently-used once the memory budget is exceeded
+        self._benchmark_cache = LRUCache(
+            max_size=getattr(config, "benchmark_cache_size", 32) if config else 32,
+            max_weight=getattr(
+                config, "benchmark_cache_bytes", 64 * 1024 * 1024
+            ) if config else 64 * 1024 * 1024,
+            weigher=_benchmark_map_size,
+        )
+        # Guards the version map and invalidation count (updated from
+        # executor worker threads)
+        self._lock = threading.Lock()
+        self._benchmark_versions: Dict[str, BenchmarkKey] = {}
+        self._benchmark_invalidations = 0
+
+        # Files at least this large are streamed per request, keeping only
+        # the requested question ids, instead of being parsed and cached whole
+        self.stream_threshold_bytes = getattr(
+            config, "benchmark_stream_threshold_bytes", 32 * 1024 * 1024
+        ) if config else 32 * 1024 * 1024
+
+        # Optional SQLite benchmark store (opened on first use)
+        self.benchmark_store_path = getattr(
+            config, "benchmark_store_path", None
+        ) if config else None
+        self.benchmark_version = getattr(
+            config, "benchmark_version", None
+        ) if config else None
+        self._stores: Dict[str, SQLiteBenchmarkStore] = {}
+
+        self._medagentgym = None
+
+        # Append-only journal + snapshot in <benchmark_data_path>/journal
+        self._journal = BenchmarkJournal(
+            os.path.join(self.benchmark_data_path, "journal"),
+            compact_bytes=getattr(
+                config, "benchmark_journal_compact_bytes", 8 * 1024 * 1024
+            ) if config else 8 * 1024 * 1024,
+        )
+
+        # Canonical forms of benchmark answers, keyed by (answer, options)
+        self._answer_extractor = AnswerExtractor()
+        self._canonical_cache = LRUCache(
+            max_size=getattr(config, "comparison_cache_size", 100_000) if config else 100_000
+        )
 
         logger.info(
             "BenchmarkLoader initialized with path: %s",
@@ -46,13 +139,17 @@ class BenchmarkLoader:
         self,
         questions: List[Dict],
         source: str = "auto",
+        canonical: bool = False,
     ) -> List[str]:
         """
         Load benchmark answers for the given question set.
 
         Args:
             questions: List of question dicts
-            source: "auto", "questions", "file", or "medagentgym"
+            source: "auto", "questions", "file", "sqlite", "journal", or
+                "medagentgym"
+            canonical: Return CanonicalAnswer values (str subclasses with
+                normalized text, option index and hash precomputed)
 
         Returns:
             List of benchmark answers aligned with questions
@@ -67,12 +164,15 @@ class BenchmarkLoader:
             raise ValueError("No questions provided to load benchmarks")
 
         if source == "auto":
-            source = self._determine_source(questions)
-
-        if source == "questions":
+            answers = self._load_auto(questions)
+        elif source == "questions":
             answers = self._load_from_questions(questions)
         elif source == "file":
             answers = self._load_from_file(questions)
+        elif source == "sqlite":
+            answers = self._load_from_store(questions)
+        elif source == "journal":
+            answers = self._load_from_journal(questions)
         elif source == "medagentgym":
             answers = self._load_from_medagentgym(questions)
         else:
@@ -85,31 +185,178 @@ class BenchmarkLoader:
                 f"{len(questions)} questions"
             )
 
+        if canonical:
+            answers = self.canonicalize_answers(answers, questions)
+
         logger.info("✅ Loaded %d benchmark answers", len(answers))
         return answers
 
+    def canonicalize_answers(
+        self,
+        answers: List[str],
+        questions: List[Dict],
+    ) -> List[CanonicalAnswer]:
+        """
+        Convert benchmark answers to their canonical, pre-normalized form.
+
+        Results are memoized per (answer, options), so each distinct
+        benchmark answer is normalized once per process.
+
+        Args:
+            answers: Benchmark answers aligned with questions
+            questions: List of question dicts
+
+        Returns:
+            List of CanonicalAnswer values
+        """
+        canonical: List[CanonicalAnswer] = []
+        for answer, table in zip(answers, option_tables_for(questions)):
+            key = (str(answer), table.options if table else None)
+            value = self._canonical_cache.get(key)
+            if value is None:
+                value = canonicalize_answer(answer, table, self._answer_extractor)
+                self._canonical_cache.put(key, value)
+            canonical.append(value)
+        return canonical
+
+    def load_accepted_answers(
+        self,
+        questions: List[Dict],
+        benchmark_answers: Optional[List[str]] = None,
+        source: str = "auto",
+    ) -> List[List[str]]:
+        """
+        Collect every acceptable answer for each question.
+
+        The benchmark answer comes first, followed by any alternates listed
+        in ``question["accepted_answers"]`` or
+        ``question["metadata"]["accepted_answers"]``.
+
+        Args:
+            questions: List of question dicts
+            benchmark_answers: Already-loaded benchmark answers (optional)
+            source: Benchmark source used when answers must be loaded
+
+        Returns:
+            List of acceptable answers per question, aligned with questions
+        """
+        if benchmark_answers is None:
+            benchmark_answers = self.load_benchmark_answers(questions, source=source)
+
+        accepted: List[List[str]] = []
+        for question, answer in zip(questions, benchmark_answers):
+            alternates = question.get("accepted_answers") or (
+                question.get("metadata") or {}
+            ).get("accepted_answers") or []
+            accepted.append(list(dict.fromkeys([answer, *alternates])))
+
+        return accepted
+
     # ------------------------------------------------------------------
     # Source helpers
     # ------------------------------------------------------------------
-    def _determine_source(self, questions: List[Dict]) -> str:
-        """Automatically pick the best benchmark source."""
+    def _auto_sources(self, questions: List[Dict]) -> List[str]:
+        """Keyed benchmark sources available for auto mode, in precedence order."""
+        sources = []
+        if self.benchmark_store_path and os.path.exists(self.benchmark_store_path):
+            sources.append("sqlite")
+        if self._journal.has_entries:
+            sources.append("journal")
+        if self._benchmark_file_exists(questions):
+            sources.append("file")
+        return sources
+
+    def _load_auto(self, questions: List[Dict]) -> List[str]:
+        """
+        Automatically pick the best benchmark source per question.
+
+        Questions that all carry correct_answer use it directly. Otherwise
+        the SQLite store, journal and benchmark file are consulted in that
+        order, each only for the ids still missing, then MedAgentGym (when
+        enabled); whatever is left falls back to question data.
+        """
         if all(q.get("correct_answer") for q in questions):
             logger.info("Using embedded correct_answer data")
-            return "questions"
+            return self._load_from_questions(questions)
 
-        if self._benchmark_file_exists(questions):
-            logger.info("Benchmark file discovered; using file source")
-            return "file"
+        sources = self._auto_sources(questions)
+        use_medagentgym = bool(self.config and getattr(self.config, "use_medagentgym", False))
+        if not sources and not use_medagentgym:
+            return self._load_from_questions(questions)
 
-        if self.config and getattr(self.config, "use_medagentgym", False):
+        answers: List[Optional[str]] = [None] * len(questions)
+        pending = list(range(len(questions)))
+        lookups = {
+            "sqlite": self._lookup_store,
+            "journal": self._lookup_journal,
+            "file": self._lookup_file,
+        }
+        for source in sources:
+            try:
+                found = lookups[source]([questions[i] for i in pending])
+            except FileNotFoundError as exc:
+                logger.warning("Benchmark %s source unavailable: %s", source, exc)
+                continue
+            resolved = 0
+            still_pending = []
+            for i, answer in zip(pending, found):
+                if answer is None:
+                    still_pending.append(i)
+                else:
+                    answers[i] = answer
+                    resolved += 1
+            logger.info("Resolved %d benchmarks from %s source", resolved, source)
+            pending = still_pending
+            if not pending:
+                return answers
+
+        remaining = [questions[i] for i in pending]
+        if use_medagentgym:
             logger.info("MedAgentGym enabled; attempting integration")
-            return "medagentgym"
+            fallback = self._load_from_medagentgym(remaining)
+        else:
+            fallback = self._fill_missing(remaining, [None] * len(remaining), "benchmark sources")
+        for i, answer in zip(pending, fallback):
+            answers[i] = answer
+        return answers
 
-        return "questions"
+    def _fill_missing(
+        self,
+        questions: List[Dict],
+        found: List[Optional[str]],
+        source: str,
+    ) -> List[str]:
+        """
+        Fall back to question data for questions a source has no answer for.
+
+        The fallback goes through the same inference and normalization as
+        _load_from_questions; a question with no answer at all is logged
+        and gets an empty answer (which never matches).
+        """
+        answers: List[str] = []
+        for question, table, answer in zip(questions, option_tables_for(questions), found):
+            if answer is None:
+                qid = question.get("question_id")
+                logger.warning(
+                    "Question %s missing in %s; falling back to question data",
+                    qid,
+                    source,
+                )
+                answer = question.get("correct_answer") or self._extract_answer_from_options(
+                    question, table
+                )
+                if answer:
+                    answer = self._normalize_answer(answer, table)
+                else:
+                    logger.error("Question %s has no benchmark answer in any source", qid)
+                    answer = ""
+            answers.append(answer)
+        return answers
 
     def _load_from_questions(self, questions: List[Dict]) -> List[str]:
         """Extract answers from the question structures themselves."""
         answers: List[str] = []
+        tables = option_tables_for(questions)
 
         for idx, question in enumerate(questions):
             correct_answer = question.get("correct_answer")
@@ -120,7 +367,7 @@ class BenchmarkLoader:
                     "Question %s missing correct_answer; attempting to infer",
                     question_id,
                 )
-                correct_answer = self._extract_answer_from_options(question)
+                correct_answer = self._extract_answer_from_options(question, tables[idx])
 
             if not correct_answer:
                 raise ValueError(
@@ -128,84 +375,118 @@ class BenchmarkLoader:
                     "correct_answer and cannot be inferred"
                 )
 
-            answers.append(self._normalize_answer(correct_answer, question))
+            answers.append(self._normalize_answer(correct_answer, tables[idx]))
 
         return answers
 
-    def _extract_answer_from_options(self, question: Dict) -> Optional[str]:
+    def _extract_answer_from_options(
+        self,
+        question: Dict,
+        table: Optional[OptionTable] = None,
+    ) -> Optional[str]:
         """
         Attempt to reconstruct the answer from MCQ options + metadata.
         """
-        options = question.get("options", [])
         metadata = question.get("metadata", {})
         answer_letter = metadata.get("answer_letter") or metadata.get("correct_option")
 
-        if answer_letter and options:
-            letter = answer_letter.strip().upper()
-            for option in options:
-                option_str = option.strip()
-                if option_str.startswith(f"{letter})") or option_str.startswith(f"{letter}."):
-                    return option
+        if table is None and question.get("options"):
+            table = OptionTable(question["options"])
+
+        if answer_letter and table:
+            return table.option(answer_letter)
 
         return None
 
-    def _normalize_answer(self, answer: str, question: Dict) -> str:
+    def _normalize_answer(self, answer: str, table: Optional[OptionTable]) -> str:
         """
         Normalize the answer text for consistent comparison downstream.
+
+        A bare option letter is expanded to its full option via the
+        question's option table.
         """
         answer_stripped = answer.strip()
 
-        if len(answer_stripped) == 1 and answer_stripped.isalpha():
-            letter = answer_stripped.upper()
-            for option in question.get("options", []):
-                opt = option.strip()
-                if opt.startswith(f"{letter})") or opt.startswith(f"{letter}."):
-                    return opt
+        if table and len(answer_stripped) == 1 and answer_stripped.isalpha():
+            option = table.option(answer_stripped)
+            if option:
+                return option
 
         return answer
 
     def _load_from_file(self, questions: List[Dict]) -> List[str]:
         """Load benchmarks from JSON/CSV files on disk."""
-        benchmark_file = self._find_benchmark_file(questions)
-
-        if not benchmark_file:
-            raise FileNotFoundError(
-                f"No benchmark file found in {self.benchmark_data_path}"
-            )
+        return self._fill_missing(questions, self._lookup_file(questions), "benchmark file")
 
-        ext = Path(benchmark_file).suffix.lower()
-        if ext == ".json":
-            benchmark_map = self._load_json_benchmark(benchmark_file)
-        elif ext == ".csv":
-            benchmark_map = self._load_csv_benchmark(benchmark_file)
-        else:
-            raise ValueError(f"Unsupported benchmark file format: {ext}")
+    def _lookup_file(self, questions: List[Dict]) -> List[Optional[str]]:
+        """
+        Benchmark file answer per question (None when missing)
 
-        answers: List[str] = []
-        for question in questions:
-            qid = question.get("question_id")
-            if qid in benchmark_map:
-                answers.append(benchmark_map[qid])
-            else:
-                logger.warning(
-                    "Question %s missing in benchmark file; falling back to question data",
-                    qid,
-                )
-                answers.append(
-                    self._normalize_answer(
-                        question.get("correct_answer", ""),
-                        question,
-                    )
+        If the indexed file was deleted since the directory was last
+        scanned, the index is refreshed and the lookup retried once.
+        """
+        question_ids = {q.get("question_id") for q in questions}
+        for attempt in range(2):
+            benchmark_file = self._find_benchmark_file(questions)
+            if not benchmark_file:
+                raise FileNotFoundError(
+                    f"No benchmark file found in {self.benchmark_data_path}"
                 )
+            try:
+                benchmark_map = self._load_benchmark_map(benchmark_file, question_ids)
+                break
+            except FileNotFoundError:
+                if attempt:
+                    raise
+                logger.info("Benchmark file %s disappeared; rescanning", benchmark_file)
+                self._benchmark_index.refresh(force=True)
+
+        return [
+            benchmark_map[qid] if qid in benchmark_map else None
+            for qid in (q.get("question_id") for q in questions)
+        ]
 
-        return answers
+    def _get_store(self, db_path: Optional[str] = None) -> SQLiteBenchmarkStore:
+        """Open (once) the SQLite benchmark store at db_path."""
+        db_path = db_path or self.benchmark_store_path or os.path.join(
+            self.benchmark_data_path, "benchmarks.sqlite3"
+        )
+        with self._lock:
+            store = self._stores.get(db_path)
+            if store is None:
+                store = self._stores[db_path] = SQLiteBenchmarkStore(db_path)
+        return store
+
+    def _load_from_store(self, questions: List[Dict]) -> List[str]:
+        """Load benchmarks for the whole question set in one store query."""
+        return self._fill_missing(questions, self._lookup_store(questions), "benchmark store")
+
+    def _lookup_store(self, questions: List[Dict]) -> List[Optional[str]]:
+        """Benchmark store answer per question (None when missing)."""
+        store = self._get_store()
+        benchmark_map = store.lookup(
+            (q.get("question_id") for q in questions),
+            version=self.benchmark_version,
+        )
+        logger.info(
+            "Loaded %d benchmarks from SQLite store %s",
+            len(benchmark_map),
+            store.db_path,
+        )
+        return _answers_by_id(questions, benchmark_map)
+
+    def _load_from_journal(self, questions: List[Dict]) -> List[str]:
+        """Load benchmarks from the journal tail and compacted snapshot."""
+        return self._fill_missing(questions, self._lookup_journal(questions), "benchmark journal")
+
+    def _lookup_journal(self, questions: List[Dict]) -> List[Optional[str]]:
+        """Journal answer per question (None when missing)."""
+        benchmark_map = self._journal.lookup(q.get("question_id") for q in questions)
+        logger.info("Loaded %d benchmarks from journal", len(benchmark_map))
+        return _answers_by_id(questions, benchmark_map)
 
     def _find_benchmark_file(self, questions: List[Dict]) -> Optional[str]:
         """Discover the most suitable benchmark file for this run."""
-        benchmark_path = Path(self.benchmark_data_path)
-        if not benchmark_path.exists():
-            return None
-
         domains = set(q.get("domain", "general") for q in questions)
         domain_tag = (
             "_".join(sorted(domains))
@@ -213,23 +494,72 @@ class BenchmarkLoader:
             else "multi_domain"
         )
 
-        candidates = [
-            benchmark_path / "benchmarks.json",
-            benchmark_path / "benchmarks.csv",
-            benchmark_path / f"{domain_tag}_benchmarks.json",
-            benchmark_path / f"{domain_tag}_benchmarks.csv",
-        ]
+        return self._benchmark_index.resolve(domain_tag)
 
-        for candidate in candidates:
-            if candidate.exists():
-                return str(candidate)
+    def _load_benchmark_map(
+        self,
+        file_path: str,
+        question_ids: Optional[set] = None,
+    ) -> Dict[str, str]:
+        """
+        Parsed question_id -> answer map for a benchmark file (cached).
 
-        for candidate in benchmark_path.glob("*.json"):
-            return str(candidate)
-        for candidate in benchmark_path.glob("*.csv"):
-            return str(candidate)
+        The cache key includes the file's mtime and size, so an edited file
+        is re-parsed on next use and its stale entry dropped. The returned
+        map is shared between callers and must not be modified.
 
-        return None
+        Files larger than ``stream_threshold_bytes`` are not cached; when
+        question_ids is given they are streamed and only those ids kept.
+        Binary (.bmk) files are memory-mapped rather than parsed.
+
+        Args:
+            file_path: Path to a .bmk, JSON, JSON Lines or CSV benchmark file
+            question_ids: Ids needed by the caller (optional)
+
+        Returns:
+            Dictionary of question_id -> benchmark answer
+        """
+        path = os.path.abspath(file_path)
+        stat = os.stat(path)
+        ext = Path(path).suffix.lower()
+
+        if (
+            question_ids is not None
+            and ext != BINARY_EXTENSION
+            and stat.st_size >= self.stream_threshold_bytes
+        ):
+            return load_selected_benchmarks(path, question_ids)
+
+        key: BenchmarkKey = (path, stat.st_mtime_ns, stat.st_size)
+
+        benchmark_map = self._benchmark_cache.get(key)
+        if benchmark_map is not None:
+            return benchmark_map
+
+        with self._lock:
+            previous = self._benchmark_versions.get(path)
+            changed = previous is not None and previous != key
+            if changed:
+                self._benchmark_cache.pop(previous)
+                self._benchmark_invalidations += 1
+        if changed:
+            logger.info("Benchmark file %s changed; re-parsing", path)
+
+        if ext == BINARY_EXTENSION:
+            benchmark_map = MappedBenchmark(path)
+        elif ext == ".json":
+            benchmark_map = self._load_json_benchmark(path)
+        elif ext == ".jsonl":
+            benchmark_map = self._load_jsonl_benchmark(path)
+        elif ext == ".csv":
+            benchmark_map = self._load_csv_benchmark(path)
+        else:
+            raise ValueError(f"Unsupported benchmark file format: {ext}")
+
+        with self._lock:
+            self._benchmark_cache.put(key, benchmark_map)
+            self._benchmark_versions[path] = key
+        return benchmark_map
 
     def _load_json_benchmark(self, file_path: str) -> Dict[str, str]:
         """Parse benchmark answers from JSON."""
@@ -249,6 +579,12 @@ class BenchmarkLoader:
         logger.info("Loaded %d benchmarks from JSON", len(benchmarks))
         return benchmarks
 
+    def _load_jsonl_benchmark(self, file_path: str) -> Dict[str, str]:
+        """Parse benchmark answers from JSON Lines."""
+        benchmarks = dict(iter_benchmark_records(file_path))
+        logger.info("Loaded %d benchmarks from JSONL", len(benchmarks))
+        return benchmarks
+
     def _load_csv_benchmark(self, file_path: str) -> Dict[str, str]:
         """Parse benchmark answers from CSV."""
         benchmarks: Dict[str, str] = {}
@@ -271,12 +607,16 @@ class BenchmarkLoader:
     def _load_from_medagentgym(self, questions: List[Dict]) -> List[str]:
         """Load benchmark answers via MedAgentGym integration."""
         try:
-            from .medagentgym_integration import MedAgentGymIntegration
-
-            medagentgym = MedAgentGymIntegration(self.config)
-            answers = medagentgym.get_benchmark_answers(questions)
-            logger.info("Loaded %d benchmarks from MedAgentGym", len(answers))
-            return answers
+            if self._medagentgym is None:
+                from .medagentgym_integration import MedAgentGymIntegration
+
+                self._medagentgym = MedAgentGymIntegration(self.config)
+            found = self._medagentgym.get_benchmark_answers(questions)
+            logger.info(
+                "Loaded %d benchmarks from MedAgentGym",
+                sum(answer is not None for answer in found),
+            )
+            return self._fill_missing(questions, found, "MedAgentGym")
         except ImportError:
             logger.warning(
                 "MedAgentGym integration not available; falling back to questions"
@@ -292,11 +632,53 @@ class BenchmarkLoader:
     # ------------------------------------------------------------------
     # Utilities
     # ------------------------------------------------------------------
+    def cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Hit/miss statistics for the loader caches
+
+        Returns:
+            Dictionary of cache name -> statistics
+        """
+        benchmark_stats = self._benchmark_cache.stats()
+        with self._lock:
+            benchmark_stats["invalidations"] = self._benchmark_invalidations
+        return {
+            "benchmark_files": benchmark_stats,
+            "canonical_answers": self._canonical_cache.stats(),
+        }
+
+    def clear_caches(self) -> None:
+        """Drop all cached benchmark files and canonical answers."""
+        with self._lock:
+            self._benchmark_cache.clear()
+            self._benchmark_versions.clear()
+        self._canonical_cache.clear()
+        self._benchmark_index.refresh(force=True)
+
+    def close(self) -> None:
+        """Stop the benchmark directory polling thread and close stores."""
+        self._benchmark_index.close()
+        for store in self._stores.values():
+            store.close()
+        if self._medagentgym is not None:
+            self._medagentgym.close()
+            self._medagentgym = None
+
+    def compact_journal(self) -> int:
+        """
+        Merge the benchmark journal into its snapshot.
+
+        Returns:
+            Number of benchmarks in the new snapshot
+        """
+        return self._journal.compact()
+
     def save_benchmark_file(
         self,
         questions: List[Dict],
         file_path: Optional[str] = None,
         fmt: str = "json",
+        version: Optional[str] = None,
     ) -> str:
         """
         Persist benchmark answers for future reuse.
@@ -304,8 +686,33 @@ class BenchmarkLoader:
         Args:
             questions: Question list with correct_answer data
             file_path: Optional explicit file path
-            fmt: "json" or "csv"
+            fmt: "json", "csv", "bmk" (memory-mapped binary), "sqlite"
+                (bulk insert into the benchmark store) or "journal" (append
+                to the benchmark journal)
+            version: Benchmark version for "sqlite" (defaults to a timestamp)
         """
+        if fmt == "journal":
+            self._journal.append(
+                (q.get("question_id", f"Q{i+1}"), q.get("correct_answer", ""))
+                for i, q in enumerate(questions)
+            )
+            return self._journal.journal_path
+
+        if fmt == "sqlite":
+            store = self._get_store(file_path)
+            store.insert_many(
+                (
+                    (
+                        q.get("question_id", f"Q{i+1}"),
+                        q.get("correct_answer", ""),
+                        q.get("domain", "general"),
+                    )
+                    for i, q in enumerate(questions)
+                ),
+                version=version,
+            )
+            return store.db_path
+
         if not file_path:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             file_path = os.path.join(
@@ -327,9 +734,30 @@ class BenchmarkLoader:
                 writer.writerow(["question_id", "answer"])
                 for qid, ans in benchmark_map.items():
                     writer.writerow([qid, ans])
+        elif fmt == "bmk":
+            write_binary_benchmark(benchmark_map, file_path)
         else:
             raise ValueError(f"Unsupported format: {fmt}")
 
+        self._benchmark_index.refresh()
         logger.info("Saved %d benchmarks to %s", len(benchmark_map), file_path)
         return file_path
 
+    def convert_benchmark_file(
+        self,
+        file_path: str,
+        output_path: Optional[str] = None,
+    ) -> str:
+        """
+        Convert a JSON/JSONL/CSV benchmark file to the binary .bmk format.
+
+        Args:
+            file_path: Existing benchmark file
+            output_path: Destination (defaults to the same name with .bmk)
+
+        Returns:
+            Path of the written binary file
+        """
+        output_path = convert_benchmark_file(file_path, output_path)
+        self._benchmark_index.refresh()
+        return output_path
@@ -0,0 +1,201 @@
+"""
+Tool: SQLite-backed benchmark store
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+from datetime import datetime
+import json
+import os
+import sqlite3
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS benchmark_versions (
+    version    TEXT PRIMARY KEY,
+    created_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS benchmarks (
+    question_id TEXT NOT NULL,
+    version     TEXT NOT NULL,
+    domain      TEXT NOT NULL DEFAULT 'general',
+    answer      TEXT NOT NULL,
+    PRIMARY KEY (question_id, version)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_benchmarks_version_domain
+    ON benchmarks (version, domain);
+"""
+
+# (question_id, answer, domain)
+BenchmarkRow = Tuple[str, str, str]
+
+
+class SQLiteBenchmarkStore:
+    """
+    Versioned benchmark answers in a local SQLite database.
+
+    Rows are keyed by (question_id, version) and indexed by domain. A whole
+    question set is resolved with a single query that joins the id list
+    (passed as one JSON parameter) against the primary key, so lookup cost
+    grows with the question set, not with the size of the corpus.
+    """
+
+    def __init__(self, db_path: str):
+        """
+        Initialize SQLite Benchmark Store
+
+        Args:
+            db_path: Path to the SQLite database (created if missing)
+        """
+        self.db_path = db_path
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: List[sqlite3.Connection] = []
+        self._generation = 0
+
+        directory = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(directory, exist_ok=True)
+
+        conn = self._connection()
+        with conn:
+            conn.executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        """
+        Per-thread connection (sqlite3 connections are not thread-safe)
+
+        Every connection is also registered so close() can reach those
+        opened on other threads (e.g. executor workers).
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.generation != self._generation:
+            # check_same_thread=False only so close() may run on any thread
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with self._lock:
+                self._connections.append(conn)
+                self._local.generation = self._generation
+            self._local.conn = conn
+        return conn
+
+    def insert_many(
+        self,
+        rows: Iterable[BenchmarkRow],
+        version: Optional[str] = None,
+    ) -> Tuple[str, int]:
+        """
+        Bulk insert benchmark answers in one transaction
+
+        Rows without an id or with an empty answer are skipped, like the
+        JSON/CSV loaders do, so they never shadow another benchmark source.
+
+        Args:
+            rows: (question_id, answer, domain) tuples
+            version: Benchmark version (defaults to a timestamp)
+
+        Returns:
+            Tuple of (version, rows written)
+        """
+        version = version or datetime.now().strftime("%Y%m%d_%H%M%S")
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO benchmark_versions (version, created_at) "
+                "VALUES (?, ?)",
+                (version, datetime.now().isoformat()),
+            )
+            cursor = conn.executemany(
+                "INSERT OR REPLACE INTO benchmarks "
+                "(question_id, version, domain, answer) VALUES (?, ?, ?, ?)",
+                (
+                    (str(qid), version, domain or "general", str(answer))
+                    for qid, answer, domain in rows
+                    if qid is not None and answer
+                ),
+            )
+        logger.info(
+            "Stored %d benchmarks (version %s) in %s",
+            cursor.rowcount,
+            version,
+            self.db_path,
+        )
+        return version, cursor.rowcount
+
+    def latest_version(self) -> Optional[str]:
+        """Most recently created benchmark version, or None if empty."""
+        row = self._connection().execute(
+            "SELECT version FROM benchmark_versions "
+            "ORDER BY created_at DESC, version DESC LIMIT 1"
+        ).fetchone()
+        return row[0] if row else None
+
+    def versions(self) -> List[str]:
+        """All benchmark versions, newest first."""
+        return [
+            row[0]
+            for row in self._connection().execute(
+                "SELECT version FROM benchmark_versions "
+                "ORDER BY created_at DESC, version DESC"
+            )
+        ]
+
+    def lookup(
+        self,
+        question_ids: Iterable[str],
+        version: Optional[str] = None,
+        domain: Optional[str] = None,
+    ) -> Dict[str, str]:
+        """
+        Resolve a whole question set in one query
+
+        Args:
+            question_ids: Question ids to look up
+            version: Benchmark version (defaults to the latest)
+            domain: Optional domain filter
+
+        Returns:
+            Dictionary of question_id -> answer for ids with a non-empty
+            answer in the store
+        """
+        ids = [str(qid) for qid in dict.fromkeys(question_ids) if qid is not None]
+        version = version or self.latest_version()
+        if not ids or version is None:
+            return {}
+
+        # CROSS JOIN pins the join order: iterate the requested ids and probe
+        # the primary key, instead of scanning a whole version
+        query = (
+            "SELECT b.question_id, b.answer FROM json_each(?) AS ids "
+            "CROSS JOIN benchmarks AS b "
+            "ON b.question_id = ids.value AND b.version = ? "
+            # Empty answers written by older versions count as missing
+            "WHERE b.answer != ''"
+        )
+        params: List = [json.dumps(ids), version]
+        if domain:
+            query += " AND b.domain = ?"
+            params.append(domain)
+
+        return dict(self._connection().execute(query, params).fetchall())
+
+    def count(self, version: Optional[str] = None) -> int:
+        """Number of benchmark rows (for one version, or in total)."""
+        if version:
+            row = self._connection().execute(
+                "SELECT COUNT(*) FROM benchmarks WHERE version = ?", (version,)
+            ).fetchone()
+        else:
+            row = self._connection().execute("SELECT COUNT(*) FROM benchmarks").fetchone()
+        return row[0]
+
+    def close(self) -> None:
+        """Close every connection opened by the store, on any thread."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+            # Threads still holding a closed connection reopen on next use
+            self._generation += 1
+        for conn in connections:
+            conn.close()
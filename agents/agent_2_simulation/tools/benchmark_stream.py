@@ -0,0 +1,230 @@
+"""
+Tool: Streaming, selective parsing of large benchmark files
+"""
+
+from typing import Dict, Iterator, Optional, Set, TextIO, Tuple
+import csv
+import json
+import re
+import logging
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1 << 16
+
+_WHITESPACE = re.compile(r"[\s,]*")
+_MEMBER_KEY = re.compile(r'[\s,]*"((?:[^"\\]|\\.)*)"\s*:')
+_JSONL_ID = re.compile(r'"(?:question_id|id)"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+BenchmarkRecord = Tuple[str, str]
+
+
+def _record_from_item(item) -> Optional[BenchmarkRecord]:
+    """(question_id, answer) from one benchmark row, or None."""
+    if not isinstance(item, dict):
+        return None
+    qid = item.get("question_id") or item.get("id")
+    ans = item.get("answer") or item.get("correct_answer")
+    if qid and ans:
+        return qid, ans
+    return None
+
+
+class _JsonStream:
+    """
+    Incremental reader for the top level of a JSON array or object.
+
+    Only one member is held in memory at a time; each member is decoded
+    with the C JSON decoder as soon as it is complete in the read buffer.
+    """
+
+    def __init__(self, f: TextIO, chunk_size: int = CHUNK_SIZE):
+        self._file = f
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _read_more(self) -> bool:
+        """Append the next chunk to the buffer; False at end of file."""
+        if self._eof:
+            return False
+        chunk = self._file.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str:
+        """Next significant character (skipping whitespace and commas)."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._read_more():
+                return ""
+
+    def _decode_key(self) -> str:
+        """Decode an object key and consume the following colon."""
+        while True:
+            match = _MEMBER_KEY.match(self._buffer, self._pos)
+            if match:
+                break
+            if not self._read_more():
+                raise ValueError("Malformed benchmark JSON: expected object key")
+        self._pos = match.end()
+        key = match.group(1)
+        return json.loads(f'"{key}"') if "\\" in key else key
+
+    def _decode(self):
+        """Decode the next complete JSON value."""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._read_more():
+                    raise
+                continue
+            # A value ending exactly at the buffer edge may be truncated
+            # (e.g. a number split across chunks)
+            if end == len(self._buffer) and self._read_more():
+                continue
+            self._pos = end
+            return value
+
+    def records(self) -> Iterator[BenchmarkRecord]:
+        """Yield (question_id, answer) for each top-level member."""
+        opening = self._peek()
+        if opening == "[":
+            self._pos += 1
+            while self._peek() not in ("]", ""):
+                record = _record_from_item(self._decode())
+                if record:
+                    yield record
+        elif opening == "{":
+            self._pos += 1
+            while self._peek() not in ("}", ""):
+                qid = self._decode_key()
+                ans = self._decode()
+                if qid and ans:
+                    yield qid, ans
+        else:
+            raise ValueError("Benchmark JSON must be an array or object")
+
+
+def iter_json_records(f: TextIO) -> Iterator[BenchmarkRecord]:
+    """Stream (question_id, answer) pairs from a JSON array or object."""
+    return _JsonStream(f).records()
+
+
+def iter_jsonl_records(
+    f: TextIO,
+    question_ids: Optional[Set[str]] = None
+) -> Iterator[BenchmarkRecord]:
+    """
+    Stream (question_id, answer) pairs from JSON Lines
+
+    When question_ids is given, lines whose id can be read without decoding
+    and is not requested are skipped without parsing.
+    """
+    for line in f:
+        if not line.strip():
+            continue
+        if question_ids is not None:
+            match = _JSONL_ID.search(line)
+            if match and "\\" not in match.group(1) and match.group(1) not in question_ids:
+                continue
+        record = _record_from_item(json.loads(line))
+        if record:
+            yield record
+
+
+def iter_csv_records(f: TextIO) -> Iterator[BenchmarkRecord]:
+    """Stream (question_id, answer) pairs from CSV with a header row."""
+    reader = csv.reader(f)
+    header = next(reader, None)
+    if not header:
+        return
+
+    def column(*names: str) -> Optional[int]:
+        for name in names:
+            if name in header:
+                return header.index(name)
+        return None
+
+    id_cols = [c for c in (column("question_id"), column("id")) if c is not None]
+    ans_cols = [c for c in (column("answer"), column("correct_answer")) if c is not None]
+
+    for row in reader:
+        qid = next((row[c] for c in id_cols if c < len(row) and row[c]), None)
+        ans = next((row[c] for c in ans_cols if c < len(row) and row[c]), None)
+        if qid and ans:
+            yield qid, ans
+
+
+def iter_benchmark_records(
+    file_path: str,
+    question_ids: Optional[Set[str]] = None
+) -> Iterator[BenchmarkRecord]:
+    """
+    Stream (question_id, answer) pairs from a benchmark file
+
+    Args:
+        file_path: JSON, JSON Lines or CSV benchmark file
+        question_ids: Optional requested ids (used to skip JSONL lines early)
+
+    Yields:
+        (question_id, answer) tuples in file order
+    """
+    ext = Path(file_path).suffix.lower()
+    newline = "" if ext == ".csv" else None
+    with open(file_path, "r", encoding="utf-8", newline=newline) as f:
+        if ext == ".json":
+            yield from iter_json_records(f)
+        elif ext == ".jsonl":
+            yield from iter_jsonl_records(f, question_ids)
+        elif ext == ".csv":
+            yield from iter_csv_records(f)
+        else:
+            raise ValueError(f"Unsupported benchmark file format: {ext}")
+
+
+def load_selected_benchmarks(file_path: str, question_ids: Set[str]) -> Dict[str, str]:
+    """
+    Load only the requested question ids from a benchmark file
+
+    Only the requested rows are kept in memory. Duplicate ids keep their
+    last occurrence, as when the whole file is parsed into a dict, so the
+    file is always read to the end.
+
+    Args:
+        file_path: JSON, JSON Lines or CSV benchmark file
+        question_ids: Question ids to keep (None entries are ignored)
+
+    Returns:
+        Dictionary of question_id -> answer for the ids present in the file
+    """
+    wanted = {qid for qid in question_ids if qid is not None}
+    # JSON Lines rows are pre-filtered on their raw string id
+    line_filter = {qid for qid in wanted if isinstance(qid, str)}
+    benchmarks: Dict[str, str] = {}
+    scanned = 0
+
+    for qid, ans in iter_benchmark_records(file_path, line_filter):
+        scanned += 1
+        if qid in wanted:
+            benchmarks[qid] = ans
+
+    logger.info(
+        "Selected %d of %d requested benchmarks from %s (%d rows scanned)",
+        len(benchmarks),
+        len(wanted),
+        file_path,
+        scanned,
+    )
+    return benchmarks
@@ -0,0 +1,102 @@
+"""
+Tool: Canonical (pre-normalized) benchmark answers
+"""
+
+from typing import List, Optional
+import hashlib
+
+from .answer_extractor import AnswerExtractor
+
+
+def normalize_answer(answer: str) -> str:
+    """
+    Normalize answer for comparison
+
+    Args:
+        answer: Raw answer string
+
+    Returns:
+        Lowercased answer, or the option letter for "B) ..." style answers
+    """
+    # Convert to lowercase
+    normalized = answer.lower().strip()
+
+    # Extract letter if it's a multiple choice answer
+    # e.g., "B) Anterior STEMI" -> "b"
+    if len(normalized) >= 2 and normalized[0].isalpha() and normalized[1] in ").":
+        return normalized[0]
+
+    return normalized
+
+
+def answer_digest(normalized: str) -> int:
+    """Stable 64-bit hash of a normalized answer."""
+    return int.from_bytes(
+        hashlib.blake2b(normalized.encode("utf-8"), digest_size=8).digest(), "big"
+    )
+
+
+class CanonicalAnswer(str):
+    """
+    Benchmark answer with its comparison-ready form precomputed.
+
+    Behaves exactly like the original answer string (so it can be returned,
+    serialized and displayed as before) while carrying:
+      - normalized: comparator normalization of the text
+      - option_index: chosen option (A=0, B=1, ...) or -1 for free text
+      - canonical: what the comparator matches against (the option letter
+        for multiple choice answers, otherwise the normalized text)
+      - digest: stable 64-bit hash of canonical
+    """
+
+    def __new__(
+        cls,
+        text: str,
+        normalized: str,
+        option_index: int = -1
+    ) -> "CanonicalAnswer":
+        answer = super().__new__(cls, text)
+        answer.normalized = normalized
+        answer.option_index = option_index
+        answer.canonical = chr(ord("a") + option_index) if option_index >= 0 else normalized
+        answer.digest = answer_digest(answer.canonical)
+        return answer
+
+    def __reduce__(self):
+        return (CanonicalAnswer, (str(self), self.normalized, self.option_index))
+
+
+def canonicalize_answer(
+    answer: str,
+    options: Optional[List[str]] = None,
+    extractor: Optional[AnswerExtractor] = None
+) -> CanonicalAnswer:
+    """
+    Build the canonical form of one benchmark answer
+
+    The option index is resolved the same way AnswerComparator resolves
+    benchmark answers: a bare letter always counts, otherwise the option is
+    extracted only when the question has options.
+
+    Args:
+        answer: Benchmark answer text
+        options: Question options or their OptionTable, if any
+        extractor: AnswerExtractor used to resolve option text
+
+    Returns:
+        CanonicalAnswer
+    """
+    if isinstance(answer, CanonicalAnswer):
+        return answer
+
+    normalized = normalize_answer(answer)
+    option_index = -1
+
+    if len(normalized) == 1 and "a" <= normalized <= "z":
+        option_index = ord(normalized) - ord("a")
+    elif options:
+        letter = (extractor or AnswerExtractor()).extract(answer, options)
+        if letter:
+            option_index = ord(letter) - ord("A")
+
+    return CanonicalAnswer(answer, normalized, option_index)
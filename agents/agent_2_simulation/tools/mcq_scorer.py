@@ -0,0 +1,150 @@
+"""
+Tool: Integer-coded columnar scoring for multiple choice questions
+"""
+
+from typing import List, Dict, Callable, Optional, Tuple, Iterable
+from array import array
+from collections import Counter
+from itertools import compress, repeat
+import operator
+import logging
+
+from .answer_extractor import AnswerExtractor
+from .canonical_answers import CanonicalAnswer
+from .option_tables import option_tables_for
+
+logger = logging.getLogger(__name__)
+
+# Codes for answers with no recognizable option; distinct so that two
+# unknown answers never compare equal
+UNKNOWN_MODEL = -1
+UNKNOWN_BENCHMARK = -2
+
+
+def encode_categories(values: Iterable[str]) -> Tuple[array, List[str]]:
+    """
+    Encode category labels as small integer codes
+
+    Args:
+        values: Category label per row
+
+    Returns:
+        Tuple of (code array, code -> label list)
+    """
+    table: Dict[str, int] = {}
+    codes = array("H", [table.setdefault(value, len(table)) for value in values])
+    return codes, list(table)
+
+
+def category_accuracy(codes: array, labels: List[str], correct) -> Dict[str, float]:
+    """
+    Accuracy per category from code and correctness columns
+
+    Args:
+        codes: Category code per row
+        labels: Code -> label list
+        correct: Correctness flag per row (0/1)
+
+    Returns:
+        Dictionary of label -> accuracy
+    """
+    totals = Counter(codes)
+    hits = Counter(compress(codes, correct))
+    return {labels[code]: hits[code] / total for code, total in totals.items()}
+
+
+class MCQScorer:
+    """
+    Score multiple choice answers as option indexes.
+
+    Answers are encoded once into a signed byte array of option indexes,
+    so correctness for the whole batch is a single element-wise compare.
+    """
+
+    def __init__(self, extractor: Optional[AnswerExtractor] = None):
+        """
+        Initialize MCQ Scorer
+
+        Args:
+            extractor: AnswerExtractor used to find option letters
+        """
+        self.extractor = extractor or AnswerExtractor()
+
+    def encode_answers(
+        self,
+        answers: List[str],
+        questions: List[Dict],
+        unknown: int = UNKNOWN_MODEL
+    ) -> array:
+        """
+        Encode answers as option indexes (A=0, B=1, ...)
+
+        CanonicalAnswer values use their precomputed option index.
+
+        Args:
+            answers: Raw answers
+            questions: Questions aligned with answers
+            unknown: Code used when no option can be extracted
+
+        Returns:
+            Signed byte array of option indexes
+        """
+        memo: Dict[Tuple[str, int], int] = {}
+        codes = array("b", bytes(len(answers)))
+        tables = option_tables_for(questions)
+
+        for i, answer in enumerate(answers):
+            if isinstance(answer, CanonicalAnswer):
+                codes[i] = answer.option_index if answer.option_index >= 0 else unknown
+                continue
+            table = tables[i] if i < len(tables) else None
+            key = (answer, id(table))
+            code = memo.get(key)
+            if code is None:
+                letter = self.extractor.extract(answer, table)
+                code = memo[key] = ord(letter) - ord("A") if letter else unknown
+            codes[i] = code
+
+        return codes
+
+    def score(
+        self,
+        model_answers: List[str],
+        benchmark_answers: List[str],
+        questions: List[Dict],
+        fallback: Optional[Callable[[int], bool]] = None
+    ) -> Tuple[array, array, array]:
+        """
+        Score a batch of multiple choice answers
+
+        Args:
+            model_answers: Answers generated by model
+            benchmark_answers: Correct benchmark answers
+            questions: Original questions
+            fallback: Called with the row index for rows whose benchmark
+                answer is not an option; returns correctness
+
+        Returns:
+            Tuple of (correctness flags, model codes, benchmark codes)
+        """
+        model_codes = self.encode_answers(model_answers, questions, UNKNOWN_MODEL)
+        bench_codes = self.encode_answers(benchmark_answers, questions, UNKNOWN_BENCHMARK)
+
+        correct = array("b", map(operator.eq, model_codes, bench_codes))
+
+        if fallback is not None:
+            unknown_rows = compress(
+                range(len(bench_codes)),
+                map(operator.eq, bench_codes, repeat(UNKNOWN_BENCHMARK)),
+            )
+            fallback_count = 0
+            for i in unknown_rows:
+                correct[i] = fallback(i)
+                fallback_count += 1
+            if fallback_count:
+                logger.info(
+                    "MCQ scoring fell back to free-text comparison for %d rows",
+                    fallback_count,
+                )
+
+        return correct, model_codes, bench_codes
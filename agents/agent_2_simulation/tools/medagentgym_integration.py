@@ -0,0 +1,294 @@
+"""
+Tool: Fetch benchmark answers from a MedAgentGym service
+"""
+
+from typing import Dict, Iterable, List, Optional
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+import logging
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+ANSWERS_ENDPOINT = "/benchmarks/answers"
+
+
+class AnswerCache:
+    """
+    Persistent question_id -> answer cache on local SQLite.
+
+    Entries older than ttl seconds are treated as missing and re-fetched.
+    """
+
+    def __init__(self, db_path: str, ttl: float = 86400.0):
+        """
+        Initialize Answer Cache
+
+        Args:
+            db_path: SQLite file for cached responses
+            ttl: Seconds a cached answer stays valid (0 keeps forever)
+        """
+        self.db_path = db_path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS answers ("
+                "question_id TEXT PRIMARY KEY, answer TEXT NOT NULL, "
+                "fetched_at REAL NOT NULL) WITHOUT ROWID"
+            )
+
+    def get_many(self, question_ids: List[str]) -> Dict[str, str]:
+        """Cached, unexpired answers for the given ids."""
+        if not question_ids:
+            return {}
+        oldest = time.time() - self.ttl if self.ttl else 0.0
+        found: Dict[str, str] = {}
+        with self._lock:
+            # Stay under SQLite's bound-parameter limit
+            for start in range(0, len(question_ids), 500):
+                chunk = question_ids[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                found.update(self._conn.execute(
+                    f"SELECT question_id, answer FROM answers "
+                    f"WHERE question_id IN ({placeholders}) AND fetched_at >= ?",
+                    [*chunk, oldest],
+                ).fetchall())
+        return found
+
+    def put_many(self, answers: Dict[str, str]) -> None:
+        """Store fetched answers."""
+        if not answers:
+            return
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO answers (question_id, answer, fetched_at) "
+                "VALUES (?, ?, ?)",
+                [(qid, ans, now) for qid, ans in answers.items()],
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class MedAgentGymIntegration:
+    """
+    Batched, concurrent client for MedAgentGym benchmark answers.
+
+    Missing ids are split into batches and POSTed to the service over one
+    pooled httpx.AsyncClient, with at most max_concurrency batches in
+    flight. Every request has a timeout and failed batches are retried.
+    Fetched answers are written to a persistent on-disk cache, so repeated
+    question sets are served locally.
+
+    The client lives on a dedicated event loop thread started on first use,
+    so its connection pool is shared by every call until close().
+
+    A local stand-in service lives in medagentgym_server.py.
+    """
+
+    def __init__(self, config=None):
+        """
+        Initialize MedAgentGym Integration
+
+        Args:
+            config: SimulationSettings instance (optional)
+        """
+        def setting(name, default):
+            return getattr(config, name, default) if config else default
+
+        self.base_url = setting("medagentgym_url", "http://127.0.0.1:8765").rstrip("/")
+        self.api_key = setting("medagentgym_api_key", None)
+        self.batch_size = max(1, setting("medagentgym_batch_size", 100))
+        self.max_concurrency = max(1, setting("medagentgym_max_concurrency", 8))
+        self.timeout = setting("medagentgym_timeout", 10.0)
+        self.retries = setting("medagentgym_retries", 2)
+
+        cache_path = setting("medagentgym_cache_path", "data/medagentgym_cache.sqlite3")
+        self.cache = AnswerCache(
+            cache_path,
+            ttl=setting("medagentgym_cache_ttl", 86400.0),
+        ) if cache_path else None
+
+        # Long-lived client and the loop it runs on (started on first use)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop_lock = threading.Lock()
+
+        logger.info(
+            "MedAgentGymIntegration initialized (url=%s, batch=%d, concurrency=%d)",
+            self.base_url,
+            self.batch_size,
+            self.max_concurrency,
+        )
+
+    def _make_client(self) -> httpx.AsyncClient:
+        """Pooled async client sized to the concurrency limit."""
+        headers = {"Authorization": f"Bearer {self.api_key}"} if self.api_key else None
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=headers,
+            timeout=httpx.Timeout(self.timeout),
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency,
+            ),
+        )
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the client's event loop thread if it is not running yet."""
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever,
+                    name="medagentgym-client",
+                    daemon=True,
+                )
+                thread.start()
+                self._client = self._make_client()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    async def _fetch_batch(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        question_ids: List[str],
+    ) -> Dict[str, str]:
+        """POST one batch of ids, retrying transport errors and 5xx responses."""
+        async with semaphore:
+            for attempt in range(self.retries + 1):
+                try:
+                    response = await client.post(
+                        ANSWERS_ENDPOINT, json={"question_ids": question_ids}
+                    )
+                    if response.status_code < 500:
+                        response.raise_for_status()
+                        return response.json().get("answers", {})
+                    error: Exception = httpx.HTTPStatusError(
+                        f"Server error {response.status_code}",
+                        request=response.request,
+                        response=response,
+                    )
+                except httpx.TransportError as exc:
+                    error = exc
+                if attempt < self.retries:
+                    await asyncio.sleep(0.1 * 2 ** attempt)
+            raise error
+
+    async def fetch_answers(
+        self,
+        question_ids: Iterable[str],
+        client: Optional[httpx.AsyncClient] = None,
+    ) -> Dict[str, str]:
+        """
+        Fetch answers for the given ids (cache first, then the service)
+
+        Args:
+            question_ids: Question ids to fetch
+            client: Optional open AsyncClient to reuse (defaults to the
+                long-lived client on its own loop, or a temporary client
+                when awaited on another loop)
+
+        Returns:
+            Dictionary of question_id -> answer for ids the service knows
+        """
+        ids = [str(qid) for qid in dict.fromkeys(question_ids) if qid is not None]
+        answers = self.cache.get_many(ids) if self.cache else {}
+        missing = [qid for qid in ids if qid not in answers]
+        if not missing:
+            return answers
+
+        batches = [
+            missing[start:start + self.batch_size]
+            for start in range(0, len(missing), self.batch_size)
+        ]
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        owns_client = False
+        if client is None:
+            if self._client is not None and asyncio.get_running_loop() is self._loop:
+                client = self._client
+            else:
+                client = self._make_client()
+                owns_client = True
+        try:
+            results = await asyncio.gather(
+                *(self._fetch_batch(client, semaphore, batch) for batch in batches)
+            )
+        finally:
+            if owns_client:
+                await client.aclose()
+
+        fetched: Dict[str, str] = {}
+        for result in results:
+            fetched.update(result)
+        if self.cache:
+            self.cache.put_many(fetched)
+        answers.update(fetched)
+
+        logger.info(
+            "Fetched %d answers from MedAgentGym in %d batches (%d cached)",
+            len(fetched),
+            len(batches),
+            len(ids) - len(missing),
+        )
+        return answers
+
+    def get_benchmark_answers(self, questions: List[Dict]) -> List[Optional[str]]:
+        """
+        Benchmark answers aligned with questions
+
+        Runs the fetch on the integration's client loop and waits for it, so
+        it can be called from any thread, including one running another
+        event loop.
+
+        Args:
+            questions: List of question dicts
+
+        Returns:
+            List of benchmark answers, None for questions unknown to the
+            service (the caller decides how to fill those in)
+        """
+        loop = self._ensure_loop()
+        answers = asyncio.run_coroutine_threadsafe(
+            self.fetch_answers(q.get("question_id") for q in questions),
+            loop,
+        ).result()
+
+        return [
+            answers.get(str(qid)) if qid is not None else None
+            for qid in (q.get("question_id") for q in questions)
+        ]
+
+    def close(self) -> None:
+        """Close the pooled client, stop its loop and close the on-disk cache."""
+        with self._loop_lock:
+            loop, thread, client = self._loop, self._thread, self._client
+            self._loop = self._thread = self._client = None
+
+        if loop is not None:
+            try:
+                asyncio.run_coroutine_threadsafe(client.aclose(), loop).result(
+                    timeout=self.timeout
+                )
+            except Exception as exc:
+                logger.warning("Failed to close MedAgentGym client: %s", exc)
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=self.timeout)
+            loop.close()
+
+        if self.cache:
+            self.cache.close()
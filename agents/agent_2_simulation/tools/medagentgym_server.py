@@ -0,0 +1,89 @@
+"""
+Tool: Local stand-in for the MedAgentGym benchmark service
+
+Serves benchmark answers from a local benchmark file so the MedAgentGym
+client can be tested and benchmarked offline:
+
+    python -m agents.agent_2_simulation.tools.medagentgym_server \\
+        data/benchmarks/benchmarks.json --port 8765 --latency 0.02
+"""
+
+from typing import Dict, List
+import asyncio
+import random
+import logging
+
+from fastapi import FastAPI, HTTPException
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+
+class AnswersRequest(BaseModel):
+    """Batch of question ids to resolve"""
+    question_ids: List[str]
+
+
+def create_app(
+    answers: Dict[str, str],
+    latency: float = 0.0,
+    failure_rate: float = 0.0,
+) -> FastAPI:
+    """
+    Build the stand-in service
+
+    Args:
+        answers: question_id -> benchmark answer served by the stub
+        latency: Seconds of simulated latency per request
+        failure_rate: Fraction of requests answered with HTTP 503
+
+    Returns:
+        FastAPI application
+    """
+    app = FastAPI(title="MedAgentGym stand-in")
+    app.state.requests = 0
+
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy", "benchmarks": len(answers)}
+
+    @app.post("/benchmarks/answers")
+    async def benchmark_answers(request: AnswersRequest):
+        app.state.requests += 1
+        if latency:
+            await asyncio.sleep(latency)
+        if failure_rate and random.random() < failure_rate:
+            raise HTTPException(status_code=503, detail="Simulated outage")
+        return {
+            "answers": {
+                qid: answers[qid] for qid in request.question_ids if qid in answers
+            }
+        }
+
+    return app
+
+
+if __name__ == "__main__":
+    import argparse
+
+    import uvicorn
+
+    from .benchmark_stream import iter_benchmark_records
+
+    parser = argparse.ArgumentParser(description="Local MedAgentGym stand-in server")
+    parser.add_argument("benchmark_file", help="JSON, JSON Lines or CSV benchmark file")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    uvicorn.run(
+        create_app(
+            dict(iter_benchmark_records(args.benchmark_file)),
+            latency=args.latency,
+            failure_rate=args.failure_rate,
+        ),
+        host=args.host,
+        port=args.port,
+    )
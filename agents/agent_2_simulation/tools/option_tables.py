@@ -0,0 +1,148 @@
+"""
+Tool: Precomputed letter <-> option lookup tables for question sets
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+import re
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Prefix of an option string, e.g. "B) " or "B. "
+OPTION_PREFIX = re.compile(r"^\s*\(?([A-Ja-j])\s*[\).:\]]\s*")
+
+OPTION_LETTERS = "ABCDEFGHIJ"
+
+
+class OptionTable:
+    """
+    Lookups for one question's options, built once per option list.
+
+    - letters: option letters in order ("ABCD")
+    - option(letter): full option string ("B) ..."), by prefix or position
+    - letter(text): letter for an exact option string or option text
+    - texts: ((letter, lowercase text), ...) for mention matching
+    """
+
+    __slots__ = ("options", "letters", "texts", "_by_letter", "_by_text")
+
+    def __init__(self, options: Iterable[str]):
+        """
+        Initialize Option Table
+
+        Args:
+            options: Question options (e.g. ["A) ...", "B) ..."]); options
+                without a letter prefix take their position's letter
+        """
+        self.options: Tuple[str, ...] = tuple(options)
+        self._by_letter: Dict[str, str] = {}
+        self._by_text: Dict[str, str] = {}
+
+        letters = []
+        texts = []
+        for i, option in enumerate(self.options[:len(OPTION_LETTERS)]):
+            match = OPTION_PREFIX.match(option)
+            if match:
+                letter = match.group(1).upper()
+                text = option[match.end():]
+            else:
+                letter = OPTION_LETTERS[i]
+                text = option
+            letters.append(letter)
+            self._by_letter.setdefault(letter, option)
+
+            text = text.strip().lower()
+            self._by_text.setdefault(option.strip().lower(), letter)
+            if text:
+                self._by_text.setdefault(text, letter)
+            if len(text) >= 3:
+                texts.append((letter, text))
+
+        self.letters = "".join(letters)
+        self.texts: Tuple[Tuple[str, str], ...] = tuple(texts)
+
+    def __len__(self) -> int:
+        return len(self.options)
+
+    def __iter__(self):
+        return iter(self.options)
+
+    def option(self, letter: str) -> Optional[str]:
+        """Full option string for a letter."""
+        return self._by_letter.get(letter.strip().upper()) if letter else None
+
+    def letter(self, text: str) -> Optional[str]:
+        """Letter of the option whose string or text equals text."""
+        return self._by_text.get(text.strip().lower()) if text else None
+
+    def __reduce__(self):
+        return (OptionTable, (self.options,))
+
+
+def build_option_tables(questions: List[Dict]) -> List[Optional[OptionTable]]:
+    """
+    Option table per question (None for questions without options)
+
+    Questions sharing the same option list share one table.
+
+    Args:
+        questions: Question dicts
+
+    Returns:
+        List of OptionTable or None, aligned with questions
+    """
+    by_id: Dict[int, OptionTable] = {}
+    by_options: Dict[Tuple[str, ...], OptionTable] = {}
+    tables: List[Optional[OptionTable]] = []
+
+    for question in questions:
+        options = question.get("options")
+        if not options:
+            tables.append(None)
+            continue
+        table = by_id.get(id(options))
+        if table is None:
+            key = tuple(options)
+            table = by_options.get(key)
+            if table is None:
+                table = by_options[key] = OptionTable(key)
+            by_id[id(options)] = table
+        tables.append(table)
+
+    return tables
+
+
+class QuestionSet(list):
+    """
+    List of question dicts that carries its option tables.
+
+    Behaves exactly like the original list; the tables are built on first
+    use and reused by every later stage (benchmark loading, comparison,
+    error analysis). Treat the questions as read-only once wrapped.
+    """
+
+    def __init__(self, questions: Iterable[Dict] = ()):
+        super().__init__(questions)
+        self._option_tables: Optional[List[Optional[OptionTable]]] = None
+
+    @property
+    def option_tables(self) -> List[Optional[OptionTable]]:
+        """Option table per question (None for free-text questions)."""
+        if self._option_tables is None or len(self._option_tables) != len(self):
+            self._option_tables = build_option_tables(self)
+        return self._option_tables
+
+
+def option_tables_for(questions: List[Dict]) -> List[Optional[OptionTable]]:
+    """
+    Option tables for a question list, reusing a QuestionSet's tables
+
+    Args:
+        questions: Question dicts or a QuestionSet
+
+    Returns:
+        List of OptionTable or None, aligned with questions
+    """
+    if isinstance(questions, QuestionSet):
+        return questions.option_tables
+    return build_option_tables(questions)
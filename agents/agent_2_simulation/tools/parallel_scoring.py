@@ -0,0 +1,160 @@
+"""
+Tool: Process-pool parallel scoring for large answer batches
+"""
+
+from typing import List, Optional, Tuple
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from types import SimpleNamespace
+import threading
+import logging
+
+from .option_tables import OptionTable
+
+logger = logging.getLogger(__name__)
+
+# Comparator owned by each worker process (set by _init_worker)
+_worker_comparator = None
+
+
+def _init_worker(similarity_backend: str, cache_size: int) -> None:
+    """Create the in-process comparator used by a pool worker."""
+    global _worker_comparator
+    from .answer_comparator import AnswerComparator
+
+    _worker_comparator = AnswerComparator(
+        SimpleNamespace(
+            similarity_backend=similarity_backend,
+            comparison_cache_size=cache_size,
+            parallel_workers=0,
+        )
+    )
+
+
+def _score_chunk(
+    chunk: Tuple[
+        List[str], List[str], List[Optional[List[str]]], bool, float, Optional[List[List[str]]]
+    ]
+) -> Tuple[bytes, Optional[bytes]]:
+    """Score one chunk of rows inside a worker process."""
+    model_answers, benchmark_answers, options, with_scores, threshold, accepted = chunk
+    _worker_comparator.similarity_threshold = threshold
+    correct, similarity = _worker_comparator._score_rows(
+        model_answers, benchmark_answers, options, with_scores, accepted
+    )
+    return correct.tobytes(), similarity.tobytes() if similarity is not None else None
+
+
+class ParallelScorer:
+    """
+    Split large comparison batches across a process pool.
+
+    Rows are scored in contiguous chunks and reassembled in submission
+    order, so indices in the result match the input exactly.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        min_batch_size: int = 5_000,
+        chunk_size: int = 2_000,
+        similarity_backend: str = "difflib",
+        cache_size: int = 100_000
+    ):
+        """
+        Initialize Parallel Scorer
+
+        Args:
+            max_workers: Number of worker processes
+            min_batch_size: Batches smaller than this stay in-process
+            chunk_size: Rows per task sent to a worker
+            similarity_backend: Similarity backend name used by workers
+            cache_size: Per-worker comparator cache size
+        """
+        self.max_workers = max_workers
+        self.min_batch_size = min_batch_size
+        self.chunk_size = max(1, chunk_size)
+        self._init_args = (similarity_backend, cache_size)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+        logger.info(
+            "ParallelScorer configured: %d workers, min batch %d, chunk %d",
+            max_workers,
+            min_batch_size,
+            self.chunk_size,
+        )
+
+    def should_parallelize(self, batch_size: int) -> bool:
+        """Whether a batch of this size is worth sending to the pool."""
+        return self.max_workers > 0 and batch_size >= self.min_batch_size
+
+    def score(
+        self,
+        model_answers: List[str],
+        benchmark_answers: List[str],
+        options: List[Optional[OptionTable]],
+        with_scores: bool = True,
+        similarity_threshold: float = 0.8,
+        accepted_answers: Optional[List[List[str]]] = None
+    ) -> Tuple[array, Optional[array]]:
+        """
+        Score rows across the process pool
+
+        Args:
+            model_answers: Answers generated by model
+            benchmark_answers: Correct benchmark answers
+            options: Option table per row (or None)
+            with_scores: Compute exact similarity scores
+            similarity_threshold: Minimum similarity for a correct answer
+            accepted_answers: Optional acceptable alternates per row
+
+        Returns:
+            Tuple of (correctness flags, similarity scores or None)
+        """
+        step = self.chunk_size
+        chunks = [
+            (
+                model_answers[start:start + step],
+                benchmark_answers[start:start + step],
+                options[start:start + step],
+                with_scores,
+                similarity_threshold,
+                accepted_answers[start:start + step] if accepted_answers is not None else None,
+            )
+            for start in range(0, len(model_answers), step)
+        ]
+
+        logger.info(
+            "Scoring %d rows in %d chunks across %d processes",
+            len(model_answers),
+            len(chunks),
+            self.max_workers,
+        )
+
+        correct = array("b")
+        similarity = array("d") if with_scores else None
+        for correct_bytes, similarity_bytes in self._get_executor().map(_score_chunk, chunks):
+            correct.frombytes(correct_bytes)
+            if similarity is not None:
+                similarity.frombytes(similarity_bytes)
+
+        return correct, similarity
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Create the process pool on first use."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    initializer=_init_worker,
+                    initargs=self._init_args,
+                )
+            return self._executor
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
@@ -0,0 +1,273 @@
+"""
+Tool: Content-hash index for duplicate and near-duplicate questions
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+import hashlib
+import operator
+import re
+import zlib
+import logging
+
+from .option_tables import OPTION_PREFIX
+
+logger = logging.getLogger(__name__)
+
+DEDUP_MODES = ("none", "exact", "near")
+
+UNIQUE = "unique"
+DUPLICATE = "duplicate"
+NEAR_DUPLICATE = "near_duplicate"
+
+# MinHash signature: NUM_BANDS bands of ROWS_PER_BAND values
+NUM_BANDS = 8
+ROWS_PER_BAND = 4
+WORD_SHINGLE_SIZE = 3
+
+# Most recent bucket entries compared per band, bounding work per check
+MAX_BUCKET_CANDIDATES = 16
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_NON_WORD = re.compile(r"[^a-z0-9.]+")
+
+# Fixed hash so signatures are comparable across processes
+_HASH_A = 0x1F3D5B79A2C4E6F1 % _MERSENNE_PRIME
+_HASH_B = 0x6A09E667F3BCC909 % _MERSENNE_PRIME
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase text with punctuation and whitespace runs collapsed."""
+    return _NON_WORD.sub(" ", str(text).lower()).strip(" .")
+
+
+def _normalized_options(question: Dict) -> List[str]:
+    options = []
+    for option in question.get("options") or ():
+        option = str(option)
+        match = OPTION_PREFIX.match(option)
+        options.append(normalize_text(option[match.end():] if match else option))
+    # Reordered options are the same question
+    return sorted(options)
+
+
+def question_fingerprint(question: Dict) -> bytes:
+    """
+    Content hash of a question (normalized text plus options)
+
+    Args:
+        question: Question dict ("question_text" or "question", "options")
+
+    Returns:
+        16-byte digest; ids, metadata and option order are ignored
+    """
+    text = question.get("question_text", question.get("question", ""))
+    content = "\x1e".join([normalize_text(text), *_normalized_options(question)])
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+
+
+def minhash_signature(question: Dict) -> Tuple[int, ...]:
+    """
+    MinHash signature over word 3-shingles of the question and options
+
+    Uses one-permutation hashing: each shingle is hashed once and the hash
+    space is split into NUM_BANDS * ROWS_PER_BAND bins keeping their
+    minimum, so the cost is linear in the number of shingles. Empty bins
+    borrow the next non-empty bin's value (rotation densification).
+
+    Args:
+        question: Question dict
+
+    Returns:
+        NUM_BANDS * ROWS_PER_BAND minimum hash values
+    """
+    text = question.get("question_text", question.get("question", ""))
+    words = " ".join([normalize_text(text), *_normalized_options(question)]).split()
+    if len(words) <= WORD_SHINGLE_SIZE:
+        grams = {zlib.crc32(" ".join(words).encode("utf-8"))}
+    else:
+        grams = {
+            zlib.crc32(" ".join(words[i:i + WORD_SHINGLE_SIZE]).encode("utf-8"))
+            for i in range(len(words) - WORD_SHINGLE_SIZE + 1)
+        }
+
+    size = NUM_BANDS * ROWS_PER_BAND
+    bins: List[Optional[int]] = [None] * size
+    for gram in grams:
+        value, position = divmod((_HASH_A * gram + _HASH_B) % _MERSENNE_PRIME, size)
+        current = bins[position]
+        if current is None or value < current:
+            bins[position] = value
+
+    for position in range(size):
+        if bins[position] is None:
+            for distance in range(1, size):
+                borrowed = bins[(position + distance) % size]
+                if borrowed is not None and borrowed < _MERSENNE_PRIME:
+                    # Offset by distance so only equally borrowed bins match
+                    bins[position] = borrowed + distance * _MERSENNE_PRIME
+                    break
+    return tuple(bins)
+
+
+class DedupReport:
+    """Counts of questions checked and dropped by a QuestionDedupIndex."""
+
+    __slots__ = ("checked", "duplicates", "near_duplicates")
+
+    def __init__(self):
+        self.checked = 0
+        self.duplicates = 0
+        self.near_duplicates = 0
+
+    @property
+    def unique(self) -> int:
+        return self.checked - self.duplicates - self.near_duplicates
+
+    def to_dict(self) -> Dict[str, int]:
+        return {
+            "checked": self.checked,
+            "unique": self.unique,
+            "duplicates": self.duplicates,
+            "near_duplicates": self.near_duplicates,
+        }
+
+
+class QuestionDedupIndex:
+    """
+    Per-question-set index of content hashes.
+
+    - Exact duplicates: a set lookup on question_fingerprint().
+    - Near duplicates ("near" mode): MinHash signatures over word shingles,
+      bucketed with LSH (NUM_BANDS bands of ROWS_PER_BAND values). Only
+      questions sharing a band bucket are compared (at most
+      MAX_BUCKET_CANDIDATES per band), and a candidate counts as a near
+      duplicate when the estimated Jaccard similarity reaches near_threshold.
+
+    Each check costs a bounded number of hash lookups and comparisons,
+    independent of how many questions are already indexed. With max_entries
+    set, the index is cleared whenever it fills up, so memory stays bounded
+    and duplicates are only caught within each window of that many unique
+    questions.
+    """
+
+    def __init__(
+        self,
+        mode: str = "exact",
+        near_threshold: float = 0.8,
+        max_entries: Optional[int] = None
+    ):
+        """
+        Initialize Question Dedup Index
+
+        Args:
+            mode: "none", "exact" or "near"
+            near_threshold: Estimated Jaccard similarity for a near duplicate
+            max_entries: Unique questions kept before the index is cleared
+                (None for unbounded)
+        """
+        if mode not in DEDUP_MODES:
+            raise ValueError(f"Unknown dedup mode: {mode}")
+        self.mode = mode
+        self.near_threshold = near_threshold
+        self.max_entries = max_entries
+        self.report = DedupReport()
+
+        self._fingerprints: Dict[bytes, str] = {}
+        self._signatures: List[Tuple[str, Tuple[int, ...]]] = []
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+
+    def _bands(self, signature: Sequence[int]) -> Iterable[Tuple[int, Tuple[int, ...]]]:
+        for band in range(NUM_BANDS):
+            start = band * ROWS_PER_BAND
+            yield band, tuple(signature[start:start + ROWS_PER_BAND])
+
+    def _near_match(self, signature: Tuple[int, ...]) -> Optional[str]:
+        needed = self.near_threshold * len(signature)
+        seen = set()
+        for key in self._bands(signature):
+            for position in self._buckets.get(key, ())[-MAX_BUCKET_CANDIDATES:]:
+                if position in seen:
+                    continue
+                seen.add(position)
+                question_id, other = self._signatures[position]
+                if sum(map(operator.eq, signature, other)) >= needed:
+                    return question_id
+        return None
+
+    def add(self, question: Dict) -> Tuple[str, Optional[str]]:
+        """
+        Check a question and index it if it is new
+
+        Args:
+            question: Question dict
+
+        Returns:
+            (status, question_id of the earlier copy) where status is
+            UNIQUE, DUPLICATE or NEAR_DUPLICATE
+        """
+        self.report.checked += 1
+        if self.mode == "none":
+            return UNIQUE, None
+
+        question_id = str(question.get("question_id", self.report.checked))
+        fingerprint = question_fingerprint(question)
+        original = self._fingerprints.get(fingerprint)
+        if original is not None:
+            self.report.duplicates += 1
+            return DUPLICATE, original
+
+        signature = None
+        if self.mode == "near":
+            signature = minhash_signature(question)
+            original = self._near_match(signature)
+            if original is not None:
+                self.report.near_duplicates += 1
+                return NEAR_DUPLICATE, original
+
+        if self.max_entries and len(self._fingerprints) >= self.max_entries:
+            self._fingerprints.clear()
+            self._signatures.clear()
+            self._buckets.clear()
+
+        self._fingerprints[fingerprint] = question_id
+        if signature is not None:
+            position = len(self._signatures)
+            self._signatures.append((question_id, signature))
+            for key in self._bands(signature):
+                self._buckets.setdefault(key, []).append(position)
+        return UNIQUE, None
+
+
+def dedupe_questions(
+    questions: Sequence[Dict],
+    mode: str = "exact",
+    near_threshold: float = 0.8
+) -> Tuple[List[int], DedupReport]:
+    """
+    Collapse duplicate questions, keeping the first copy
+
+    Args:
+        questions: Question dicts
+        mode: "none", "exact" or "near"
+        near_threshold: Estimated Jaccard similarity for a near duplicate
+
+    Returns:
+        (indices of the questions kept, report with counts)
+    """
+    index = QuestionDedupIndex(mode, near_threshold)
+    kept = []
+    for position, question in enumerate(questions):
+        status, original = index.add(question)
+        if status == UNIQUE:
+            kept.append(position)
+        else:
+            logger.debug(
+                "Question %s is a %s of %s",
+                question.get("question_id", position),
+                status,
+                original,
+            )
+    return kept, index.report
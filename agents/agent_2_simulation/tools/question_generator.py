@@ -2,12 +2,32 @@
 Tool: Generate clinical simulation questions
 """
 
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional, Set, Tuple
 import random
 import logging
 
+from .question_dedup import UNIQUE, QuestionDedupIndex
+from .template_catalog import CatalogSnapshot, TemplateCatalog, flatten_templates
+
 logger = logging.getLogger(__name__)
 
+# Redraws before accepting a variant already used in the same batch
+MAX_VARIANT_ATTEMPTS = 8
+
+# Extra attempts at a question slot whose question was a duplicate
+MAX_DUPLICATE_RETRIES = 3
+
+# Used variants remembered per batch (bounds memory for streamed sets)
+MAX_TRACKED_VARIANTS = 100_000
+
+# (domain, difficulty) pairs drawn per choices() call
+ASSIGNMENT_CHUNK_SIZE = 1024
+
+# Distinct (domain, difficulty) fallback warnings remembered before resetting
+MAX_FALLBACK_WARNINGS = 1024
+
+DEFAULT_DOMAINS = ["cardiology", "neurology", "oncology", "pediatrics", "emergency_medicine"]
+
 
 class QuestionGenerator:
     """
@@ -23,6 +43,19 @@ class QuestionGenerator:
         """
         self.config = config
         self.question_templates = self._load_question_templates()
+
+        # Templates from the on-disk catalog, hot-reloaded on change; the
+        # built-in templates are used until a catalog file exists
+        self.template_catalog = TemplateCatalog(
+            file_path=getattr(
+                config, "question_template_catalog", None
+            ) if config else None,
+            fallback_templates=flatten_templates(self.question_templates),
+            poll_interval=getattr(
+                config, "question_template_poll_interval", 2.0
+            ) if config else 2.0,
+        )
+        self._fallback_warned: Set[Tuple] = set()
         logger.info("QuestionGenerator initialized")
     
     def generate(
@@ -30,7 +63,10 @@ class QuestionGenerator:
         num_questions: int = 50,
         difficulty: str = "varied",
         domains: Optional[List[str]] = None,
-        model_type: str = "general"
+        model_type: str = "general",
+        seed: Optional[int] = None,
+        stratified: bool = False,
+        dedup: Optional[QuestionDedupIndex] = None
     ) -> List[Dict]:
         """
         Generate clinical questions
@@ -40,17 +76,70 @@ class QuestionGenerator:
             difficulty: "easy", "medium", "hard", or "varied"
             domains: List of medical domains to cover
             model_type: Type of model being tested
+            seed: Seed for this request's random generator; the same seed and
+                arguments always produce the same question set
+            stratified: Use exact per-domain/difficulty quotas instead of
+                independent draws
+            dedup: Index rejecting duplicate questions (optional); the
+                result may then hold fewer than num_questions questions
             
         Returns:
             List of question dictionaries
         """
         logger.info(f"Generating {num_questions} questions")
         
-        questions = []
+        questions = list(self.iter_questions(
+            num_questions=num_questions,
+            difficulty=difficulty,
+            domains=domains,
+            model_type=model_type,
+            seed=seed,
+            stratified=stratified,
+            dedup=dedup
+        ))
+        
+        logger.info(f"Generated {len(questions)} questions successfully")
+        return questions
+
+    def iter_questions(
+        self,
+        num_questions: int = 50,
+        difficulty: str = "varied",
+        domains: Optional[List[str]] = None,
+        model_type: str = "general",
+        seed: Optional[int] = None,
+        stratified: bool = False,
+        dedup: Optional[QuestionDedupIndex] = None
+    ) -> Iterator[Dict]:
+        """
+        Lazily generate clinical questions, one at a time
+        
+        Memory use does not grow with num_questions (apart from a bounded
+        set of recently used template variants), so very large sets can be
+        streamed to a file or a downstream stage. Yields exactly what
+        generate() returns for the same arguments.
+        
+        Args:
+            num_questions: Number of questions to generate
+            difficulty: "easy", "medium", "hard", or "varied"
+            domains: List of medical domains to cover
+            model_type: Type of model being tested
+            seed: Seed for this request's random generator
+            stratified: Use exact per-domain/difficulty quotas
+            dedup: Index consulted for every question (optional). A slot
+                whose question is a duplicate is regenerated up to
+                MAX_DUPLICATE_RETRIES times and then dropped; the index's
+                report counts the rejected duplicates.
+            
+        Yields:
+            Question dictionaries
+        """
+        # Per-request generator: reproducible and not shared between requests
+        rng = random.Random(seed)
         
         # Set domains
         if domains is None:
-            domains = ["cardiology", "neurology", "oncology", "pediatrics", "emergency_medicine"]
+            domains = DEFAULT_DOMAINS
         
         # Set difficulty distribution
         if difficulty == "varied":
@@ -60,31 +149,103 @@ class QuestionGenerator:
             difficulties = [difficulty]
             difficulty_weights = [1.0]
         
-        # Generate questions
-        for i in range(num_questions):
-            # Select domain and difficulty
-            domain = random.choice(domains)
-            selected_difficulty = random.choices(difficulties, difficulty_weights)[0]
-            
-            # Generate question
-            question = self._generate_single_question(
-                question_id=f"Q{i+1:03d}",
-                domain=domain,
-                difficulty=selected_difficulty,
-                model_type=model_type
-            )
+        assignments = self._iter_assignments(
+            num_questions, domains, difficulties, difficulty_weights, rng, stratified
+        )
+        
+        # One catalog version for the whole set, even if it is hot-reloaded
+        catalog = self.template_catalog.snapshot()
+        
+        # Variants already used in this batch are redrawn
+        used_variants: Set[Tuple[int, int]] = set()
+        count = 0
+        for domain, selected_difficulty in assignments:
+            if len(used_variants) >= MAX_TRACKED_VARIANTS:
+                used_variants.clear()
+            for _ in range(MAX_DUPLICATE_RETRIES + 1 if dedup is not None else 1):
+                question = self._generate_single_question(
+                    question_id=f"Q{count+1:03d}",
+                    domain=domain,
+                    difficulty=selected_difficulty,
+                    model_type=model_type,
+                    rng=rng,
+                    used_variants=used_variants,
+                    catalog=catalog
+                )
+                if dedup is None or dedup.add(question)[0] == UNIQUE:
+                    count += 1
+                    yield question
+                    break
+
+    @staticmethod
+    def _iter_assignments(
+        num_questions: int,
+        domains: List[str],
+        difficulties: List[str],
+        difficulty_weights: List[float],
+        rng: random.Random,
+        stratified: bool = False
+    ) -> Iterator[Tuple[str, str]]:
+        """
+        Draw (domain, difficulty) pairs for a batch
+        
+        Args:
+            num_questions: Number of pairs to draw
+            domains: Domains, sampled uniformly
+            difficulties: Difficulty levels
+            difficulty_weights: Relative weight of each difficulty
+            rng: Random generator for this request
+            stratified: Allocate exact quotas per (domain, difficulty) cell
+                (largest remainder) and draw them in random order, instead
+                of independent draws
             
-            questions.append(question)
+        Yields:
+            (domain, difficulty) tuples
+        """
+        if not stratified:
+            # One choices() call per chunk keeps memory flat for huge batches
+            for start in range(0, num_questions, ASSIGNMENT_CHUNK_SIZE):
+                k = min(ASSIGNMENT_CHUNK_SIZE, num_questions - start)
+                yield from zip(
+                    rng.choices(domains, k=k),
+                    rng.choices(difficulties, difficulty_weights, k=k)
+                )
+            return
         
-        logger.info(f"Generated {len(questions)} questions successfully")
-        return questions
+        total_weight = sum(difficulty_weights) * len(domains)
+        cells = [
+            (domain, level, num_questions * weight / total_weight)
+            for domain in domains
+            for level, weight in zip(difficulties, difficulty_weights)
+        ]
+        quotas = [int(share) for _, _, share in cells]
+        
+        # Hand out the remaining questions to the largest fractional parts
+        by_remainder = sorted(
+            range(len(cells)),
+            key=lambda i: cells[i][2] - quotas[i],
+            reverse=True
+        )
+        for i in by_remainder[:num_questions - sum(quotas)]:
+            quotas[i] += 1
+        
+        # Draw without replacement: each cell with probability proportional
+        # to its remaining quota, which is a uniform shuffle of all quotas
+        positions = range(len(cells))
+        for _ in range(num_questions):
+            i = rng.choices(positions, quotas)[0]
+            quotas[i] -= 1
+            yield cells[i][0], cells[i][1]
     
     def _generate_single_question(
         self,
         question_id: str,
         domain: str,
         difficulty: str,
-        model_type: str
+        model_type: str,
+        rng: Optional[random.Random] = None,
+        used_variants: Optional[Set[Tuple[int, int]]] = None,
+        catalog: Optional[CatalogSnapshot] = None
     ) -> Dict:
         """
         Generate a single clinical question
@@ -94,12 +255,15 @@ class QuestionGenerator:
             domain: Medical domain
             difficulty: Question difficulty
             model_type: Model type
+            rng: Random generator for template selection
+            used_variants: Template variants already used in this batch
+            catalog: Catalog snapshot to draw from (defaults to the current one)
             
         Returns:
             Question dictionary
         """
         # Get template for domain and difficulty
-        template = self._get_template(domain, difficulty)
+        template = self._get_template(domain, difficulty, rng, used_variants, catalog)
         
         # Generate question text
         question_text = template.get("question", "")
@@ -121,10 +285,12 @@ class QuestionGenerator:
             "question_type": template.get("type", "multiple_choice"),
             "options": options,
             "correct_answer": correct_answer,
+            "accepted_answers": template.get("accepted_answers", []),
             "explanation": explanation,
             "metadata": {
                 "model_type": model_type,
-                "template_id": template.get("template_id")
+                "template_id": template.get("template_id"),
+                "variant": template.get("variant")
             }
         }
         
@@ -132,20 +298,22 @@ class QuestionGenerator:
     
     def _load_question_templates(self) -> Dict:
         """
-        Load question templates for different domains and difficulties
+        Built-in question templates for different domains and difficulties
+
+        Used when no template catalog file is configured or present.
+        Placeholders such as {age:int(40,85)} are filled in per question
+        (see template_compiler).
         
         Returns:
             Dictionary of question templates
         """
-        # In production, load from database or file
-        # For now, return sample templates
         templates = {
             "cardiology": {
                 "easy": [
                     {
                         "template_id": "cardio_001",
                         "type": "multiple_choice",
-                        "question": "A 55-year-old male presents with chest pain. ECG shows ST elevation in leads V1-V4. What is the most likely diagnosis?",
+                        "question": "A {age:int(40,85)}-year-old {sex} presents with {hours:int(1,6)} hours of chest pain. HR {heart_rate:int(60,120)}, BP {sbp:systolic_bp(100,160)}/{dbp:diastolic_bp(60,95)}. ECG shows ST elevation in leads V1-V4. What is the most likely diagnosis?",
                         "options": [
                             "A) Unstable angina",
                             "B) Anterior STEMI",
@@ -160,22 +328,22 @@ class QuestionGenerator:
                     {
                         "template_id": "cardio_002",
                         "type": "multiple_choice",
-                        "question": "A patient with heart failure shows signs of volume overload. Which medication adjustment is most appropriate?",
+                        "question": "A {age:int(50,90)}-year-old {sex} with heart failure on {loop_diuretic} and {beta_blocker} has gained {weight_gain:int(2,6)} kg with bilateral leg edema. Which medication adjustment is most appropriate?",
                         "options": [
-                            "A) Increase beta-blocker dose",
-                            "B) Increase diuretic dose",
+                            "A) Increase {beta_blocker} dose",
+                            "B) Increase {loop_diuretic} dose",
                             "C) Add calcium channel blocker",
                             "D) Discontinue ACE inhibitor"
                         ],
-                        "correct_answer": "B) Increase diuretic dose",
-                        "explanation": "Volume overload in heart failure is best managed by increasing diuretics to reduce fluid retention."
+                        "correct_answer": "B) Increase {loop_diuretic} dose",
+                        "explanation": "A {weight_gain} kg gain with edema indicates volume overload, which is best managed by increasing the {loop_diuretic} dose to reduce fluid retention."
                     }
                 ],
                 "hard": [
                     {
                         "template_id": "cardio_003",
                         "type": "multiple_choice",
-                        "question": "A patient develops cardiogenic shock post-MI despite PCI. BP 80/50, CI 1.8. Next step?",
+                        "question": "A {age:int(45,85)}-year-old {sex} develops cardiogenic shock post-MI despite PCI. BP {sbp:systolic_bp(70,88)}/{dbp:diastolic_bp(40,55)}, CI {cardiac_index:float(1.2,2.1,1)}. Next step?",
                         "options": [
                             "A) Intra-aortic balloon pump",
                             "B) Increase fluid resuscitation",
@@ -183,7 +351,12 @@ class QuestionGenerator:
                             "D) Observe and monitor"
                         ],
                         "correct_answer": "A) Intra-aortic balloon pump",
-                        "explanation": "Cardiogenic shock with low cardiac index requires mechanical circulatory support like IABP."
+                        "accepted_answers": [
+                            "IABP",
+                            "Intra-aortic balloon pump",
+                            "Intra-aortic balloon counterpulsation"
+                        ],
+                        "explanation": "Cardiogenic shock with a low cardiac index ({cardiac_index} L/min/m2) requires mechanical circulatory support like IABP."
                     }
                 ]
             },
@@ -192,24 +365,52 @@ class QuestionGenerator:
         
         return templates
     
-    def _get_template(self, domain: str, difficulty: str) -> Dict:
+    def _get_template(
+        self,
+        domain: str,
+        difficulty: str,
+        rng: Optional[random.Random] = None,
+        used_variants: Optional[Set[Tuple[int, int]]] = None,
+        catalog: Optional[CatalogSnapshot] = None
+    ) -> Dict:
         """
         Get a question template for specified domain and difficulty
         
         Args:
             domain: Medical domain
             difficulty: Question difficulty
+            rng: Random generator for choosing among templates and variants
+            used_variants: (template, variant) pairs to avoid repeating
+            catalog: Catalog snapshot to draw from (defaults to the current one)
             
         Returns:
-            Question template dictionary
+            Question template dictionary (rendered for parameterized templates)
         """
-        domain_templates = self.question_templates.get(domain, {})
-        difficulty_templates = domain_templates.get(difficulty, [])
-        
-        if difficulty_templates:
-            return random.choice(difficulty_templates)
+        rng = rng or random
+        catalog = catalog if catalog is not None else self.template_catalog.snapshot()
+        compiled = catalog.select_compiled(domain, difficulty, rng)
+        if compiled is not None:
+            if not compiled.is_parameterized:
+                return compiled.template
+            for _ in range(MAX_VARIANT_ATTEMPTS):
+                variant = rng.randrange(compiled.variant_count)
+                if used_variants is None or (id(compiled), variant) not in used_variants:
+                    break
+            if used_variants is not None:
+                used_variants.add((id(compiled), variant))
+            return compiled.render(variant)
         
-        # Fallback to a generic template
+        # Fallback to a generic template (warned once per catalog version)
+        key = (catalog.version, domain, difficulty)
+        if key not in self._fallback_warned:
+            if len(self._fallback_warned) >= MAX_FALLBACK_WARNINGS:
+                self._fallback_warned.clear()
+            self._fallback_warned.add(key)
+            logger.warning(
+                "No question templates for %s/%s; using placeholder template generic_001",
+                domain,
+                difficulty,
+            )
         return {
             "template_id": "generic_001",
             "type": "multiple_choice",
@@ -217,4 +418,8 @@ class QuestionGenerator:
             "options": ["A) Option 1", "B) Option 2", "C) Option 3", "D) Option 4"],
             "correct_answer": "A) Option 1",
             "explanation": "Sample explanation"
-        }
\ No newline at end of file
+        }
+
+    def close(self) -> None:
+        """Stop the template catalog polling thread."""
+        self.template_catalog.close()
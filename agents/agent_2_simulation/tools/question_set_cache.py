@@ -0,0 +1,168 @@
+"""
+Tool: Content-addressed cache of question sets
+"""
+
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+import hashlib
+import json
+import os
+import re
+import logging
+
+from agents.shared.lru_cache import LRUCache
+
+from .option_tables import QuestionSet
+
+logger = logging.getLogger(__name__)
+
+_SET_ID = re.compile(r"^[0-9a-f]{32}$")
+
+
+def question_set_id(questions: List[Dict]) -> str:
+    """
+    Content address of a question set
+
+    Args:
+        questions: Question dicts
+
+    Returns:
+        32-character hex digest of the canonical JSON encoding
+    """
+    payload = json.dumps(questions, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class QuestionSetCache:
+    """
+    Question sets stored under their content-addressed question_set_id.
+
+    Sets are kept as QuestionSet instances in a bounded LRU (by number of
+    sets and total number of questions), so option tables built for one
+    request are reused by later requests on the same set. With a directory
+    configured, every set is also written to <directory>/<id>.json and
+    reloaded from there after eviction or a restart.
+
+    Seeded generations are additionally indexed by their generation
+    parameters, so asking for the same seeded set again skips generation.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 128,
+        max_questions: Optional[int] = 200_000,
+        directory: Optional[str] = None
+    ):
+        """
+        Initialize Question Set Cache
+
+        Args:
+            max_size: Maximum number of sets kept in memory
+            max_questions: Maximum total questions kept in memory (optional)
+            directory: Directory for persisted sets (optional)
+        """
+        self.directory = directory
+        self._sets = LRUCache(max_size=max_size, max_weight=max_questions, weigher=len)
+        self._generated = LRUCache(max_size=max(max_size * 4, 1))
+
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def _path(self, set_id: str) -> str:
+        return os.path.join(self.directory, f"{set_id}.json")
+
+    def put(self, questions: List[Dict]) -> Tuple[Optional[str], QuestionSet]:
+        """
+        Store a question set
+
+        Args:
+            questions: Question dicts
+
+        Returns:
+            (question_set_id, QuestionSet); the id is None when the set could
+            not be stored (larger than max_questions with no directory
+            configured, or the write failed), since get() would not find it
+        """
+        set_id = question_set_id(questions)
+        cached = self._sets.get(set_id)
+        if cached is not None:
+            return set_id, cached
+
+        question_set = questions if isinstance(questions, QuestionSet) else QuestionSet(questions)
+        self._sets.put(set_id, question_set)
+        stored = set_id in self._sets
+
+        if self.directory:
+            path = self._path(set_id)
+            if os.path.exists(path):
+                stored = True
+            else:
+                tmp_path = f"{path}.tmp.{os.getpid()}"
+                try:
+                    with open(tmp_path, "w", encoding="utf-8") as f:
+                        json.dump(question_set, f, ensure_ascii=False)
+                    os.replace(tmp_path, path)
+                    stored = True
+                except OSError as exc:
+                    logger.error("Failed to persist question set %s: %s", set_id, exc)
+
+        if not stored:
+            logger.warning(
+                "Question set of %d questions exceeds the cache budget; not cached",
+                len(question_set),
+            )
+            return None, question_set
+        return set_id, question_set
+
+    def get(self, set_id: str, load: bool = True) -> Optional[QuestionSet]:
+        """
+        Look up a question set
+
+        Args:
+            set_id: question_set_id
+            load: Read the set from the directory when it is not in memory
+                (False keeps the lookup a pure in-memory one)
+
+        Returns:
+            QuestionSet, or None if the id is unknown
+        """
+        if not _SET_ID.match(set_id or ""):
+            return None
+
+        question_set = self._sets.get(set_id)
+        if question_set is not None or not self.directory or not load:
+            return question_set
+
+        try:
+            with open(self._path(set_id), "r", encoding="utf-8") as f:
+                question_set = QuestionSet(json.load(f))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            logger.error("Failed to read question set %s: %s", set_id, exc)
+            return None
+
+        self._sets.put(set_id, question_set)
+        return question_set
+
+    def find_generated(self, key: Hashable) -> Optional[Tuple[str, Any]]:
+        """
+        question_set_id and stored metadata of a seeded generation
+
+        Args:
+            key: Generation parameters (including the seed)
+
+        Returns:
+            (question_set_id, metadata), or None
+        """
+        return self._generated.get(key)
+
+    def remember_generated(self, key: Hashable, set_id: str, metadata: Any = None) -> None:
+        """Record the set produced by a seeded generation."""
+        self._generated.put(key, (set_id, metadata))
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Hit/miss statistics for the set and generation indexes."""
+        return {
+            "question_sets": self._sets.stats(),
+            "generations": self._generated.stats(),
+        }
@@ -0,0 +1,129 @@
+"""
+Tool: Indexed matcher for questions with several acceptable answers
+"""
+
+from typing import List, Dict, Optional, Set, Callable
+import zlib
+import logging
+
+logger = logging.getLogger(__name__)
+
+SHINGLE_SIZE = 3
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> Set[int]:
+    """
+    Hashed character n-grams of text
+
+    Args:
+        text: Normalized text
+        size: n-gram length
+
+    Returns:
+        Set of 32-bit shingle hashes (stable across processes)
+    """
+    if len(text) <= size:
+        return {zlib.crc32(text.encode("utf-8"))}
+    return {
+        zlib.crc32(text[i:i + size].encode("utf-8"))
+        for i in range(len(text) - size + 1)
+    }
+
+
+class ReferenceIndex:
+    """
+    Precomputed index over the acceptable answers of one question.
+
+    Exact matches are a hash-set lookup on normalized text. Near matches
+    come from an inverted index of character n-gram signatures: only
+    alternates sharing enough n-grams with the model answer are verified
+    with the similarity backend, best overlap first.
+    """
+
+    def __init__(
+        self,
+        normalized_answers: List[str],
+        min_overlap: float = 0.3,
+        exhaustive_limit: int = 8
+    ):
+        """
+        Initialize Reference Index
+
+        Args:
+            normalized_answers: Normalized acceptable answers
+            min_overlap: Minimum n-gram Dice coefficient for a candidate
+            exhaustive_limit: With this many alternates or fewer, answers
+                filtered out by the n-gram index are still checked
+        """
+        self.answers = list(dict.fromkeys(a for a in normalized_answers if a))
+        self.exact = frozenset(self.answers)
+        self.min_overlap = min_overlap
+        self.exhaustive_limit = exhaustive_limit
+
+        self._sizes: List[int] = []
+        self._postings: Dict[int, List[int]] = {}
+        for idx, answer in enumerate(self.answers):
+            grams = shingles(answer)
+            self._sizes.append(len(grams))
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(idx)
+
+    def __len__(self) -> int:
+        return len(self.answers)
+
+    def candidates(self, normalized: str) -> List[int]:
+        """
+        Alternates with enough n-gram overlap, best first
+
+        Args:
+            normalized: Normalized model answer
+
+        Returns:
+            Indexes into self.answers
+        """
+        grams = shingles(normalized)
+        overlap: Dict[int, int] = {}
+        for gram in grams:
+            for idx in self._postings.get(gram, ()):
+                overlap[idx] = overlap.get(idx, 0) + 1
+
+        scored = []
+        for idx, shared in overlap.items():
+            dice = 2.0 * shared / (len(grams) + self._sizes[idx])
+            if dice >= self.min_overlap:
+                scored.append((dice, idx))
+        scored.sort(reverse=True)
+        return [idx for _, idx in scored]
+
+    def match(
+        self,
+        normalized: str,
+        at_least: Callable[[str, str, float], bool],
+        threshold: float
+    ) -> Optional[str]:
+        """
+        Find an acceptable answer matching the model answer
+
+        Args:
+            normalized: Normalized model answer
+            at_least: Threshold similarity check (answer1, answer2, threshold)
+            threshold: Minimum similarity score
+
+        Returns:
+            The matching normalized alternate, or None
+        """
+        if normalized in self.exact:
+            return normalized
+
+        checked = set()
+        for idx in self.candidates(normalized):
+            checked.add(idx)
+            if at_least(normalized, self.answers[idx], threshold):
+                return self.answers[idx]
+
+        if len(self.answers) <= self.exhaustive_limit:
+            for idx, answer in enumerate(self.answers):
+                if idx not in checked and at_least(normalized, answer, threshold):
+                    return answer
+
+        return None
@@ -0,0 +1,178 @@
+"""
+Tool: String similarity backends for answer comparison
+"""
+
+from typing import Dict, Optional
+from collections import Counter
+from difflib import SequenceMatcher
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Number of characters processed between early-exit checks in the
+# bit-parallel LCS loop (each check costs one popcount over the bit vector)
+_CHECK_INTERVAL = 32
+
+
+def _lengths_bound(len1: int, len2: int) -> float:
+    """Upper bound on the ratio from string lengths alone."""
+    return 2.0 * min(len1, len2) / (len1 + len2)
+
+
+def _multiset_bound(answer1: str, answer2: str) -> float:
+    """Upper bound on the ratio from shared character counts."""
+    counts1 = Counter(answer1)
+    counts2 = Counter(answer2)
+    matches = sum((counts1 & counts2).values())
+    return 2.0 * matches / (len(answer1) + len(answer2))
+
+
+def _match_masks(text: str) -> Dict[str, int]:
+    """Bit mask of positions for each character in text."""
+    masks: Dict[str, int] = {}
+    for i, ch in enumerate(text):
+        masks[ch] = masks.get(ch, 0) | (1 << i)
+    return masks
+
+
+class BoundedSimilarity:
+    """
+    Indel (LCS-based) similarity with cheap bounds and early exit.
+
+    The ratio is ``2 * LCS / (len1 + len2)``, i.e. one minus the normalized
+    insertion/deletion edit distance. SequenceMatcher counts matches
+    greedily (longest block first), so this ratio is never lower than
+    difflib's and can accept pairs difflib rejects; it is opt-in. The LCS is computed with a bit-parallel
+    recurrence, so each character of the longer string costs a handful of
+    big-integer operations instead of a row of Python-level DP cells.
+    """
+
+    name = "bounded"
+
+    def ratio(self, answer1: str, answer2: str) -> float:
+        """
+        Exact similarity ratio
+
+        Args:
+            answer1: First answer
+            answer2: Second answer
+
+        Returns:
+            Similarity score between 0 and 1
+        """
+        total = len(answer1) + len(answer2)
+        if not total:
+            return 1.0
+        if answer1 == answer2:
+            return 1.0
+        return 2.0 * self._lcs_length(answer1, answer2) / total
+
+    def at_least(self, answer1: str, answer2: str, threshold: float) -> bool:
+        """
+        Decide whether ratio(answer1, answer2) >= threshold
+
+        Length and character-multiset bounds reject most dissimilar pairs
+        without any alignment work; the LCS loop stops as soon as the
+        outcome is decided either way.
+
+        Args:
+            answer1: First answer
+            answer2: Second answer
+            threshold: Minimum similarity score
+
+        Returns:
+            True if the similarity reaches the threshold
+        """
+        total = len(answer1) + len(answer2)
+        if not total or answer1 == answer2:
+            return True
+        if _lengths_bound(len(answer1), len(answer2)) < threshold:
+            return False
+        if _multiset_bound(answer1, answer2) < threshold:
+            return False
+        return self._lcs_length(answer1, answer2, threshold=threshold, total=total) is not None
+
+    def _lcs_length(
+        self,
+        answer1: str,
+        answer2: str,
+        threshold: Optional[float] = None,
+        total: int = 0
+    ) -> Optional[int]:
+        """
+        Bit-parallel LCS length (Hyyrö's recurrence)
+
+        When a threshold is given, returns None as soon as the threshold
+        can no longer be reached, and a partial (but sufficient) length as
+        soon as it is reached.
+        """
+        if len(answer1) < len(answer2):
+            answer1, answer2 = answer2, answer1
+
+        width = len(answer2)
+        if not width:
+            return 0
+
+        masks = _match_masks(answer2)
+        full = (1 << width) - 1
+        v = full
+        length = len(answer1)
+
+        for step, ch in enumerate(answer1, 1):
+            u = v & masks.get(ch, 0)
+            v = ((v + u) | (v - u)) & full
+
+            if threshold is not None and (step % _CHECK_INTERVAL == 0 or step == length):
+                lcs = width - v.bit_count()
+                if 2.0 * lcs / total >= threshold:
+                    return lcs
+                # Each remaining character can add at most one to the LCS
+                best = min(lcs + length - step, width)
+                if 2.0 * best / total < threshold:
+                    return None
+
+        return width - v.bit_count()
+
+
+class DifflibSimilarity:
+    """
+    difflib.SequenceMatcher ratio, with its cheap upper bounds applied first.
+    """
+
+    name = "difflib"
+
+    def ratio(self, answer1: str, answer2: str) -> float:
+        """Exact SequenceMatcher ratio."""
+        return SequenceMatcher(None, answer1, answer2).ratio()
+
+    def at_least(self, answer1: str, answer2: str, threshold: float) -> bool:
+        """Decide whether the SequenceMatcher ratio reaches threshold."""
+        matcher = SequenceMatcher(None, answer1, answer2)
+        if matcher.real_quick_ratio() < threshold:
+            return False
+        if matcher.quick_ratio() < threshold:
+            return False
+        return matcher.ratio() >= threshold
+
+
+SIMILARITY_BACKENDS = {
+    BoundedSimilarity.name: BoundedSimilarity,
+    DifflibSimilarity.name: DifflibSimilarity,
+}
+
+
+def get_similarity_backend(name: str = "difflib"):
+    """
+    Get a similarity backend by name
+
+    Args:
+        name: "bounded" or "difflib"
+
+    Returns:
+        Similarity backend instance
+    """
+    backend_cls = SIMILARITY_BACKENDS.get(name)
+    if backend_cls is None:
+        logger.warning("Unknown similarity backend '%s'; defaulting to difflib", name)
+        backend_cls = DifflibSimilarity
+    return backend_cls()
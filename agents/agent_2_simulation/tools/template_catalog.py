@@ -0,0 +1,315 @@
+"""
+Tool: Indexed, hot-reloadable question template catalog
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+import json
+import os
+import random
+import sqlite3
+import threading
+import logging
+from pathlib import Path
+
+from .template_compiler import CompiledTemplate
+
+logger = logging.getLogger(__name__)
+
+SQLITE_EXTENSIONS = (".sqlite", ".sqlite3", ".db")
+
+TemplateKey = Tuple[str, str]
+
+
+def flatten_templates(nested: Dict[str, Dict[str, List[Dict]]]) -> List[Dict]:
+    """
+    Turn {domain: {difficulty: [template, ...]}} into flat template records
+
+    Args:
+        nested: Templates grouped by domain and difficulty
+
+    Returns:
+        List of templates, each with "domain" and "difficulty" set
+    """
+    return [
+        {**template, "domain": domain, "difficulty": difficulty}
+        for domain, by_difficulty in nested.items()
+        for difficulty, templates in by_difficulty.items()
+        for template in templates
+    ]
+
+
+def write_template_catalog(templates: Iterable[Dict], file_path: str) -> int:
+    """
+    Write templates to a JSON Lines catalog (atomically replaced)
+
+    Args:
+        templates: Template records with "domain" and "difficulty"
+        file_path: Destination .jsonl path
+
+    Returns:
+        Number of templates written
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+    tmp_path = f"{file_path}.tmp"
+    count = 0
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        for template in templates:
+            f.write(json.dumps(template, ensure_ascii=False) + "\n")
+            count += 1
+    os.replace(tmp_path, file_path)
+    return count
+
+
+def _read_jsonl(file_path: str) -> List[Dict]:
+    templates = []
+    with open(file_path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                templates.append(json.loads(line))
+    return templates
+
+
+def _read_sqlite(file_path: str) -> List[Dict]:
+    """Rows of question_templates(template_id, domain, difficulty, template JSON)."""
+    conn = sqlite3.connect(f"file:{file_path}?mode=ro", uri=True)
+    try:
+        rows = conn.execute(
+            "SELECT template_id, domain, difficulty, template FROM question_templates"
+        ).fetchall()
+    finally:
+        conn.close()
+    return [
+        {**json.loads(body), "template_id": template_id, "domain": domain, "difficulty": difficulty}
+        for template_id, domain, difficulty, body in rows
+    ]
+
+
+def _template_problem(template) -> Optional[str]:
+    """Why a catalog entry cannot be used as a template (None if it can)."""
+    if not isinstance(template, dict):
+        return f"expected an object, got {type(template).__name__}"
+    for field in ("domain", "difficulty"):
+        if not isinstance(template.get(field, ""), str):
+            return f"{template.get('template_id')}: {field} must be a string"
+    return None
+
+
+class CatalogSnapshot:
+    """Immutable (domain, difficulty) -> compiled templates index for one catalog version."""
+
+    __slots__ = ("index", "count", "version")
+
+    def __init__(self, templates: Sequence[Dict], version=None):
+        grouped: Dict[TemplateKey, List[CompiledTemplate]] = {}
+        count = 0
+        for template in templates:
+            problem = _template_problem(template)
+            if problem:
+                logger.warning("Skipping template: %s", problem)
+                continue
+            try:
+                compiled = CompiledTemplate(template)
+            except ValueError as exc:
+                logger.warning("Skipping template %s: %s", template.get("template_id"), exc)
+                continue
+            key = (template.get("domain", "general"), template.get("difficulty", "medium"))
+            grouped.setdefault(key, []).append(compiled)
+            count += 1
+        self.index: Dict[TemplateKey, Tuple[CompiledTemplate, ...]] = {
+            key: tuple(group) for key, group in grouped.items()
+        }
+        self.count = count
+        self.version = version
+
+    def select_compiled(
+        self,
+        domain: str,
+        difficulty: str,
+        rng: Optional[random.Random] = None,
+    ) -> Optional[CompiledTemplate]:
+        """Pick a random compiled template for a domain and difficulty."""
+        candidates = self.index.get((domain, difficulty))
+        if not candidates:
+            return None
+        return (rng or random).choice(candidates)
+
+
+class TemplateCatalog:
+    """
+    Question templates indexed by (domain, difficulty).
+
+    Templates come from a JSON Lines file (one template per line with
+    "domain" and "difficulty") or a SQLite database with a
+    question_templates table. The catalog is parsed into an immutable index
+    of compiled templates (see template_compiler); selecting a template is a
+    dict lookup plus a random index, and parameterized templates render a
+    random variant.
+
+    A daemon thread polls the catalog file and, when it changes, builds a new
+    index and swaps it in with a single reference assignment. Requests that
+    already hold the old index keep using it undisturbed. A catalog that
+    fails to parse is logged and the previous index is kept.
+    """
+
+    def __init__(
+        self,
+        file_path: Optional[str] = None,
+        fallback_templates: Sequence[Dict] = (),
+        poll_interval: float = 2.0,
+    ):
+        """
+        Initialize Template Catalog
+
+        Args:
+            file_path: .jsonl or SQLite catalog (optional)
+            fallback_templates: Templates used while no catalog file exists
+            poll_interval: Seconds between change checks (0 disables polling)
+        """
+        self.file_path = file_path
+        self.poll_interval = poll_interval
+        self._fallback = CatalogSnapshot(fallback_templates)
+        self._snapshot = self._fallback
+        self._failed_version: Optional[Tuple] = None
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.reload()
+        if file_path and poll_interval > 0:
+            self._thread = threading.Thread(
+                target=self._poll,
+                name="template-catalog",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def _file_version(self) -> Optional[Tuple]:
+        """(mtime_ns, size) of the catalog and any SQLite WAL file."""
+        if not self.file_path:
+            return None
+        version = []
+        for path in (self.file_path, f"{self.file_path}-wal"):
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                if path == self.file_path:
+                    return None
+                continue
+            version.extend((stat.st_mtime_ns, stat.st_size))
+        return tuple(version)
+
+    def reload(self, force: bool = False) -> bool:
+        """
+        Rebuild the index if the catalog file changed
+
+        Args:
+            force: Rebuild even if the file looks unchanged
+
+        Returns:
+            True if a new index was swapped in
+        """
+        try:
+            version = self._file_version()
+        except OSError as exc:
+            logger.error("Failed to stat template catalog %s: %s", self.file_path, exc)
+            return False
+        if version is None:
+            if self._snapshot is not self._fallback:
+                logger.warning("Template catalog %s disappeared; using built-in templates", self.file_path)
+                self._snapshot = self._fallback
+                return True
+            return False
+        if not force and version in (self._snapshot.version, self._failed_version):
+            return False
+
+        try:
+            if Path(self.file_path).suffix.lower() in SQLITE_EXTENSIONS:
+                templates = _read_sqlite(self.file_path)
+            else:
+                templates = _read_jsonl(self.file_path)
+            snapshot = CatalogSnapshot(templates, version)
+        except (OSError, ValueError, sqlite3.Error) as exc:
+            logger.error("Failed to load template catalog %s: %s", self.file_path, exc)
+            self._failed_version = version
+            return False
+
+        # Atomic swap: readers see either the old or the new index
+        self._snapshot = snapshot
+        logger.info(
+            "Loaded %d question templates (%d domain/difficulty groups) from %s",
+            snapshot.count,
+            len(snapshot.index),
+            self.file_path,
+        )
+        return True
+
+    def templates(self, domain: str, difficulty: str) -> Tuple[CompiledTemplate, ...]:
+        """All compiled templates for a domain and difficulty."""
+        return self._snapshot.index.get((domain, difficulty), ())
+
+    def select_compiled(
+        self,
+        domain: str,
+        difficulty: str,
+        rng: Optional[random.Random] = None,
+    ) -> Optional[CompiledTemplate]:
+        """Pick a random compiled template for a domain and difficulty."""
+        return self._snapshot.select_compiled(domain, difficulty, rng)
+
+    def select(
+        self,
+        domain: str,
+        difficulty: str,
+        rng: Optional[random.Random] = None,
+    ) -> Optional[Dict]:
+        """
+        Pick a random template for a domain and difficulty
+
+        Args:
+            domain: Medical domain
+            difficulty: Question difficulty
+            rng: Random generator (defaults to the module-level one)
+
+        Returns:
+            Template dict (a rendered variant for parameterized templates),
+            or None if the catalog has none for this pair
+        """
+        compiled = self.select_compiled(domain, difficulty, rng)
+        return compiled.sample(rng) if compiled is not None else None
+
+    def snapshot(self) -> CatalogSnapshot:
+        """
+        Index currently in use
+
+        Hot reloads swap in a new index but never modify this one, so a
+        caller that holds it (e.g. for a whole question set) keeps drawing
+        from a single catalog version.
+        """
+        return self._snapshot
+
+    @property
+    def version(self) -> Optional[Tuple]:
+        """File version of the index in use (None for built-in templates)."""
+        return self._snapshot.version
+
+    def keys(self) -> List[TemplateKey]:
+        """(domain, difficulty) pairs that have templates."""
+        return sorted(self._snapshot.index)
+
+    def __len__(self) -> int:
+        return self._snapshot.count
+
+    def _poll(self) -> None:
+        """Background change polling loop (never exits on a bad catalog)."""
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.reload()
+            except Exception as exc:
+                logger.error("Template catalog reload failed: %s", exc)
+
+    def close(self) -> None:
+        """Stop the polling thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.poll_interval + 1)
+            self._thread = None
@@ -0,0 +1,253 @@
+"""
+Tool: Compile parameterized question templates into fast variant renderers
+"""
+
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+import random
+import re
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Template fields that may contain placeholders
+TEXT_FIELDS = ("question", "options", "correct_answer", "accepted_answers", "explanation")
+
+# Largest number of values a single placeholder may take
+MAX_SLOT_VALUES = 1_000_000
+
+# Named placeholder types: name -> (kind, default arguments)
+PLACEHOLDER_TYPES: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    "age": ("int", ("18", "90")),
+    "sex": ("choice", ("male", "female")),
+    "heart_rate": ("int", ("40", "180")),
+    "systolic_bp": ("int", ("70", "200")),
+    "diastolic_bp": ("int", ("40", "120")),
+    "respiratory_rate": ("int", ("8", "40")),
+    "temperature": ("float", ("35.0", "41.0", "1")),
+    "spo2": ("int", ("70", "100")),
+    "sodium": ("int", ("115", "160")),
+    "potassium": ("float", ("2.5", "7.0", "1")),
+    "glucose": ("int", ("40", "600")),
+    "creatinine": ("float", ("0.5", "8.0", "1")),
+    "hemoglobin": ("float", ("5.0", "18.0", "1")),
+    "troponin": ("float", ("0.01", "50.0", "2")),
+    "beta_blocker": ("choice", ("metoprolol", "carvedilol", "bisoprolol")),
+    "loop_diuretic": ("choice", ("furosemide", "bumetanide", "torsemide")),
+    "ace_inhibitor": ("choice", ("lisinopril", "enalapril", "ramipril")),
+    "statin": ("choice", ("atorvastatin", "rosuvastatin", "simvastatin")),
+}
+
+# {name}, {name:type} or {name:type(args)}; {{ and }} are literal braces
+_PLACEHOLDER = re.compile(
+    r"\{\{|\}\}|\{(\w+)(?::(\w+)(?:\(([^)]*)\))?)?\}|[{}]"
+)
+
+
+def _int_values(args: Sequence[str]) -> Tuple[str, ...]:
+    if len(args) not in (2, 3):
+        raise ValueError("int placeholder needs (low, high[, step])")
+    low, high = int(args[0]), int(args[1])
+    step = int(args[2]) if len(args) == 3 else 1
+    if step <= 0 or high < low:
+        raise ValueError(f"Invalid int range ({low}, {high}, {step})")
+    return tuple(str(value) for value in range(low, high + 1, step))
+
+
+def _float_values(args: Sequence[str]) -> Tuple[str, ...]:
+    if len(args) not in (2, 3):
+        raise ValueError("float placeholder needs (low, high[, decimals])")
+    decimals = int(args[2]) if len(args) == 3 else 1
+    scale = 10 ** decimals
+    low, high = round(float(args[0]) * scale), round(float(args[1]) * scale)
+    if high < low:
+        raise ValueError(f"Invalid float range ({args[0]}, {args[1]})")
+    return tuple(f"{value / scale:.{decimals}f}" for value in range(low, high + 1))
+
+
+def _choice_values(args: Sequence[str]) -> Tuple[str, ...]:
+    if not args:
+        raise ValueError("choice placeholder needs at least one value")
+    return tuple(args)
+
+
+_KINDS: Dict[str, Callable[[Sequence[str]], Tuple[str, ...]]] = {
+    "int": _int_values,
+    "float": _float_values,
+    "choice": _choice_values,
+}
+
+
+def _slot_values(name: str, kind: Optional[str], raw_args: Optional[str]) -> Tuple[str, ...]:
+    """Every value a placeholder can take, as rendered strings."""
+    kind = kind or name
+    if kind in PLACEHOLDER_TYPES:
+        base_kind, args = PLACEHOLDER_TYPES[kind]
+    elif kind in _KINDS:
+        base_kind, args = kind, ()
+    else:
+        raise ValueError(f"Unknown placeholder type '{kind}' for '{name}'")
+
+    if raw_args is not None:
+        separator = "|" if base_kind == "choice" else ","
+        args = tuple(arg.strip() for arg in raw_args.split(separator))
+
+    values = _KINDS[base_kind](args)
+    if len(values) > MAX_SLOT_VALUES:
+        raise ValueError(f"Placeholder '{name}' has more than {MAX_SLOT_VALUES} values")
+    return values
+
+
+class CompiledTemplate:
+    """
+    A question template compiled into str.format renderers.
+
+    Placeholders are written {name:type(args)}:
+
+        {age:int(45,80)}               integer range (optional step)
+        {k:float(2.5,6.5,1)}           decimal range with 1 decimal
+        {drug:choice(lisinopril|ramipril)}
+        {heart_rate}                   named type with default range
+        {sbp:systolic_bp(70,88)}       named type with narrowed range
+
+    A name is defined once and may be referenced again as {name}, in any
+    text field, so the question, options, correct answer and explanation of
+    a variant always agree. Every variant has an index in
+    range(variant_count); rendering decodes the index into one value per
+    placeholder (mixed radix), so distinct indices give distinct variants.
+    """
+
+    __slots__ = ("template", "template_id", "names", "variant_count", "_tables", "_renderers")
+
+    def __init__(self, template: Dict):
+        """
+        Compile a template
+
+        Args:
+            template: Template dict; TEXT_FIELDS may contain placeholders
+
+        Raises:
+            ValueError: If a placeholder is malformed or undefined
+        """
+        self.template = template
+        self.template_id = template.get("template_id")
+
+        slots: Dict[str, int] = {}
+        tables: List[Tuple[str, ...]] = []
+        references: List[str] = []
+
+        def substitute(match: "re.Match") -> str:
+            name = match.group(1)
+            if name is None:
+                # Literal braces, escaped for str.format
+                return "{{" if match.group(0)[0] == "{" else "}}"
+            if name not in slots:
+                if match.group(2) is None and name not in PLACEHOLDER_TYPES:
+                    # Possibly defined later in another field
+                    references.append(name)
+                    return "\x00%d\x00" % (len(references) - 1)
+                slots[name] = len(tables)
+                tables.append(_slot_values(name, match.group(2), match.group(3)))
+            elif match.group(2) is not None:
+                raise ValueError(f"Placeholder '{name}' is defined twice")
+            return "{%d}" % slots[name]
+
+        formats: Dict[str, object] = {}
+        for field in TEXT_FIELDS:
+            value = template.get(field)
+            if isinstance(value, str):
+                formats[field] = _PLACEHOLDER.sub(substitute, value)
+            elif isinstance(value, list):
+                formats[field] = [
+                    _PLACEHOLDER.sub(substitute, item) if isinstance(item, str) else item
+                    for item in value
+                ]
+
+        # Resolve {name} references that appeared before their definition
+        for name in references:
+            if name not in slots:
+                raise ValueError(f"Placeholder '{name}' is never defined")
+        if references:
+            def resolve(text):
+                if not isinstance(text, str):
+                    return text
+                for position, name in enumerate(references):
+                    text = text.replace("\x00%d\x00" % position, "{%d}" % slots[name])
+                return text
+            formats = {
+                field: [resolve(item) for item in value] if isinstance(value, list) else resolve(value)
+                for field, value in formats.items()
+            }
+
+        self.names = tuple(slots)
+        self._tables = tuple(tables)
+        self.variant_count = 1
+        for table in tables:
+            self.variant_count *= len(table)
+
+        # Bound str.format methods, one per text field (or list item)
+        self._renderers = {
+            field: [
+                item.format if isinstance(item, str) else item for item in value
+            ] if isinstance(value, list) else value.format
+            for field, value in formats.items()
+        } if tables else {}
+
+    @property
+    def is_parameterized(self) -> bool:
+        return bool(self._tables)
+
+    def values(self, index: int) -> Dict[str, str]:
+        """Placeholder values of one variant."""
+        return dict(zip(self.names, self._decode(index)))
+
+    def _decode(self, index: int) -> List[str]:
+        if not 0 <= index < self.variant_count:
+            raise IndexError(f"Variant {index} out of range for {self.template_id}")
+        values = []
+        for table in self._tables:
+            index, position = divmod(index, len(table))
+            values.append(table[position])
+        return values
+
+    def render(self, index: int = 0) -> Dict:
+        """
+        Render one variant
+
+        Args:
+            index: Variant index in range(variant_count)
+
+        Returns:
+            Template dict with every text field filled in
+        """
+        if not self._tables:
+            return self.template
+        values = self._decode(index)
+        rendered = dict(self.template)
+        for field, renderer in self._renderers.items():
+            if isinstance(renderer, list):
+                rendered[field] = [
+                    item(*values) if callable(item) else item for item in renderer
+                ]
+            else:
+                rendered[field] = renderer(*values)
+        rendered["variant"] = index
+        return rendered
+
+    def sample(self, rng: Optional[random.Random] = None) -> Dict:
+        """Render a random variant."""
+        if not self._tables:
+            return self.template
+        return self.render((rng or random).randrange(self.variant_count))
+
+
+def compile_template(template: Dict) -> CompiledTemplate:
+    """
+    Compile a question template
+
+    Args:
+        template: Template dict with optional placeholders
+
+    Returns:
+        CompiledTemplate
+    """
+    return CompiledTemplate(template)
@@ -0,0 +1,183 @@
+"""
+Tool: Batched hashed word-vector cosine scoring for free-text answers
+"""
+
+from typing import List, Dict, Sequence, Tuple
+from collections import Counter
+import math
+import re
+import logging
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; scoring falls back to sparse dicts
+    np = None
+
+logger = logging.getLogger(__name__)
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+class HashedVectorScorer:
+    """
+    Score free-text answer pairs by cosine similarity of hashed word vectors.
+
+    Word n-grams are hashed into a fixed feature space, so no vocabulary or
+    model download is needed. Features are weighted by sublinear term
+    frequency. By default this is TF only: there is no corpus IDF, because
+    a batch-fitted IDF would make a pair's score depend on the other pairs
+    in the batch and on how a stream is chunked. An optional fixed idf map
+    (fitted offline) multiplies the weights.
+
+    Every distinct answer is vectorized once per call. With numpy installed,
+    all pairs are then scored in one vectorized pass over the concatenated
+    sparse vectors; otherwise each pair is a sparse dict dot product.
+    """
+
+    def __init__(
+        self,
+        n_features: int = 1 << 20,
+        max_ngram: int = 2,
+        idf: Dict[int, float] = None
+    ):
+        """
+        Initialize Hashed Vector Scorer
+
+        Args:
+            n_features: Size of the hashed feature space
+            max_ngram: Longest word n-gram used as a feature
+            idf: Fixed hashed feature -> IDF weight (optional; features
+                not in it, or all features when omitted, weigh 1.0)
+        """
+        self.n_features = n_features
+        self.max_ngram = max_ngram
+        self.idf = idf or {}
+
+    def _features(self, text: str) -> Counter:
+        """
+        Hashed word n-gram counts for one document
+
+        Uses the interpreter's string/tuple hash, which is only stable
+        within a process; vectors never outlive a single score_pairs call.
+        """
+        tokens = _TOKEN.findall(text.lower())
+        n_features = self.n_features
+        features = [hash(token) % n_features for token in tokens]
+        for n in range(2, self.max_ngram + 1):
+            features.extend(
+                hash(gram) % n_features
+                for gram in zip(*(tokens[i:] for i in range(n)))
+            )
+        return Counter(features)
+
+    def _vector(self, text: str) -> Dict[int, float]:
+        """L2-normalized weighted feature vector of one document."""
+        idf = self.idf
+        weights = {
+            feature: (1.0 + math.log(tf)) * idf.get(feature, 1.0)
+            for feature, tf in self._features(text).items()
+        }
+        norm = math.sqrt(sum(w * w for w in weights.values()))
+        return {feature: w / norm for feature, w in weights.items()} if norm else {}
+
+    def score_pairs(self, answers1: List[str], answers2: List[str]) -> List[float]:
+        """
+        Cosine similarity of each aligned pair
+
+        Args:
+            answers1: First answers (e.g. model answers)
+            answers2: Second answers (e.g. benchmark answers)
+
+        Returns:
+            Cosine similarity per pair, between 0 and 1
+        """
+        if len(answers1) != len(answers2):
+            raise ValueError(
+                f"Answer count mismatch: {len(answers1)} vs {len(answers2)}"
+            )
+        if not answers1:
+            return []
+
+        positions = {doc: i for i, doc in enumerate(dict.fromkeys([*answers1, *answers2]))}
+        left = [positions[a] for a in answers1]
+        right = [positions[b] for b in answers2]
+
+        logger.info(
+            "Vectorizing %d distinct answers for %d pairs",
+            len(positions),
+            len(answers1),
+        )
+
+        if np is not None:
+            scores = self._cosine_matrix(list(positions), left, right)
+        else:
+            vectors = [self._vector(doc) for doc in positions]
+            scores = [self._cosine(vectors[i], vectors[j]) for i, j in zip(left, right)]
+        return [1.0 if i == j else score for i, j, score in zip(left, right, scores)]
+
+    def _cosine_matrix(
+        self,
+        documents: List[str],
+        left: Sequence[int],
+        right: Sequence[int]
+    ) -> List[float]:
+        """
+        Cosine similarity of documents[left[k]] and documents[right[k]]
+
+        All documents are laid out as one flat sparse matrix (features,
+        weights, per-document offsets) and weighted and normalized in bulk.
+        Each side of the pairs is gathered into flat (pair, feature) keys;
+        keys present on both sides are found with a single sorted
+        intersection and their weight products summed per pair.
+        """
+        features: List[int] = []
+        counts: List[int] = []
+        lengths: List[int] = []
+        for doc in documents:
+            doc_counts = self._features(doc)
+            features.extend(doc_counts)
+            counts.extend(doc_counts.values())
+            lengths.append(len(doc_counts))
+
+        features = np.array(features, dtype=np.int64)
+        weights = 1.0 + np.log(np.array(counts, dtype=np.float64))
+        if self.idf:
+            weights *= np.array([self.idf.get(f, 1.0) for f in features.tolist()])
+        lengths = np.array(lengths, dtype=np.int64)
+        offsets = np.cumsum(lengths) - lengths
+
+        owner = np.repeat(np.arange(len(documents), dtype=np.int64), lengths)
+        norms = np.sqrt(np.bincount(owner, weights=weights * weights, minlength=len(documents)))
+        weights /= norms[owner]
+
+        def gather(docs: Sequence[int]) -> Tuple["np.ndarray", "np.ndarray"]:
+            docs = np.asarray(docs, dtype=np.int64)
+            sizes = lengths[docs]
+            rows = np.repeat(np.arange(len(docs), dtype=np.int64), sizes)
+            # Position of each entry in the flat feature/weight arrays
+            index = np.repeat(offsets[docs] - (np.cumsum(sizes) - sizes), sizes)
+            index += np.arange(len(index), dtype=np.int64)
+            return rows * self.n_features + features[index], weights[index]
+
+        keys1, weights1 = gather(left)
+        keys2, weights2 = gather(right)
+        _, index1, index2 = np.intersect1d(
+            keys1, keys2, assume_unique=True, return_indices=True
+        )
+        scores = np.bincount(
+            keys1[index1] // self.n_features,
+            weights=weights1[index1] * weights2[index2],
+            minlength=len(left),
+        )
+        return np.minimum(scores, 1.0).tolist()
+
+    @staticmethod
+    def _cosine(vec1: Dict[int, float], vec2: Dict[int, float]) -> float:
+        """Dot product of two normalized sparse vectors."""
+        if len(vec1) > len(vec2):
+            vec1, vec2 = vec2, vec1
+        return min(1.0, sum(w * vec2.get(feature, 0.0) for feature, w in vec1.items()))
+
+    def score_pair(self, answer1: str, answer2: str) -> float:
+        """Cosine similarity of a single pair."""
+        return self.score_pairs([answer1], [answer2])[0]
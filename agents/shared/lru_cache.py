@@ -0,0 +1,160 @@
+"""
+Shared: Bounded, thread-safe LRU cache with hit/miss/eviction statistics
+"""
+
+from typing import Any, Callable, Dict, Hashable, Optional
+from collections import OrderedDict
+import threading
+
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    Least-recently-used cache bounded by entry count and, optionally, by
+    total weight (e.g. an approximate memory budget in bytes).
+
+    All operations take a single lock, so one instance can be shared by
+    concurrent request handlers.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        max_weight: Optional[int] = None,
+        weigher: Optional[Callable[[Any], int]] = None
+    ):
+        """
+        Initialize LRU Cache
+
+        Args:
+            max_size: Maximum number of entries (0 disables caching)
+            max_weight: Optional maximum total weight of cached values
+            weigher: Function returning the weight of a value (default 1)
+        """
+        self.max_size = max_size
+        self.max_weight = max_weight
+        self.weigher = weigher or (lambda value: 1)
+
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._weights: Dict[Hashable, int] = {}
+        self._total_weight = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Look up a value and mark it as most recently used
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss
+
+        Returns:
+            Cached value or default
+        """
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Insert or replace a value, evicting least recently used entries
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        if self.max_size <= 0:
+            return
+
+        weight = self.weigher(value) if self.max_weight is not None else 1
+        if self.max_weight is not None and weight > self.max_weight:
+            # Never cache a single value larger than the whole budget
+            return
+
+        with self._lock:
+            if key in self._data:
+                self._total_weight -= self._weights.pop(key)
+                del self._data[key]
+
+            self._data[key] = value
+            self._weights[key] = weight
+            self._total_weight += weight
+
+            while len(self._data) > self.max_size or (
+                self.max_weight is not None and self._total_weight > self.max_weight
+            ):
+                old_key, _ = self._data.popitem(last=False)
+                self._total_weight -= self._weights.pop(old_key)
+                self.evictions += 1
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for key, computing and caching it on a miss
+
+        The value is computed outside the lock, so concurrent misses on the
+        same key may compute it more than once.
+
+        Args:
+            key: Cache key
+            compute: Zero-argument function producing the value
+
+        Returns:
+            Cached or freshly computed value
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove key and return its value (or default)."""
+        with self._lock:
+            if key not in self._data:
+                return default
+            self._total_weight -= self._weights.pop(key)
+            return self._data.pop(key)
+
+    def clear(self) -> None:
+        """Drop all entries (statistics are kept)."""
+        with self._lock:
+            self._data.clear()
+            self._weights.clear()
+            self._total_weight = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Cache statistics
+
+        Returns:
+            Dictionary with size, weight, hits, misses, evictions, hit_rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "max_size": self.max_size,
+                "weight": self._total_weight,
+                "max_weight": self.max_weight,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
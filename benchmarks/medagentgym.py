@@ -0,0 +1,83 @@
+"""
+Benchmark: MedAgentGym client throughput against the local stand-in server
+
+Starts medagentgym_server on a local port with simulated latency, then
+fetches the same question set with different concurrency limits and once
+more from the on-disk cache.
+
+Usage:
+    python -m benchmarks.medagentgym [num_questions] [latency_seconds]
+"""
+
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from types import SimpleNamespace
+
+import uvicorn
+
+from agents.agent_2_simulation.tools.medagentgym_integration import MedAgentGymIntegration
+from agents.agent_2_simulation.tools.medagentgym_server import create_app
+
+logging.disable(logging.INFO)
+
+PORT = 8766
+
+
+def start_server(answers, latency):
+    """Run the stand-in server in a daemon thread."""
+    server = uvicorn.Server(uvicorn.Config(
+        create_app(answers, latency=latency),
+        host="127.0.0.1",
+        port=PORT,
+        log_level="warning",
+    ))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+    return server, thread
+
+
+def main(num_questions: int, latency: float):
+    answers = {f"Q{i}": f"Answer {i}" for i in range(num_questions)}
+    questions = [{"question_id": qid} for qid in answers]
+    server, thread = start_server(answers, latency)
+    cache_dir = tempfile.mkdtemp()
+
+    try:
+        for concurrency in (1, 4, 16):
+            client = MedAgentGymIntegration(SimpleNamespace(
+                medagentgym_url=f"http://127.0.0.1:{PORT}",
+                medagentgym_batch_size=50,
+                medagentgym_max_concurrency=concurrency,
+                medagentgym_cache_path=os.path.join(cache_dir, f"cache_{concurrency}.sqlite3"),
+            ))
+
+            start = time.perf_counter()
+            fetched = client.get_benchmark_answers(questions)
+            cold = time.perf_counter() - start
+            start = time.perf_counter()
+            client.get_benchmark_answers(questions)
+            warm = time.perf_counter() - start
+            client.close()
+
+            assert fetched == list(answers.values())
+            print(
+                f"concurrency {concurrency:>2}: {num_questions} answers in "
+                f"{cold * 1000:8.1f} ms ({num_questions / cold:8.0f}/s), "
+                f"cached {warm * 1000:6.1f} ms"
+            )
+    finally:
+        server.should_exit = True
+        thread.join()
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 5000,
+        float(sys.argv[2]) if len(sys.argv) > 2 else 0.02,
+    )
@@ -0,0 +1,187 @@
+"""
+Benchmark: option lookup tables vs the per-stage option scans they replaced
+
+Times the option-resolving stages of a simulation run (benchmark loading,
+answer comparison, error-example option lookup) in two checkouts of the
+repository:
+
+  baseline   the commit before option tables were introduced, where every
+             stage re-derives option letters with linear scans
+  candidate  the commit that introduced them (or the working tree with
+             --candidate .), where a QuestionSet builds its tables once
+
+Each checkout is a temporary git worktree, timed in its own interpreter.
+
+Usage:
+    python -m benchmarks.option_tables [--baseline REF] [--candidate REF] [num_questions ...]
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+OPTION_TABLES_PATH = "agents/agent_2_simulation/tools/option_tables.py"
+
+OPTION_WORDS = [
+    "aspirin", "heparin", "metoprolol", "furosemide", "amiodarone",
+    "angioplasty", "thrombolysis", "observation", "echocardiogram", "stenting",
+]
+
+
+def make_questions(count: int, seed: int = 0):
+    """Synthetic multiple choice questions with distinct option lists."""
+    rng = random.Random(seed)
+    questions = []
+    model_answers = []
+    for i in range(count):
+        words = rng.sample(OPTION_WORDS, 4)
+        options = [f"{letter}) {word} {i}" for letter, word in zip("ABCD", words)]
+        answer = rng.choice("ABCD")
+        questions.append({
+            "question_id": f"Q{i}",
+            "options": options,
+            "correct_answer": answer,
+            "domain": rng.choice(["cardiology", "neurology"]),
+            "difficulty": rng.choice(["easy", "medium", "hard"]),
+        })
+        choice = rng.choice(options)
+        model_answers.append(
+            rng.choice([choice[0], choice[3:], f"The answer is {choice[0]}"])
+        )
+    return questions, model_answers
+
+
+def _scan_option(options, letter):
+    """Pre-table option lookup: first option starting with "B)" or "B."."""
+    for option in options:
+        option = option.strip()
+        if option.startswith(f"{letter})") or option.startswith(f"{letter}."):
+            return option
+    return None
+
+
+def run_pipeline(num_questions: int) -> float:
+    """
+    Load, compare and resolve error options in the checkout on sys.path
+
+    Returns:
+        Elapsed seconds (including building option tables, if any)
+    """
+    from agents.agent_2_simulation.tools.answer_comparator import AnswerComparator
+    from agents.agent_2_simulation.tools.benchmark_loader import BenchmarkLoader
+
+    try:
+        from agents.agent_2_simulation.tools.option_tables import QuestionSet
+    except ImportError:
+        QuestionSet = None
+
+    questions, model_answers = make_questions(num_questions)
+    loader = BenchmarkLoader()
+    comparator = AnswerComparator()
+    extractor = comparator.answer_extractor
+
+    start = time.perf_counter()
+    if QuestionSet is not None:
+        questions = QuestionSet(questions)
+    benchmark_answers = loader.load_benchmark_answers(questions, source="questions")
+    batch = comparator.compare_batch(
+        model_answers, benchmark_answers, questions, with_scores=False
+    )
+    if QuestionSet is not None:
+        tables = questions.option_tables
+        for i in batch.incorrect_indices:
+            letter = extractor.extract(model_answers[i], tables[i])
+            if letter:
+                tables[i].option(letter)
+    else:
+        for i in batch.incorrect_indices:
+            options = questions[i]["options"]
+            letter = extractor.extract(model_answers[i], options)
+            if letter:
+                _scan_option(options, letter)
+    elapsed = time.perf_counter() - start
+
+    loader.close()
+    comparator.close()
+    return elapsed
+
+
+def _git(*args) -> str:
+    return subprocess.run(
+        ["git", "-C", REPO_ROOT, *args],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+
+def _default_refs():
+    """(baseline, candidate): the option-table commit's parent and itself."""
+    commit = _git("log", "--diff-filter=A", "--format=%H", "--", OPTION_TABLES_PATH).splitlines()[-1]
+    return f"{commit}~1", commit
+
+
+def time_checkout(tree: str, num_questions: int, repeat: int) -> float:
+    """Best of repeat runs of the pipeline in a fresh interpreter on tree."""
+    env = {**os.environ, "PYTHONPATH": tree}
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--worker", str(num_questions), str(repeat)],
+        cwd=tree,
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])["seconds"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("sizes", nargs="*", type=int, default=[500, 50_000])
+    parser.add_argument("--baseline", help="Git ref without option tables")
+    parser.add_argument("--candidate", help="Git ref with option tables ('.' for the working tree)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per size (best is reported)")
+    args = parser.parse_args()
+
+    baseline, candidate = _default_refs()
+    baseline = args.baseline or baseline
+    candidate = args.candidate or candidate
+
+    workdir = tempfile.mkdtemp(prefix="option-tables-bench-")
+    trees = {}
+    try:
+        for name, ref in (("baseline", baseline), ("candidate", candidate)):
+            if ref == ".":
+                trees[name] = REPO_ROOT
+                continue
+            trees[name] = os.path.join(workdir, name)
+            _git("worktree", "add", "--detach", trees[name], ref)
+        print(f"baseline  {baseline}\ncandidate {candidate}")
+
+        for size in args.sizes:
+            before = time_checkout(trees["baseline"], size, args.repeat)
+            after = time_checkout(trees["candidate"], size, args.repeat)
+            print(
+                f"{size:>7} questions: option scans {before * 1000:8.1f} ms, "
+                f"option tables {after * 1000:8.1f} ms, speedup {before / after:.2f}x"
+            )
+    finally:
+        for tree in trees.values():
+            if tree != REPO_ROOT:
+                _git("worktree", "remove", "--force", tree)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == "--worker":
+        logging.disable(logging.INFO)
+        seconds = min(run_pipeline(int(sys.argv[2])) for _ in range(int(sys.argv[3])))
+        print(json.dumps({"seconds": seconds}))
+    else:
+        main()
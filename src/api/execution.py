@@ -0,0 +1,244 @@
+"""
+Simulation Agent execution layer
+
+Runs the synchronous, CPU- and IO-heavy stages of the API (question
+generation, benchmark loading, answer comparison) on a bounded thread pool
+so the event loop stays free for other requests, e.g. /health.
+"""
+
+from typing import Any, Callable, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import functools
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+EXECUTION_MODES = ("thread", "inline")
+
+# Stage name -> default concurrency limit
+DEFAULT_STAGE_LIMITS = {
+    "questions": 2,
+    "benchmarks": 4,
+    "compare": 2,
+}
+
+
+class StageOverloaded(Exception):
+    """Raised when a stage's wait queue is full."""
+
+    def __init__(self, stage: str, queued: int):
+        super().__init__(f"Stage '{stage}' is overloaded ({queued} requests queued)")
+        self.stage = stage
+        self.queued = queued
+
+
+class StageLimiter:
+    """
+    Concurrency limit and counters for one stage.
+
+    At most `concurrency` calls of the stage run at once; further calls wait
+    (their number is the stage's queue depth), and once `max_queue` calls
+    are waiting new ones are rejected with StageOverloaded.
+    """
+
+    def __init__(self, name: str, concurrency: int, max_queue: int = 0):
+        """
+        Initialize Stage Limiter
+
+        Args:
+            name: Stage name
+            concurrency: Maximum concurrent calls
+            max_queue: Maximum waiting calls (0 for unbounded)
+        """
+        self.name = name
+        self.concurrency = max(1, concurrency)
+        self.max_queue = max_queue
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self.running = 0
+        self.queued = 0
+        self.max_queued = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.wait_seconds = 0.0
+        self.run_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    async def run(self, call: Callable[[], Any], executor: Optional[ThreadPoolExecutor]) -> Any:
+        """
+        Run call within the stage limit
+
+        Args:
+            call: Zero-argument callable
+            executor: Thread pool to run it on (None runs it on the event loop)
+
+        Returns:
+            The call's result
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Semaphores belong to one event loop (e.g. per test client)
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+            self._loop = loop
+
+        if self.max_queue and self.queued >= self.max_queue:
+            self.rejected += 1
+            raise StageOverloaded(self.name, self.queued)
+
+        self.queued += 1
+        self.max_queued = max(self.max_queued, self.queued)
+        enqueued = time.perf_counter()
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.queued -= 1
+
+        started = time.perf_counter()
+        waited = started - enqueued
+        self.wait_seconds += waited
+        self.max_wait_seconds = max(self.max_wait_seconds, waited)
+        self.running += 1
+
+        if executor is None:
+            try:
+                result = call()
+            except Exception:
+                self._finish(started, failed=True)
+                raise
+            self._finish(started, failed=False)
+            return result
+
+        # The slot is released when the thread finishes, not when the
+        # request goes away, so a cancelled request can't exceed the limit
+        try:
+            future = loop.run_in_executor(executor, call)
+        except BaseException:
+            # Never submitted (e.g. the pool is shut down): release the slot
+            self._finish(started, failed=True)
+            raise
+        future.add_done_callback(
+            lambda done: self._finish(
+                started, failed=done.cancelled() or done.exception() is not None
+            )
+        )
+        return await asyncio.shield(future)
+
+    def _finish(self, started: float, failed: bool) -> None:
+        self.running -= 1
+        self.run_seconds += time.perf_counter() - started
+        if failed:
+            self.failed += 1
+        else:
+            self.completed += 1
+        self._semaphore.release()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Queue depth, throughput and latency counters."""
+        finished = self.completed + self.failed
+        return {
+            "concurrency": self.concurrency,
+            "max_queue": self.max_queue,
+            "running": self.running,
+            "queued": self.queued,
+            "max_queued": self.max_queued,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "avg_wait_ms": 1000 * self.wait_seconds / finished if finished else 0.0,
+            "max_wait_ms": 1000 * self.max_wait_seconds,
+            "avg_run_ms": 1000 * self.run_seconds / finished if finished else 0.0,
+        }
+
+
+class ExecutionLayer:
+    """
+    Runs route stages off the event loop with per-stage concurrency limits.
+
+    The thread pool is sized to the sum of the stage limits, so a call that
+    got past its stage limit never waits for a thread and all queueing is
+    visible in the stage metrics.
+    """
+
+    def __init__(self, config=None):
+        """
+        Initialize Execution Layer
+
+        Args:
+            config: SimulationSettings instance (optional)
+        """
+        def setting(name, default):
+            return getattr(config, name, default) if config else default
+
+        self.mode = setting("execution_mode", "thread")
+        if self.mode not in EXECUTION_MODES:
+            raise ValueError(f"Unknown execution mode: {self.mode}")
+
+        max_queue = setting("execution_max_queue", 64)
+        self.stages: Dict[str, StageLimiter] = {
+            name: StageLimiter(
+                name,
+                setting(f"execution_{name}_concurrency", default),
+                max_queue,
+            )
+            for name, default in DEFAULT_STAGE_LIMITS.items()
+        }
+
+        # Created on first use and again after shutdown(), so the layer
+        # survives several application lifespans in one process
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+        logger.info(
+            "ExecutionLayer initialized (mode=%s, limits=%s)",
+            self.mode,
+            {name: stage.concurrency for name, stage in self.stages.items()},
+        )
+
+    def _get_executor(self) -> Optional[ThreadPoolExecutor]:
+        """Thread pool for the stages (None in inline mode)."""
+        if self.mode != "thread":
+            return None
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=sum(stage.concurrency for stage in self.stages.values()),
+                    thread_name_prefix="simulation-stage",
+                )
+            return self._executor
+
+    async def run(self, stage: str, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run fn(*args, **kwargs) in a stage
+
+        Args:
+            stage: Stage name ("questions", "benchmarks" or "compare")
+            fn: Synchronous function
+
+        Returns:
+            fn's result
+
+        Raises:
+            StageOverloaded: If the stage's wait queue is full
+        """
+        return await self.stages[stage].run(
+            functools.partial(fn, *args, **kwargs), self._get_executor()
+        )
+
+    def metrics(self) -> Dict[str, Any]:
+        """Per-stage metrics."""
+        return {
+            "mode": self.mode,
+            "stages": {name: stage.metrics() for name, stage in self.stages.items()},
+        }
+
+    def shutdown(self) -> None:
+        """Stop the thread pool after running calls finish (a later run() starts a new one)."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
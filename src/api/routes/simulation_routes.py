@@ -2,15 +2,20 @@
 Simulation Agent API Routes
 """
 
-from typing import List, Dict, Any
-from fastapi import APIRouter, HTTPException, status
+from typing import List, Dict, Any, Optional, AsyncIterator, Tuple
+from fastapi import APIRouter, HTTPException, Request, Query, status
+from fastapi.responses import StreamingResponse
+from starlette.requests import ClientDisconnect
+import json
 import logging
+import random
 import uuid
 from datetime import datetime
 
 from src.api.schemas import (
     QuestionGenerateRequest,
     QuestionGenerateResponse,
+    QuestionStreamRequest,
     QuestionResponse,
     BenchmarkLoadRequest,
     BenchmarkLoadResponse,
@@ -24,21 +29,225 @@ from src.api.schemas import (
     ErrorExample,
     HealthResponse,
     ErrorResponse,
+    ScoringMode,
+    DedupCounts,
 )
 
+from src.config.settings import settings
+from src.api.execution import ExecutionLayer, StageOverloaded
+
 # Import simulation agent tools
 from agents.agent_2_simulation.tools.question_generator import QuestionGenerator
 from agents.agent_2_simulation.tools.benchmark_loader import BenchmarkLoader
-from agents.agent_2_simulation.tools.answer_comparator import AnswerComparator
+from agents.agent_2_simulation.tools.option_tables import QuestionSet
+from agents.agent_2_simulation.tools.question_dedup import QuestionDedupIndex, dedupe_questions
+from agents.agent_2_simulation.tools.question_set_cache import QuestionSetCache
+from agents.agent_2_simulation.tools.answer_comparator import (
+    AnswerComparator,
+    BatchComparison,
+    ComparisonSummary,
+)
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/simulation", tags=["Simulation"])
 
 # Initialize tools
-question_generator = QuestionGenerator()
-benchmark_loader = BenchmarkLoader()
-answer_comparator = AnswerComparator()
+question_generator = QuestionGenerator(settings)
+benchmark_loader = BenchmarkLoader(settings)
+answer_comparator = AnswerComparator(settings)
+execution = ExecutionLayer(settings)
+question_set_cache = QuestionSetCache(
+    max_size=settings.question_set_cache_size,
+    max_questions=settings.question_set_cache_max_questions,
+    directory=settings.question_set_cache_dir
+)
+
+# Maximum rows scored (or generated questions sent) together while streaming
+STREAM_CHUNK_SIZE = 512
+
+# Seeds for requests that don't pick one, reported back so the set can be reproduced
+_seed_source = random.SystemRandom()
+
+
+def _request_seed(seed: Optional[int]) -> int:
+    """
+    Seed to generate a question set with
+    """
+    return seed if seed is not None else _seed_source.randrange(2 ** 32)
+
+
+def _dedup_index(mode, max_entries: Optional[int] = None) -> QuestionDedupIndex:
+    """
+    Per-request duplicate question index
+    """
+    return QuestionDedupIndex(
+        mode=mode.value,
+        near_threshold=getattr(settings, "dedup_near_threshold", 0.8),
+        max_entries=max_entries
+    )
+
+
+def _generate_question_set(request) -> Tuple[str, QuestionSet, int, Dict[str, int]]:
+    """
+    Generate (or reuse) the question set a generation request describes
+    
+    Sets generated with a caller-chosen seed are looked up by their
+    generation parameters first, so repeating a seeded request returns the
+    cached set without regenerating it.
+    
+    Returns:
+        (question_set_id, questions, seed, dedup counts)
+    """
+    key = None
+    if request.seed is not None:
+        key = (
+            request.num_questions,
+            request.difficulty.value,
+            tuple(request.domains) if request.domains is not None else None,
+            request.model_type,
+            request.seed,
+            request.stratified,
+            request.dedup.value,
+            question_generator.template_catalog.version
+        )
+        found = question_set_cache.find_generated(key)
+        if found is not None:
+            set_id, dedup_counts = found
+            questions = question_set_cache.get(set_id)
+            if questions is not None:
+                logger.info(f"Reusing cached question set {set_id}")
+                return set_id, questions, request.seed, dedup_counts
+    
+    seed = _request_seed(request.seed)
+    dedup = _dedup_index(request.dedup)
+    set_id, questions = question_set_cache.put(question_generator.generate(
+        num_questions=request.num_questions,
+        difficulty=request.difficulty.value,
+        domains=request.domains,
+        model_type=request.model_type,
+        seed=seed,
+        stratified=request.stratified,
+        dedup=dedup
+    ))
+    dedup_counts = dedup.report.to_dict()
+    if key is not None and set_id is not None:
+        question_set_cache.remember_generated(key, set_id, dedup_counts)
+    return set_id, questions, seed, dedup_counts
+
+
+async def _run_stage(stage: str, fn, *args, **kwargs):
+    """
+    Run synchronous work on the execution layer (503 when the stage is overloaded)
+    """
+    try:
+        return await execution.run(stage, fn, *args, **kwargs)
+    except StageOverloaded as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"}
+        )
+
+
+async def _cached_question_set(question_set_id: str) -> QuestionSet:
+    """
+    Question set stored under question_set_id (404 if unknown)
+    
+    In-memory hits are served directly; only reading a persisted set from
+    disk goes through the questions stage.
+    """
+    questions = question_set_cache.get(question_set_id, load=False)
+    if questions is None and question_set_cache.directory:
+        questions = await _run_stage("questions", question_set_cache.get, question_set_id)
+    if questions is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Unknown question_set_id: {question_set_id}"
+        )
+    return questions
+
+
+async def _request_questions(request) -> List[Dict[str, Any]]:
+    """
+    Questions of a request, given inline or by question_set_id
+    """
+    if request.question_set_id:
+        return await _cached_question_set(request.question_set_id)
+    if request.questions is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Either questions or question_set_id is required"
+        )
+    return request.questions
+
+
+def _score_answers(
+    model_answers: List[str],
+    benchmark_answers: List[str],
+    questions: List[Dict[str, Any]],
+    scoring_mode: ScoringMode = ScoringMode.DEFAULT,
+    accepted_answers: Optional[List[List[str]]] = None
+) -> BatchComparison:
+    """
+    Score answer pairs with the requested scoring mode
+    """
+    if scoring_mode == ScoringMode.MCQ:
+        return answer_comparator.compare_mcq(
+            model_answers=model_answers,
+            benchmark_answers=benchmark_answers,
+            questions=questions,
+            accepted_answers=accepted_answers
+        )
+    if scoring_mode == ScoringMode.VECTOR:
+        return answer_comparator.compare_vector(
+            model_answers=model_answers,
+            benchmark_answers=benchmark_answers,
+            questions=questions,
+            accepted_answers=accepted_answers
+        )
+    return answer_comparator.compare_batch(
+        model_answers=model_answers,
+        benchmark_answers=benchmark_answers,
+        questions=questions,
+        accepted_answers=accepted_answers
+    )
+
+
+def _accepted_answers(
+    questions: List[Dict[str, Any]],
+    benchmark_answers: List[str]
+) -> Optional[List[List[str]]]:
+    """
+    Acceptable answers per question, or None when no question has alternates
+    """
+    accepted = benchmark_loader.load_accepted_answers(questions, benchmark_answers)
+    return accepted if any(len(answers) > 1 for answers in accepted) else None
+
+
+def _build_comparison_result(
+    batch: BatchComparison,
+    include_details: bool = True
+) -> ComparisonResult:
+    """
+    Convert a batch comparison to the API response model
+    """
+    detailed_comparisons = [
+        DetailedComparison(**comp) for comp in batch.iter_details()
+    ] if include_details else []
+    correct_indices = batch.correct_indices
+    
+    return ComparisonResult(
+        correct_indices=correct_indices,
+        incorrect_indices=batch.incorrect_indices,
+        correct_count=len(correct_indices),
+        incorrect_count=len(batch) - len(correct_indices),
+        total_count=len(batch),
+        accuracy=len(correct_indices) / len(batch) if len(batch) else 0,
+        detailed_comparisons=detailed_comparisons,
+        accuracy_by_domain=batch.accuracy_by_domain(),
+        accuracy_by_difficulty=batch.accuracy_by_difficulty()
+    )
 
 
 @router.get("/health", response_model=HealthResponse)
@@ -56,40 +265,82 @@ async def health_check():
     )
 
 
+@router.get("/metrics")
+async def metrics():
+    """
+    Service metrics
+    
+    Execution layer metrics (see /metrics/execution) plus hit/miss, size and
+    eviction statistics of the comparison, benchmark and question set caches.
+    """
+    return {
+        "execution": execution.metrics(),
+        "caches": {
+            **answer_comparator.cache_stats(),
+            "option_tables": answer_comparator.answer_extractor.cache_stats(),
+            **benchmark_loader.cache_stats(),
+            **question_set_cache.stats(),
+        },
+    }
+
+
+@router.get("/metrics/execution")
+async def execution_metrics():
+    """
+    Execution layer metrics
+    
+    Per stage (questions, benchmarks, compare): concurrency limit, running
+    and queued calls (current and peak queue depth), completed, failed and
+    rejected calls, and average/maximum queue wait and average run time.
+    """
+    return execution.metrics()
+
+
 @router.post("/generate-questions", response_model=QuestionGenerateResponse)
 async def generate_questions(request: QuestionGenerateRequest):
     """
     Generate clinical simulation questions
     
-    - **num_questions**: Number of questions to generate (1-500)
+    - **num_questions**: Number of questions to generate (1-10000)
     - **difficulty**: Question difficulty (easy, medium, hard, varied)
     - **domains**: List of medical domains (optional)
     - **model_type**: Type of model being tested
+    - **seed**: Random seed (optional); the same seed reproduces the same questions
+    - **stratified**: Exact per-domain/difficulty quotas instead of independent draws
+    - **dedup**: "none" (default) keeps everything, "exact" rejects
+      duplicate questions, "near" also near-duplicates
     
-    Returns a list of generated questions with answers and explanations
+    Returns a list of generated questions with answers and explanations,
+    the seed that reproduces them, duplicate counts and a question_set_id
+    that /run, /load-benchmarks and /compare-answers accept in place of the
+    questions. With dedup enabled fewer than num_questions questions are
+    returned when the templates run out of distinct questions.
     """
     try:
         logger.info(f"Generating {request.num_questions} questions")
         
-        # Generate questions
-        questions = question_generator.generate(
-            num_questions=request.num_questions,
-            difficulty=request.difficulty.value,
-            domains=request.domains,
-            model_type=request.model_type
-        )
-        
-        # Convert to response format
-        question_responses = [
-            QuestionResponse(**q) for q in questions
-        ]
+        def generate() -> QuestionGenerateResponse:
+            # Generate questions (seeded requests may reuse a cached set)
+            set_id, questions, seed, dedup_counts = _generate_question_set(request)
+            
+            # Convert to response format
+            question_responses = [
+                QuestionResponse(**q) for q in questions
+            ]
+            
+            return QuestionGenerateResponse(
+                questions=question_responses,
+                count=len(question_responses),
+                seed=seed,
+                question_set_id=set_id,
+                dedup=DedupCounts(**dedup_counts),
+                message=f"Successfully generated {len(question_responses)} questions"
+            )
         
-        return QuestionGenerateResponse(
-            questions=question_responses,
-            count=len(question_responses),
-            message=f"Successfully generated {len(question_responses)} questions"
-        )
+        return await _run_stage("questions", generate)
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error generating questions: {str(e)}")
         raise HTTPException(
@@ -98,32 +349,95 @@ async def generate_questions(request: QuestionGenerateRequest):
         )
 
 
+@router.post("/generate-questions/stream")
+async def generate_questions_stream(request: QuestionStreamRequest):
+    """
+    Stream generated clinical questions as NDJSON
+    
+    Takes the same parameters as /generate-questions, with num_questions up
+    to 1,000,000. Questions are written one per line as they are generated,
+    so memory stays flat however large the set is. The seed used is sent
+    in the X-Question-Seed header and in the final {"summary": {...}} line,
+    together with duplicate counts. With dedup enabled, duplicates are
+    caught within windows of SIMULATION_DEDUP_STREAM_WINDOW unique questions.
+    """
+    seed = _request_seed(request.seed)
+    # Bounded window, so the index can't outgrow the constant-memory stream
+    dedup = _dedup_index(
+        request.dedup,
+        max_entries=getattr(settings, "dedup_stream_window", 100_000)
+    )
+    questions = question_generator.iter_questions(
+        num_questions=request.num_questions,
+        difficulty=request.difficulty.value,
+        domains=request.domains,
+        model_type=request.model_type,
+        seed=seed,
+        stratified=request.stratified,
+        dedup=dedup
+    )
+    
+    def lines():
+        # A sync iterator: Starlette runs it in the threadpool, so generation
+        # never blocks the event loop. Lines are sent in chunks.
+        count = 0
+        chunk = []
+        for question in questions:
+            chunk.append(json.dumps(question))
+            count += 1
+            if len(chunk) >= STREAM_CHUNK_SIZE:
+                yield "\n".join(chunk) + "\n"
+                chunk = []
+        if chunk:
+            yield "\n".join(chunk) + "\n"
+        
+        logger.info(f"Streamed {count} generated questions (seed {seed})")
+        yield json.dumps({
+            "summary": {"count": count, "seed": seed, "dedup": dedup.report.to_dict()}
+        }) + "\n"
+    
+    return StreamingResponse(
+        lines(),
+        media_type="application/x-ndjson",
+        headers={"X-Question-Seed": str(seed)}
+    )
+
+
 @router.post("/load-benchmarks", response_model=BenchmarkLoadResponse)
 async def load_benchmarks(request: BenchmarkLoadRequest):
     """
     Load benchmark (correct) answers for questions
     
     - **questions**: List of question dictionaries
-    - **source**: Source for benchmark answers (auto, questions, file, medagentgym)
+    - **question_set_id**: Cached question set to use instead of questions
+    - **source**: Source for benchmark answers (auto, questions, file, sqlite, journal, medagentgym)
     
     Returns benchmark answers aligned with the provided questions
     """
     try:
-        logger.info(f"Loading benchmarks for {len(request.questions)} questions")
+        questions = await _request_questions(request)
         
-        # Load benchmark answers
-        benchmark_answers = benchmark_loader.load_benchmark_answers(
-            questions=request.questions,
-            source=request.source.value
-        )
+        def load() -> BenchmarkLoadResponse:
+            logger.info(f"Loading benchmarks for {len(questions)} questions")
+            
+            # Load benchmark answers
+            benchmark_answers = benchmark_loader.load_benchmark_answers(
+                questions=questions,
+                source=request.source.value
+            )
+            
+            return BenchmarkLoadResponse(
+                benchmark_answers=benchmark_answers,
+                accepted_answers=_accepted_answers(questions, benchmark_answers),
+                count=len(benchmark_answers),
+                source_used=request.source.value,
+                message=f"Successfully loaded {len(benchmark_answers)} benchmark answers"
+            )
         
-        return BenchmarkLoadResponse(
-            benchmark_answers=benchmark_answers,
-            count=len(benchmark_answers),
-            source_used=request.source.value,
-            message=f"Successfully loaded {len(benchmark_answers)} benchmark answers"
-        )
+        return await _run_stage("benchmarks", load)
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error loading benchmarks: {str(e)}")
         raise HTTPException(
@@ -138,48 +452,59 @@ async def compare_answers(request: CompareAnswersRequest):
     Compare model answers with benchmark answers
     
     - **model_answers**: Answers generated by the model
-    - **benchmark_answers**: Correct benchmark answers
+    - **benchmark_answers**: Correct benchmark answers (loaded for the questions when omitted)
     - **questions**: Original questions for context
+    - **question_set_id**: Cached question set to use instead of questions
+    - **accepted_answers**: Optional acceptable alternates per question
+    - **scoring_mode**: "default", "mcq" (integer-coded option scoring) or "vector" (hashed word-vector cosine)
+    - **include_details**: Include per-question detailed comparisons
     
     Returns detailed comparison results with accuracy metrics
     """
     try:
         logger.info(f"Comparing {len(request.model_answers)} answer pairs")
+        questions = await _request_questions(request)
         
         # Validate input
-        if len(request.model_answers) != len(request.benchmark_answers):
+        if len(request.model_answers) != len(questions):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Answer count mismatch: {len(request.model_answers)} model answers vs {len(request.benchmark_answers)} benchmark answers"
+                detail=f"Question count mismatch: {len(questions)} questions vs {len(request.model_answers)} answers"
             )
         
-        if len(request.model_answers) != len(request.questions):
+        benchmark_answers = request.benchmark_answers
+        if benchmark_answers is None:
+            benchmark_answers = await _run_stage(
+                "benchmarks",
+                benchmark_loader.load_benchmark_answers,
+                questions=questions,
+                source="auto",
+                canonical=True
+            )
+        elif len(request.model_answers) != len(benchmark_answers):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Question count mismatch: {len(request.questions)} questions vs {len(request.model_answers)} answers"
+                detail=f"Answer count mismatch: {len(request.model_answers)} model answers vs {len(benchmark_answers)} benchmark answers"
             )
         
-        # Compare answers
-        comparison_results = answer_comparator.compare(
-            model_answers=request.model_answers,
-            benchmark_answers=request.benchmark_answers,
-            questions=request.questions
-        )
+        if request.accepted_answers is not None and len(request.accepted_answers) != len(request.model_answers):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Accepted answer count mismatch: {len(request.accepted_answers)} entries vs {len(request.model_answers)} answers"
+            )
         
-        # Convert to response format
-        detailed_comparisons = [
-            DetailedComparison(**comp) for comp in comparison_results["detailed_comparisons"]
-        ]
+        # Compare answers and convert to response format
+        def compare() -> ComparisonResult:
+            batch = _score_answers(
+                model_answers=request.model_answers,
+                benchmark_answers=benchmark_answers,
+                questions=questions,
+                scoring_mode=request.scoring_mode,
+                accepted_answers=request.accepted_answers
+            )
+            return _build_comparison_result(batch, include_details=request.include_details)
         
-        return ComparisonResult(
-            correct_indices=comparison_results["correct_indices"],
-            incorrect_indices=comparison_results["incorrect_indices"],
-            correct_count=comparison_results["correct_count"],
-            incorrect_count=comparison_results["incorrect_count"],
-            total_count=comparison_results["total_count"],
-            accuracy=comparison_results["accuracy"],
-            detailed_comparisons=detailed_comparisons
-        )
+        return await _run_stage("compare", compare)
         
     except HTTPException:
         raise
@@ -191,6 +516,300 @@ async def compare_answers(request: CompareAnswersRequest):
         )
 
 
+class DuplexStreamingResponse(StreamingResponse):
+    """
+    Streaming response whose body is produced while the request body is
+    still being read.
+    
+    StreamingResponse normally listens for client disconnects on
+    ``receive`` in parallel with streaming, which would steal request body
+    messages from the body reader. Here the body iterator owns ``receive``
+    and sees disconnects through it (see _NdjsonBody).
+    """
+    
+    async def __call__(self, scope, receive, send) -> None:
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+
+class _NdjsonBody:
+    """
+    NDJSON request body, split into lines as chunks arrive
+
+    Pieces of an unfinished line are kept in a list and joined once the
+    line ends, so each byte is scanned once however finely a long line is
+    chunked. A line longer than max_line_bytes is dropped as it arrives and
+    reported as None. ``complete`` turns True once the last body message
+    has been received.
+    """
+    
+    def __init__(self, request: Request, max_line_bytes: int):
+        self.request = request
+        self.max_line_bytes = max_line_bytes
+        self.complete = False
+        self._pending: List[bytes] = []
+        self._pending_size = 0
+        self._skipping = False
+    
+    async def batches(self) -> AsyncIterator[List[Optional[bytes]]]:
+        """
+        Yield the complete lines available after each body chunk
+        
+        Raises:
+            ClientDisconnect: If the client goes away mid-body
+        """
+        while not self.complete:
+            message = await self.request.receive()
+            if message["type"] == "http.disconnect":
+                raise ClientDisconnect()
+            self.complete = not message.get("more_body", False)
+            lines = self._split(message.get("body", b""))
+            if self.complete and self._pending and not self._skipping:
+                lines.append(self._line(b""))
+            lines = [line for line in lines if line is None or line.strip()]
+            if lines:
+                yield lines
+    
+    def _line(self, tail: bytes) -> Optional[bytes]:
+        """Pending pieces plus tail as one line (None if too long)."""
+        if self._pending_size + len(tail) > self.max_line_bytes:
+            line = None
+        else:
+            line = b"".join(self._pending) + tail if self._pending else tail
+        self._pending = []
+        self._pending_size = 0
+        return line
+    
+    def _split(self, chunk: bytes) -> List[Optional[bytes]]:
+        lines: List[Optional[bytes]] = []
+        start = 0
+        end = chunk.find(b"\n")
+        while end >= 0:
+            if self._skipping:
+                # End of an over-long line that was already reported
+                self._skipping = False
+            else:
+                lines.append(self._line(chunk[start:end]))
+            start = end + 1
+            end = chunk.find(b"\n", start)
+        
+        if start < len(chunk) and not self._skipping:
+            self._pending.append(chunk[start:])
+            self._pending_size += len(chunk) - start
+            if self._pending_size > self.max_line_bytes:
+                lines.append(self._line(b""))
+                self._skipping = True
+        return lines
+
+
+def _parse_stream_row(
+    line: bytes,
+    index: int
+) -> Tuple[Dict[str, Any], str, str, Optional[List[str]]]:
+    """
+    Parse one NDJSON comparison row
+
+    Each row is {"question": {...}, "model_answer": "...",
+    "benchmark_answer": "...", "accepted_answers": [...]}; the benchmark
+    answer defaults to question["correct_answer"].
+    """
+    row = json.loads(line)
+    if not isinstance(row, dict):
+        raise ValueError("row must be a JSON object")
+
+    question = row.get("question") or {}
+    if not isinstance(question, dict):
+        raise ValueError("question must be a JSON object")
+    for field in ("domain", "difficulty"):
+        if not isinstance(question.get(field, ""), str):
+            raise ValueError(f"question.{field} must be a string")
+    _check_string_list(question.get("options"), "question.options")
+
+    model_answer = row.get("model_answer")
+    benchmark_answer = row.get("benchmark_answer") or question.get("correct_answer")
+    accepted_answers = row.get("accepted_answers")
+
+    if not isinstance(model_answer, str):
+        raise ValueError("model_answer must be a string")
+    if not isinstance(benchmark_answer, str):
+        raise ValueError("benchmark_answer (or question.correct_answer) must be a string")
+    _check_string_list(accepted_answers, "accepted_answers")
+
+    if "question_id" not in question:
+        question = {**question, "question_id": f"Q{index+1}"}
+
+    return question, model_answer, benchmark_answer, accepted_answers
+
+
+def _check_string_list(value: Any, name: str) -> None:
+    """Raise ValueError unless value is None or a list of strings."""
+    if value is None:
+        return
+    if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+        raise ValueError(f"{name} must be a list of strings")
+
+
+def _score_stream_rows(
+    rows: List[Tuple[int, Tuple[Dict[str, Any], str, str, Optional[List[str]]]]],
+    scoring_mode: ScoringMode
+) -> List[Dict[str, Any]]:
+    """
+    Score a chunk of parsed stream rows, keeping their stream indices
+    """
+    questions = [row[0] for _, row in rows]
+    accepted = [row[3] or [] for _, row in rows]
+    batch = _score_answers(
+        model_answers=[row[1] for _, row in rows],
+        benchmark_answers=[row[2] for _, row in rows],
+        questions=questions,
+        scoring_mode=scoring_mode,
+        accepted_answers=accepted if any(accepted) else None
+    )
+    
+    details = []
+    for (index, _), detail in zip(rows, batch.iter_details()):
+        detail["index"] = index
+        details.append(detail)
+    return details
+
+
+@router.post("/compare-answers/stream")
+async def compare_answers_stream(
+    request: Request,
+    scoring_mode: ScoringMode = Query(default=ScoringMode.DEFAULT, description="Scoring mode")
+):
+    """
+    Stream answer comparisons as NDJSON
+    
+    The request body is NDJSON, one row per line:
+    {"question": {...}, "model_answer": "...", "benchmark_answer": "..."}
+    
+    Each row's detailed comparison is written back as soon as it is scored
+    (rows that cannot be parsed, or are longer than
+    SIMULATION_STREAM_MAX_LINE_BYTES, produce {"index": ..., "error": ...}).
+    The last line is {"summary": {...}} with the aggregate accuracy.
+    Scoring stops as soon as the client disconnects.
+    """
+    max_line_bytes = getattr(settings, "stream_max_line_bytes", 1024 * 1024)
+    body = _NdjsonBody(request, max_line_bytes)
+    
+    async def client_gone() -> bool:
+        # is_disconnected() consumes a receive message, so it is only safe
+        # once the body is read; until then batches() sees disconnects
+        return body.complete and await request.is_disconnected()
+    
+    async def results() -> AsyncIterator[str]:
+        summary = ComparisonSummary()
+        index = 0
+        
+        try:
+            async for lines in body.batches():
+                for start in range(0, len(lines), STREAM_CHUNK_SIZE):
+                    if await client_gone():
+                        raise ClientDisconnect()
+                    
+                    rows = []
+                    for line in lines[start:start + STREAM_CHUNK_SIZE]:
+                        try:
+                            if line is None:
+                                raise ValueError(f"row exceeds {max_line_bytes} bytes")
+                            rows.append((index, _parse_stream_row(line, index)))
+                        except (ValueError, TypeError) as e:
+                            summary.add_error()
+                            yield json.dumps({"index": index, "error": str(e)}) + "\n"
+                        index += 1
+                    
+                    if not rows:
+                        continue
+                    
+                    try:
+                        details = await _run_stage("compare", _score_stream_rows, rows, scoring_mode)
+                    except Exception as e:
+                        # The status line is already sent; report the chunk's rows
+                        # as failed and keep streaming
+                        error = e.detail if isinstance(e, HTTPException) else str(e)
+                        logger.error(f"Failed to score stream rows: {error}")
+                        for row_index, _ in rows:
+                            summary.add_error()
+                            yield json.dumps({"index": row_index, "error": error}) + "\n"
+                        continue
+                    
+                    for detail in details:
+                        summary.add(detail)
+                        yield json.dumps(detail) + "\n"
+        except ClientDisconnect:
+            logger.info(f"Client disconnected after {index} streamed rows; stopping")
+            return
+        
+        logger.info(f"Streamed {summary.total_count} comparisons ({summary.error_count} errors)")
+        yield json.dumps({"summary": summary.to_dict()}) + "\n"
+    
+    return DuplexStreamingResponse(results(), media_type="application/x-ndjson")
+
+
+def _analyze_errors(
+    comparison_results: ComparisonResult,
+    questions: QuestionSet
+) -> ErrorAnalysisResponse:
+    """
+    Categorize incorrect answers and suggest improvements
+    """
+    logger.info("Analyzing errors")
+    
+    # Simple error categorization
+    error_types = {}
+    error_examples = []
+    option_tables = questions.option_tables
+    
+    for comp in comparison_results.detailed_comparisons:
+        if not comp.is_correct:
+            # Categorize by domain
+            error_type = f"{comp.domain}_error"
+            error_types[error_type] = error_types.get(error_type, 0) + 1
+    
+            # Add to examples (limit to 5)
+            if len(error_examples) < 5:
+                q = questions[comp.index]
+                table = option_tables[comp.index]
+                model_letter = (
+                    answer_comparator.answer_extractor.extract(comp.model_answer, table)
+                    if table else None
+                )
+                error_examples.append(
+                    ErrorExample(
+                        question_id=comp.question_id,
+                        question_text=q.get("question_text", ""),
+                        model_answer=comp.model_answer,
+                        correct_answer=comp.benchmark_answer,
+                        model_option=table.option(model_letter) if model_letter else None,
+                        error_type=error_type,
+                        domain=comp.domain,
+                        difficulty=comp.difficulty
+                    )
+                )
+    
+    # Generate improvement suggestions
+    suggestions = []
+    if comparison_results.accuracy < 0.7:
+        suggestions.append("Model accuracy is below 70%. Consider additional training or fine-tuning.")
+    
+    most_common_error = max(error_types.items(), key=lambda x: x[1])[0] if error_types else None
+    if most_common_error:
+        domain = most_common_error.replace("_error", "")
+        suggestions.append(f"Focus on improving {domain} domain knowledge - highest error rate detected here.")
+    
+    if comparison_results.accuracy_by_difficulty.get("hard", 0) < 0.5:
+        suggestions.append("Performance on hard questions is weak. Consider more challenging training data.")
+    
+    return ErrorAnalysisResponse(
+        total_errors=comparison_results.incorrect_count,
+        error_types=error_types,
+        error_examples=error_examples,
+        improvement_suggestions=suggestions
+    )
+
+
 @router.post("/run", response_model=SimulationResponse)
 async def run_simulation(request: SimulationRunRequest):
     """
@@ -209,7 +828,9 @@ async def run_simulation(request: SimulationRunRequest):
     - **model_type**: Type of model
     - **model_name**: Name of the model being tested
     - **questions**: Optional pre-generated questions
+    - **question_set_id**: Optional cached question set (from an earlier response)
     - **model_answers**: Optional model answers for comparison
+    - **scoring_mode**: "default", "mcq" (integer-coded option scoring) or "vector" (hashed word-vector cosine)
     
     Returns complete simulation results with metrics and error analysis
     """
@@ -221,27 +842,56 @@ async def run_simulation(request: SimulationRunRequest):
         errors = []
         
         # Step 1: Generate or use provided questions
-        if request.questions:
-            questions = request.questions
+        seed = None
+        dedup_counts = None
+        model_answers = request.model_answers
+        if request.question_set_id:
+            questions = await _cached_question_set(request.question_set_id)
+            set_id = request.question_set_id
+            logger.info(f"Using cached question set {set_id}")
+        elif request.questions:
+            # Collapse duplicates, keeping the first copy and its model
+            # answer, then cache the set (hashes and may persist it)
+            def ingest():
+                kept, dedup_report = dedupe_questions(
+                    request.questions,
+                    mode=request.dedup.value,
+                    near_threshold=getattr(settings, "dedup_near_threshold", 0.8)
+                )
+                set_id, questions = question_set_cache.put(
+                    QuestionSet(request.questions[i] for i in kept)
+                )
+                return kept, dedup_report, set_id, questions
+            
+            kept, dedup_report, set_id, questions = await _run_stage("questions", ingest)
+            if len(kept) < len(request.questions):
+                warnings.append(
+                    f"Dropped {len(request.questions) - len(kept)} duplicate questions "
+                    f"({dedup_report.duplicates} exact, {dedup_report.near_duplicates} near)"
+                )
+                if model_answers and len(model_answers) == len(request.questions):
+                    model_answers = [model_answers[i] for i in kept]
+            dedup_counts = dedup_report.to_dict()
             logger.info(f"Using {len(questions)} provided questions")
         else:
             logger.info(f"Generating {request.num_questions} questions")
-            questions = question_generator.generate(
-                num_questions=request.num_questions,
-                difficulty=request.difficulty.value,
-                domains=request.domains,
-                model_type=request.model_type
+            set_id, questions, seed, dedup_counts = await _run_stage(
+                "questions", _generate_question_set, request
             )
         
         # Step 2: Load benchmark answers
-        logger.info("Loading benchmark answers")
-        benchmark_answers = benchmark_loader.load_benchmark_answers(
-            questions=questions,
-            source="auto"
-        )
+        def load() -> Tuple[List[str], List[QuestionResponse]]:
+            logger.info("Loading benchmark answers")
+            benchmark_answers = benchmark_loader.load_benchmark_answers(
+                questions=questions,
+                source="auto",
+                canonical=True
+            )
+            
+            # Convert questions to response format
+            return benchmark_answers, [QuestionResponse(**q) for q in questions]
         
-        # Convert questions to response format
-        question_responses = [QuestionResponse(**q) for q in questions]
+        benchmark_answers, question_responses = await _run_stage("benchmarks", load)
         
         # Step 3: Compare answers if model answers provided
         comparison_results = None
@@ -250,125 +900,42 @@ async def run_simulation(request: SimulationRunRequest):
         simulation_passed = False
         simulation_accuracy = 0.0
         
-        if request.model_answers:
+        if model_answers:
             logger.info("Comparing model answers")
             
-            if len(request.model_answers) != len(questions):
+            if len(model_answers) != len(questions):
                 warnings.append(
-                    f"Model answer count ({len(request.model_answers)}) does not match question count ({len(questions)})"
+                    f"Model answer count ({len(model_answers)}) does not match question count ({len(questions)})"
                 )
             else:
-                # Compare answers
-                comp_results = answer_comparator.compare(
-                    model_answers=request.model_answers,
-                    benchmark_answers=benchmark_answers,
-                    questions=questions
-                )
-                
-                detailed_comparisons = [
-                    DetailedComparison(**comp) for comp in comp_results["detailed_comparisons"]
-                ]
-                
-                comparison_results = ComparisonResult(
-                    correct_indices=comp_results["correct_indices"],
-                    incorrect_indices=comp_results["incorrect_indices"],
-                    correct_count=comp_results["correct_count"],
-                    incorrect_count=comp_results["incorrect_count"],
-                    total_count=comp_results["total_count"],
-                    accuracy=comp_results["accuracy"],
-                    detailed_comparisons=detailed_comparisons
-                )
-                
-                # Calculate metrics
-                simulation_accuracy = comp_results["accuracy"]
-                
-                # Calculate domain and difficulty breakdowns
-                accuracy_by_domain = {}
-                accuracy_by_difficulty = {}
-                
-                for comp in comp_results["detailed_comparisons"]:
-                    domain = comp["domain"]
-                    difficulty = comp["difficulty"]
-                    
-                    if domain not in accuracy_by_domain:
-                        accuracy_by_domain[domain] = {"correct": 0, "total": 0}
-                    if difficulty not in accuracy_by_difficulty:
-                        accuracy_by_difficulty[difficulty] = {"correct": 0, "total": 0}
+                # Compare answers, then calculate metrics and analyze errors
+                def compare() -> Tuple[ComparisonResult, MetricsResponse, Optional[ErrorAnalysisResponse]]:
+                    batch = _score_answers(
+                        model_answers=model_answers,
+                        benchmark_answers=benchmark_answers,
+                        questions=questions,
+                        scoring_mode=request.scoring_mode,
+                        accepted_answers=_accepted_answers(questions, benchmark_answers)
+                    )
+                    comparison_results = _build_comparison_result(batch)
                     
-                    accuracy_by_domain[domain]["total"] += 1
-                    accuracy_by_difficulty[difficulty]["total"] += 1
+                    metrics = MetricsResponse(
+                        accuracy=comparison_results.accuracy,
+                        correct_count=comparison_results.correct_count,
+                        incorrect_count=comparison_results.incorrect_count,
+                        total_count=comparison_results.total_count,
+                        accuracy_by_domain=comparison_results.accuracy_by_domain,
+                        accuracy_by_difficulty=comparison_results.accuracy_by_difficulty
+                    )
                     
-                    if comp["is_correct"]:
-                        accuracy_by_domain[domain]["correct"] += 1
-                        accuracy_by_difficulty[difficulty]["correct"] += 1
+                    # Analyze errors if there are any
+                    error_analysis = None
+                    if comparison_results.incorrect_count > 0:
+                        error_analysis = _analyze_errors(comparison_results, questions)
+                    return comparison_results, metrics, error_analysis
                 
-                # Calculate percentages
-                domain_accuracy = {
-                    domain: stats["correct"] / stats["total"] if stats["total"] > 0 else 0
-                    for domain, stats in accuracy_by_domain.items()
-                }
-                difficulty_accuracy = {
-                    diff: stats["correct"] / stats["total"] if stats["total"] > 0 else 0
-                    for diff, stats in accuracy_by_difficulty.items()
-                }
-                
-                metrics = MetricsResponse(
-                    accuracy=simulation_accuracy,
-                    correct_count=comp_results["correct_count"],
-                    incorrect_count=comp_results["incorrect_count"],
-                    total_count=comp_results["total_count"],
-                    accuracy_by_domain=domain_accuracy,
-                    accuracy_by_difficulty=difficulty_accuracy
-                )
-                
-                # Analyze errors if there are any
-                if comp_results["incorrect_count"] > 0:
-                    logger.info("Analyzing errors")
-                    
-                    # Simple error categorization
-                    error_types = {}
-                    error_examples = []
-                    
-                    for comp in comp_results["detailed_comparisons"]:
-                        if not comp["is_correct"]:
-                            # Categorize by domain
-                            error_type = f"{comp['domain']}_error"
-                            error_types[error_type] = error_types.get(error_type, 0) + 1
-                            
-                            # Add to examples (limit to 5)
-                            if len(error_examples) < 5:
-                                q = questions[comp["index"]]
-                                error_examples.append(
-                                    ErrorExample(
-                                        question_id=comp["question_id"],
-                                        question_text=q.get("question_text", ""),
-                                        model_answer=comp["model_answer"],
-                                        correct_answer=comp["benchmark_answer"],
-                                        error_type=error_type,
-                                        domain=comp["domain"],
-                                        difficulty=comp["difficulty"]
-                                    )
-                                )
-                    
-                    # Generate improvement suggestions
-                    suggestions = []
-                    if simulation_accuracy < 0.7:
-                        suggestions.append("Model accuracy is below 70%. Consider additional training or fine-tuning.")
-                    
-                    most_common_error = max(error_types.items(), key=lambda x: x[1])[0] if error_types else None
-                    if most_common_error:
-                        domain = most_common_error.replace("_error", "")
-                        suggestions.append(f"Focus on improving {domain} domain knowledge - highest error rate detected here.")
-                    
-                    if difficulty_accuracy.get("hard", 0) < 0.5:
-                        suggestions.append("Performance on hard questions is weak. Consider more challenging training data.")
-                    
-                    error_analysis = ErrorAnalysisResponse(
-                        total_errors=comp_results["incorrect_count"],
-                        error_types=error_types,
-                        error_examples=error_examples,
-                        improvement_suggestions=suggestions
-                    )
+                comparison_results, metrics, error_analysis = await _run_stage("compare", compare)
+                simulation_accuracy = comparison_results.accuracy
                 
                 # Determine if simulation passed (e.g., 80% threshold)
                 simulation_passed = simulation_accuracy >= 0.8
@@ -383,9 +950,12 @@ async def run_simulation(request: SimulationRunRequest):
         return SimulationResponse(
             session_id=session_id,
             status="completed",
+            seed=seed,
+            question_set_id=set_id,
+            dedup=DedupCounts(**dedup_counts) if dedup_counts else None,
             questions=question_responses,
             benchmark_answers=benchmark_answers,
-            model_answers=request.model_answers,
+            model_answers=model_answers,
             comparison_results=comparison_results,
             metrics=metrics,
             error_analysis=error_analysis,
@@ -396,6 +966,8 @@ async def run_simulation(request: SimulationRunRequest):
             errors=errors
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error running simulation: {str(e)}")
         raise HTTPException(
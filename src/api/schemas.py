@@ -22,11 +22,27 @@ class QuestionType(str, Enum):
     TRUE_FALSE = "true_false"
 
 
+class ScoringMode(str, Enum):
+    """Answer scoring modes"""
+    DEFAULT = "default"
+    MCQ = "mcq"
+    VECTOR = "vector"
+
+
+class DedupMode(str, Enum):
+    """Duplicate question handling"""
+    NONE = "none"
+    EXACT = "exact"
+    NEAR = "near"
+
+
 class BenchmarkSource(str, Enum):
     """Sources for benchmark answers"""
     AUTO = "auto"
     QUESTIONS = "questions"
     FILE = "file"
+    SQLITE = "sqlite"
+    JOURNAL = "journal"
     MEDAGENTGYM = "medagentgym"
 
 
@@ -36,10 +52,13 @@ class BenchmarkSource(str, Enum):
 
 class QuestionGenerateRequest(BaseModel):
     """Request to generate clinical questions"""
-    num_questions: int = Field(default=50, ge=1, le=500, description="Number of questions to generate")
+    num_questions: int = Field(default=50, ge=1, le=10000, description="Number of questions to generate")
     difficulty: DifficultyLevel = Field(default=DifficultyLevel.VARIED, description="Question difficulty level")
     domains: Optional[List[str]] = Field(default=None, description="Medical domains (e.g., cardiology, neurology)")
     model_type: str = Field(default="general", description="Type of model being tested")
+    seed: Optional[int] = Field(default=None, description="Random seed; the same seed reproduces the same question set")
+    stratified: bool = Field(default=False, description="Exact per-domain/difficulty quotas instead of independent draws")
+    dedup: DedupMode = Field(default=DedupMode.NONE, description="Reject duplicate (exact) or also near-duplicate (near) questions")
 
     class Config:
         json_schema_extra = {
@@ -52,9 +71,15 @@ class QuestionGenerateRequest(BaseModel):
         }
 
 
+class QuestionStreamRequest(QuestionGenerateRequest):
+    """Request to stream generated clinical questions as NDJSON"""
+    num_questions: int = Field(default=1000, ge=1, le=1000000, description="Number of questions to stream")
+
+
 class BenchmarkLoadRequest(BaseModel):
     """Request to load benchmark answers"""
-    questions: List[Dict[str, Any]] = Field(..., description="List of question dictionaries")
+    questions: Optional[List[Dict[str, Any]]] = Field(default=None, description="List of question dictionaries")
+    question_set_id: Optional[str] = Field(default=None, description="Cached question set to use instead of questions")
     source: BenchmarkSource = Field(default=BenchmarkSource.AUTO, description="Source for benchmark answers")
 
     class Config:
@@ -75,8 +100,12 @@ class BenchmarkLoadRequest(BaseModel):
 class CompareAnswersRequest(BaseModel):
     """Request to compare model answers with benchmarks"""
     model_answers: List[str] = Field(..., description="Answers generated by the model")
-    benchmark_answers: List[str] = Field(..., description="Correct benchmark answers")
-    questions: List[Dict[str, Any]] = Field(..., description="Original questions")
+    benchmark_answers: Optional[List[str]] = Field(default=None, description="Correct benchmark answers (loaded for the questions when omitted)")
+    questions: Optional[List[Dict[str, Any]]] = Field(default=None, description="Original questions")
+    question_set_id: Optional[str] = Field(default=None, description="Cached question set to use instead of questions")
+    accepted_answers: Optional[List[List[str]]] = Field(default=None, description="Acceptable alternate answers per question (optional)")
+    scoring_mode: ScoringMode = Field(default=ScoringMode.DEFAULT, description="Scoring mode (default, mcq or vector)")
+    include_details: bool = Field(default=True, description="Include per-question detailed comparisons")
 
     class Config:
         json_schema_extra = {
@@ -98,12 +127,17 @@ class SimulationRunRequest(BaseModel):
     domains: Optional[List[str]] = Field(default=None, description="Medical domains to test")
     model_type: str = Field(default="general", description="Model type")
     model_name: Optional[str] = Field(default="SimulationModel", description="Name of the model being tested")
+    seed: Optional[int] = Field(default=None, description="Random seed for question generation")
+    stratified: bool = Field(default=False, description="Exact per-domain/difficulty quotas for generated questions")
+    dedup: DedupMode = Field(default=DedupMode.NONE, description="Drop duplicate (exact) or also near-duplicate (near) questions")
     
-    # Optional: provide pre-generated questions
+    # Optional: provide pre-generated questions, inline or by cached set id
     questions: Optional[List[Dict[str, Any]]] = Field(default=None, description="Pre-generated questions (optional)")
+    question_set_id: Optional[str] = Field(default=None, description="Cached question set from an earlier response (optional)")
     
     # Optional: provide model answers for comparison
     model_answers: Optional[List[str]] = Field(default=None, description="Model answers (optional, for testing)")
+    scoring_mode: ScoringMode = Field(default=ScoringMode.DEFAULT, description="Scoring mode (default, mcq or vector)")
 
     class Config:
         json_schema_extra = {
@@ -130,20 +164,33 @@ class QuestionResponse(BaseModel):
     question_type: str
     options: List[str]
     correct_answer: str
+    accepted_answers: List[str] = Field(default_factory=list)
     explanation: str
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
+class DedupCounts(BaseModel):
+    """Duplicate detection counts for a question set"""
+    checked: int
+    unique: int
+    duplicates: int
+    near_duplicates: int
+
+
 class QuestionGenerateResponse(BaseModel):
     """Response from question generation"""
     questions: List[QuestionResponse]
     count: int
+    seed: int
+    question_set_id: Optional[str] = None
+    dedup: Optional[DedupCounts] = None
     message: str = "Questions generated successfully"
 
 
 class BenchmarkLoadResponse(BaseModel):
     """Response from benchmark loading"""
     benchmark_answers: List[str]
+    accepted_answers: Optional[List[List[str]]] = None
     count: int
     source_used: str
     message: str = "Benchmark answers loaded successfully"
@@ -170,6 +217,8 @@ class ComparisonResult(BaseModel):
     total_count: int
     accuracy: float
     detailed_comparisons: List[DetailedComparison]
+    accuracy_by_domain: Dict[str, float] = Field(default_factory=dict)
+    accuracy_by_difficulty: Dict[str, float] = Field(default_factory=dict)
 
 
 class MetricsResponse(BaseModel):
@@ -188,6 +237,7 @@ class ErrorExample(BaseModel):
     question_text: str
     model_answer: str
     correct_answer: str
+    model_option: Optional[str] = Field(default=None, description="Full text of the option the model chose, if any")
     error_type: str
     domain: str
     difficulty: str
@@ -205,6 +255,9 @@ class SimulationResponse(BaseModel):
     """Complete simulation results"""
     session_id: str
     status: str
+    seed: Optional[int] = None
+    question_set_id: Optional[str] = None
+    dedup: Optional[DedupCounts] = None
     questions: List[QuestionResponse]
     benchmark_answers: List[str]
     model_answers: Optional[List[str]] = None
@@ -6,10 +6,17 @@ from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
+from contextlib import asynccontextmanager
 import logging
 from datetime import datetime
 
-from src.api.routes.simulation_routes import router as simulation_router
+from src.api.routes.simulation_routes import (
+    router as simulation_router,
+    answer_comparator,
+    benchmark_loader,
+    execution,
+    question_generator,
+)
 
 # Configure logging
 logging.basicConfig(
@@ -18,6 +25,28 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Run on application startup and shutdown
+    """
+    logger.info("=" * 60)
+    logger.info("Simulation Agent API Starting...")
+    logger.info("=" * 60)
+    logger.info("Version: 1.0.0")
+    logger.info("Docs available at: /docs")
+    logger.info("=" * 60)
+    
+    yield
+    
+    logger.info("Simulation Agent API Shutting Down...")
+    answer_comparator.close()
+    benchmark_loader.close()
+    question_generator.close()
+    execution.shutdown()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Simulation Agent API",
@@ -41,7 +70,8 @@ app = FastAPI(
     },
     license_info={
         "name": "MIT",
-    }
+    },
+    lifespan=lifespan
 )
 
 # Configure CORS - Allow all origins for easy sharing
@@ -104,29 +134,6 @@ async def general_exception_handler(request: Request, exc: Exception):
     )
 
 
-# Startup event
-@app.on_event("startup")
-async def startup_event():
-    """
-    Run on application startup
-    """
-    logger.info("=" * 60)
-    logger.info("Simulation Agent API Starting...")
-    logger.info("=" * 60)
-    logger.info("Version: 1.0.0")
-    logger.info("Docs available at: /docs")
-    logger.info("=" * 60)
-
-
-# Shutdown event
-@app.on_event("shutdown")
-async def shutdown_event():
-    """
-    Run on application shutdown
-    """
-    logger.info("Simulation Agent API Shutting Down...")
-
-
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -0,0 +1,75 @@
+"""
+Simulation Agent API settings
+
+Values are read from environment variables prefixed with ``SIMULATION_``
+(e.g. ``SIMULATION_PARALLEL_WORKERS=4``) or from a local ``.env`` file.
+"""
+
+from typing import Optional
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class SimulationSettings(BaseSettings):
+    """Runtime configuration passed to the simulation agent tools"""
+
+    model_config = SettingsConfigDict(
+        env_prefix="SIMULATION_",
+        env_file=".env",
+        extra="ignore",
+    )
+
+    # Benchmarks
+    benchmark_data_path: str = "data/benchmarks"
+    benchmark_cache_size: int = 32
+    benchmark_cache_bytes: int = 64 * 1024 * 1024
+    benchmark_index_poll_interval: float = 2.0
+    benchmark_stream_threshold_bytes: int = 32 * 1024 * 1024
+    benchmark_store_path: Optional[str] = None
+    benchmark_version: Optional[str] = None
+    benchmark_journal_compact_bytes: int = 8 * 1024 * 1024
+
+    # MedAgentGym benchmark service
+    use_medagentgym: bool = False
+    medagentgym_url: str = "http://127.0.0.1:8765"
+    medagentgym_api_key: Optional[str] = None
+    medagentgym_batch_size: int = 100
+    medagentgym_max_concurrency: int = 8
+    medagentgym_timeout: float = 10.0
+    medagentgym_retries: int = 2
+    medagentgym_cache_path: str = "data/medagentgym_cache.sqlite3"
+    medagentgym_cache_ttl: float = 86_400.0
+
+    # Question templates (JSON Lines or SQLite catalog; built-ins when absent)
+    question_template_catalog: Optional[str] = "data/templates/question_templates.jsonl"
+    question_template_poll_interval: float = 2.0
+    dedup_near_threshold: float = 0.8
+    dedup_stream_window: int = 100_000
+
+    # Question set cache (question_set_id -> questions)
+    question_set_cache_size: int = 128
+    question_set_cache_max_questions: int = 200_000
+    question_set_cache_dir: Optional[str] = None
+
+    # Answer comparison
+    similarity_backend: str = "difflib"
+    comparison_cache_size: int = 100_000
+    comparison_cache_bytes: int = 32 * 1024 * 1024
+    vector_threshold: float = 0.7
+    stream_max_line_bytes: int = 1024 * 1024
+
+    # Execution layer: route stages run on a bounded thread pool
+    # ("inline" runs them on the event loop)
+    execution_mode: str = "thread"
+    execution_questions_concurrency: int = 2
+    execution_benchmarks_concurrency: int = 4
+    execution_compare_concurrency: int = 2
+    execution_max_queue: int = 64
+
+    # Process-pool scoring for large free-text batches (0 workers disables)
+    parallel_workers: int = 0
+    parallel_min_batch: int = 5_000
+    parallel_chunk_size: int = 2_000
+
+
+settings = SimulationSettings()
@@ -0,0 +1,74 @@
+"""
+Tests for the memory-mapped .bmk benchmark format
+"""
+
+import struct
+
+import pytest
+
+from agents.agent_2_simulation.tools.benchmark_binary import (
+    MappedBenchmark,
+    write_binary_benchmark,
+)
+from agents.agent_2_simulation.tools.benchmark_loader import BenchmarkLoader
+from src.config.settings import SimulationSettings
+
+ANSWERS = {"Q2": "B) Pulmonary embolism", "Q1": "A) Myocardial infarction", "Q10": "C) É"}
+
+
+def _write(tmp_path, answers=ANSWERS):
+    return write_binary_benchmark(answers, str(tmp_path / "benchmarks.bmk"))
+
+
+def test_round_trip(tmp_path):
+    benchmark = MappedBenchmark(_write(tmp_path))
+    try:
+        assert dict(benchmark) == ANSWERS
+        assert list(benchmark) == sorted(ANSWERS)
+        assert len(benchmark) == 3
+        assert "Q10" in benchmark and "Q3" not in benchmark and 1 not in benchmark
+        with pytest.raises(KeyError):
+            benchmark["Q3"]
+    finally:
+        benchmark.close()
+
+
+def test_loader_reads_binary_file(tmp_path):
+    settings = SimulationSettings(
+        benchmark_data_path=str(tmp_path),
+        benchmark_index_poll_interval=0,
+    )
+    loader = BenchmarkLoader(settings)
+    try:
+        _write(tmp_path)
+        questions = [{"question_id": "Q10"}, {"question_id": "Q1"}]
+        assert loader.load_benchmark_answers(questions, source="file") == ["C) É", "A) Myocardial infarction"]
+    finally:
+        loader.close()
+
+
+@pytest.mark.parametrize(
+    "corrupt",
+    [
+        lambda data: data[:3],
+        lambda data: b"XXXX" + data[4:],
+        lambda data: data[:20],
+        lambda data: data[:8] + struct.pack("<I", 1 << 30) + data[12:],
+        lambda data: data[:-5],
+        lambda data: data[:8] + struct.pack("<Q", 1 << 40) + data[16:],
+    ],
+    ids=["short", "magic", "truncated-index", "huge-count", "truncated-blob", "bad-offset"],
+)
+def test_corrupt_file_raises_value_error(tmp_path, corrupt):
+    path = _write(tmp_path)
+    with open(path, "rb") as f:
+        data = f.read()
+    with open(path, "wb") as f:
+        f.write(corrupt(data))
+
+    with pytest.raises(ValueError):
+        benchmark = MappedBenchmark(path)
+        try:
+            dict(benchmark)
+        finally:
+            benchmark.close()
@@ -0,0 +1,109 @@
+"""
+Tests for the append-only benchmark journal and its snapshot compaction
+"""
+
+import json
+import os
+
+import pytest
+
+from agents.agent_2_simulation.tools.benchmark_journal import BenchmarkJournal
+from agents.agent_2_simulation.tools.benchmark_loader import BenchmarkLoader
+from src.config.settings import SimulationSettings
+
+
+@pytest.fixture
+def journal(tmp_path):
+    return BenchmarkJournal(str(tmp_path / "journal"), compact_bytes=0)
+
+
+def test_append_lookup_and_compact_round_trip(journal):
+    journal.append([("Q1", "A) one"), ("Q2", "B) two")])
+    journal.append([("Q2", "C) updated")])
+
+    assert journal.lookup(["Q1", "Q2", "Q3"]) == {"Q1": "A) one", "Q2": "C) updated"}
+
+    assert journal.compact() == 2
+    assert not os.path.exists(journal.journal_path)
+    assert journal.stats() == {"journal_entries": 0, "snapshot_entries": 2}
+
+    journal.append([("Q1", "D) newer")])
+    assert journal.lookup(["Q1", "Q2"]) == {"Q1": "D) newer", "Q2": "C) updated"}
+
+
+def test_empty_answers_are_not_written(journal):
+    assert journal.append([("Q1", ""), ("Q2", None), (None, "A) x")]) == 0
+    assert not journal.has_entries
+    assert journal.lookup(["Q1", "Q2"]) == {}
+
+
+def test_empty_answers_do_not_shadow_file(tmp_path):
+    settings = SimulationSettings(
+        benchmark_data_path=str(tmp_path / "benchmarks"),
+        benchmark_index_poll_interval=0,
+    )
+    loader = BenchmarkLoader(settings)
+    try:
+        with open(f"{loader.benchmark_data_path}/benchmarks.json", "w", encoding="utf-8") as f:
+            json.dump({"Q1": "B) file answer", "Q2": "C) two"}, f)
+        questions = [{"question_id": "Q1"}, {"question_id": "Q2"}]
+
+        loader.save_benchmark_file(questions, fmt="journal")
+        # Lines with empty answers written by older versions are ignored too
+        os.makedirs(loader._journal.directory, exist_ok=True)
+        with open(loader._journal.journal_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"question_id": "Q2", "answer": ""}) + "\n")
+
+        assert loader.load_benchmark_answers(questions) == ["B) file answer", "C) two"]
+    finally:
+        loader.close()
+
+
+def test_torn_line_is_skipped(journal):
+    journal.append([("Q1", "A) one")])
+    with open(journal.journal_path, "a", encoding="utf-8") as f:
+        # Partial write from one process followed by another's append
+        f.write('{"question_id": "Q2", "ans')
+        f.write(json.dumps({"question_id": "Q3", "answer": "C) three"}) + "\n")
+        f.write('["not", "an", "entry"]\n')
+    journal.append([("Q4", "D) four")])
+
+    assert journal.lookup(["Q1", "Q2", "Q3", "Q4"]) == {"Q1": "A) one", "Q4": "D) four"}
+    assert journal.compact() == 2
+
+
+def test_entries_written_by_another_process_are_seen(tmp_path):
+    directory = str(tmp_path / "journal")
+    reader = BenchmarkJournal(directory, compact_bytes=0)
+    assert not reader.has_entries
+
+    BenchmarkJournal(directory, compact_bytes=0).append([("Q1", "A) one")])
+
+    assert reader.has_entries
+    assert reader.lookup(["Q1"]) == {"Q1": "A) one"}
+
+
+def test_compaction_resumes_interrupted_run(journal):
+    journal.append([("Q1", "A) old"), ("Q2", "B) two")])
+    journal.compact()
+    # Interrupted compaction: journal renamed aside but never merged
+    journal.append([("Q1", "A) pending"), ("Q3", "C) three")])
+    os.replace(journal.journal_path, journal.compacting_path)
+    journal.append([("Q3", "C) newest")])
+
+    assert journal.lookup(["Q1", "Q2", "Q3"]) == {
+        "Q1": "A) pending",
+        "Q2": "B) two",
+        "Q3": "C) newest",
+    }
+
+    assert journal.compact() == 3
+    assert not os.path.exists(journal.compacting_path)
+    assert journal.lookup(["Q1", "Q3"]) == {"Q1": "A) pending", "Q3": "C) newest"}
+
+    assert journal.compact() == 3
+    assert journal.lookup(["Q1", "Q2", "Q3"]) == {
+        "Q1": "A) pending",
+        "Q2": "B) two",
+        "Q3": "C) newest",
+    }
@@ -0,0 +1,90 @@
+"""
+Tests for benchmark file discovery and caching in BenchmarkLoader
+"""
+
+import json
+import os
+
+import pytest
+
+from agents.agent_2_simulation.tools.benchmark_loader import BenchmarkLoader
+from src.config.settings import SimulationSettings
+
+QUESTIONS = [{"question_id": "Q1", "domain": "cardiology"}]
+
+
+@pytest.fixture
+def loader(tmp_path):
+    # Long poll interval: the directory index stays stale during the test
+    settings = SimulationSettings(
+        benchmark_data_path=str(tmp_path),
+        benchmark_index_poll_interval=3600,
+    )
+    loader = BenchmarkLoader(settings)
+    yield loader
+    loader.close()
+
+
+def _write(path, answers):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(answers, f)
+
+
+def test_deleted_file_falls_back_to_remaining_file(loader, tmp_path):
+    _write(tmp_path / "benchmarks.json", {"Q1": "A) default"})
+    _write(tmp_path / "cardiology_benchmarks.json", {"Q1": "B) domain"})
+    loader._benchmark_index.refresh(force=True)
+
+    os.unlink(tmp_path / "benchmarks.json")
+
+    assert loader.load_benchmark_answers(QUESTIONS, source="file") == ["B) domain"]
+
+
+def test_deleted_only_file_falls_back_to_question_data(loader, tmp_path):
+    _write(tmp_path / "benchmarks.json", {"Q1": "A) default"})
+    loader._benchmark_index.refresh(force=True)
+
+    os.unlink(tmp_path / "benchmarks.json")
+    questions = [{"question_id": "Q1", "options": ["A) x", "B) y"], "correct_answer": "B"}, {"question_id": "Q2"}]
+
+    assert loader.load_benchmark_answers(questions)[0] == "B) y"
+    with pytest.raises(FileNotFoundError):
+        loader.load_benchmark_answers(questions, source="file")
+
+
+def test_edited_file_is_reparsed(loader, tmp_path):
+    path = tmp_path / "benchmarks.json"
+    _write(path, {"Q1": "A) old"})
+    loader._benchmark_index.refresh(force=True)
+    assert loader.load_benchmark_answers(QUESTIONS, source="file") == ["A) old"]
+
+    _write(path, {"Q1": "B) newer answer"})
+
+    assert loader.load_benchmark_answers(QUESTIONS, source="file") == ["B) newer answer"]
+    assert loader.cache_stats()["benchmark_files"]["invalidations"] == 1
+
+
+class _StubMedAgentGym:
+    def __init__(self, answers):
+        self.answers = answers
+
+    def get_benchmark_answers(self, questions):
+        return [self.answers.get(q["question_id"]) for q in questions]
+
+    def close(self):
+        pass
+
+
+def test_medagentgym_unknown_ids_fall_back_to_normalized_question_data(loader):
+    loader._medagentgym = _StubMedAgentGym({"Q1": "A) service"})
+    questions = [
+        {"question_id": "Q1"},
+        {"question_id": "Q2", "options": ["A) x", "B) y"], "correct_answer": "B"},
+        {"question_id": "Q3", "options": ["A) x", "B) y"], "metadata": {"answer_letter": "A"}},
+    ]
+
+    assert loader.load_benchmark_answers(questions, source="medagentgym") == [
+        "A) service",
+        "B) y",
+        "A) x",
+    ]
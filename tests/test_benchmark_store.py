@@ -0,0 +1,98 @@
+"""
+Tests for the SQLite benchmark store and auto-mode source resolution
+"""
+
+import json
+
+import pytest
+
+from agents.agent_2_simulation.tools.benchmark_loader import BenchmarkLoader
+from agents.agent_2_simulation.tools.benchmark_store import SQLiteBenchmarkStore
+from src.config.settings import SimulationSettings
+
+
+@pytest.fixture
+def loader(tmp_path):
+    settings = SimulationSettings(
+        benchmark_data_path=str(tmp_path / "benchmarks"),
+        benchmark_index_poll_interval=0,
+        benchmark_store_path=str(tmp_path / "benchmarks.sqlite3"),
+    )
+    loader = BenchmarkLoader(settings)
+    yield loader
+    loader.close()
+
+
+def _write_file(loader, answers):
+    path = f"{loader.benchmark_data_path}/benchmarks.json"
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(answers, f)
+
+
+def test_store_round_trip_and_versions(tmp_path):
+    store = SQLiteBenchmarkStore(str(tmp_path / "store.sqlite3"))
+    try:
+        store.insert_many([("Q1", "A) old", "cardiology")], version="v1")
+        store.insert_many(
+            [("Q1", "B) new", "cardiology"), ("Q2", "C) other", "neurology")],
+            version="v2",
+        )
+
+        assert store.versions() == ["v2", "v1"]
+        assert store.lookup(["Q1", "Q2", "Q3"]) == {"Q1": "B) new", "Q2": "C) other"}
+        assert store.lookup(["Q1"], version="v1") == {"Q1": "A) old"}
+        assert store.lookup(["Q1", "Q2"], domain="neurology") == {"Q2": "C) other"}
+        assert store.count("v2") == 2
+    finally:
+        store.close()
+
+
+def test_store_skips_empty_answers(tmp_path):
+    store = SQLiteBenchmarkStore(str(tmp_path / "store.sqlite3"))
+    try:
+        version, written = store.insert_many(
+            [("Q1", "", "general"), ("Q2", "B) kept", "general"), (None, "C) x", "general")]
+        )
+        assert written == 1
+        assert store.lookup(["Q1", "Q2"], version=version) == {"Q2": "B) kept"}
+    finally:
+        store.close()
+
+
+def test_store_save_without_answers_does_not_shadow_file(loader):
+    _write_file(loader, {"Q1": "B) file answer", "Q2": "C) two"})
+    questions = [
+        {"question_id": "Q1", "domain": "cardiology"},
+        {"question_id": "Q2", "domain": "cardiology"},
+    ]
+
+    loader.save_benchmark_file(questions, fmt="sqlite")
+
+    assert loader.load_benchmark_answers(questions) == ["B) file answer", "C) two"]
+
+
+def test_auto_resolution_order(loader):
+    _write_file(loader, {"Q1": "A) file", "Q2": "B) file", "Q3": "C) file"})
+    loader.save_benchmark_file(
+        [{"question_id": "Q1", "correct_answer": "A) store"}], fmt="sqlite"
+    )
+    loader.save_benchmark_file(
+        [
+            {"question_id": "Q1", "correct_answer": "A) journal"},
+            {"question_id": "Q2", "correct_answer": "B) journal"},
+        ],
+        fmt="journal",
+    )
+    questions = [
+        {"question_id": "Q1"},
+        {"question_id": "Q2"},
+        {"question_id": "Q3"},
+        {"question_id": "Q4", "correct_answer": "D) embedded"},
+    ]
+
+    assert loader.load_benchmark_answers(questions) == [
+        "A) store",
+        "B) journal",
+        "C) file",
+        "D) embedded",
+    ]
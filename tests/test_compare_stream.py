@@ -0,0 +1,127 @@
+"""
+Tests for the streaming NDJSON compare-answers endpoint
+"""
+
+import asyncio
+import json
+
+from fastapi.testclient import TestClient
+
+from src.api.simulation_api import app
+
+STREAM_URL = "/api/simulation/compare-answers/stream"
+
+
+def _stream(rows):
+    body = "\n".join(row if isinstance(row, str) else json.dumps(row) for row in rows)
+    with TestClient(app) as client:
+        response = client.post(
+            STREAM_URL,
+            content=body.encode("utf-8"),
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+    assert response.status_code == 200
+    return [json.loads(line) for line in response.text.splitlines() if line.strip()]
+
+
+def test_malformed_rows_are_reported_and_stream_completes():
+    valid = {
+        "question": {"question_id": "Q1", "options": ["A) MI", "B) PE"]},
+        "model_answer": "A",
+        "benchmark_answer": "A) MI",
+    }
+    malformed = [
+        "not json",
+        json.dumps(["a", "list"]),
+        {"question": "q", "model_answer": "x", "benchmark_answer": "x"},
+        {"question": {}, "model_answer": "x", "benchmark_answer": "x", "accepted_answers": [1, 2]},
+        {"question": {"options": [1, 2]}, "model_answer": "A", "benchmark_answer": "A"},
+        {"question": {"domain": ["cardio"]}, "model_answer": "x", "benchmark_answer": "x"},
+        {"question": {}, "model_answer": 1, "benchmark_answer": "x"},
+    ]
+
+    lines = _stream([valid, *malformed, valid])
+
+    summary = lines[-1]["summary"]
+    results = {line["index"]: line for line in lines[:-1]}
+    assert sorted(results) == list(range(len(malformed) + 2))
+    for index in range(1, len(malformed) + 1):
+        assert "error" in results[index]
+    assert results[0]["is_correct"] and results[len(malformed) + 1]["is_correct"]
+    assert summary["error_count"] == len(malformed)
+    assert summary["total_count"] == 2
+
+
+def _valid_row(index):
+    return {
+        "question": {"question_id": f"Q{index}", "options": ["A) MI", "B) PE"]},
+        "model_answer": "A",
+        "benchmark_answer": "A) MI",
+    }
+
+
+def test_rows_split_across_many_chunks():
+    body = (json.dumps(_valid_row(0)) + "\n" + json.dumps(_valid_row(1))).encode("utf-8")
+
+    def chunks():
+        for i in range(0, len(body), 7):
+            yield body[i:i + 7]
+
+    with TestClient(app) as client:
+        response = client.post(STREAM_URL, content=chunks())
+    lines = [json.loads(line) for line in response.text.splitlines()]
+
+    assert [line.get("is_correct") for line in lines[:-1]] == [True, True]
+    assert lines[-1]["summary"]["error_count"] == 0
+
+
+def test_overlong_row_is_reported(monkeypatch):
+    from src.api.routes import simulation_routes
+
+    monkeypatch.setattr(simulation_routes.settings, "stream_max_line_bytes", 200)
+    long_row = {**_valid_row(1), "model_answer": "A" * 500}
+    body = "\n".join(json.dumps(row) for row in [_valid_row(0), long_row, _valid_row(2)])
+    pieces = [body[i:i + 50].encode("utf-8") for i in range(0, len(body), 50)]
+
+    with TestClient(app) as client:
+        response = client.post(STREAM_URL, content=iter(pieces))
+    lines = [json.loads(line) for line in response.text.splitlines()]
+
+    results = {line["index"]: line for line in lines[:-1]}
+    assert sorted(results) == [0, 1, 2]
+    assert "exceeds 200 bytes" in results[1]["error"]
+    assert lines[-1]["summary"]["total_count"] == 2
+
+
+def test_scoring_stops_when_client_disconnects():
+    body = "\n".join(json.dumps(_valid_row(i)) for i in range(2000)).encode("utf-8")
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+    sent = []
+
+    async def receive():
+        if messages:
+            return messages.pop(0)
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": STREAM_URL,
+        "raw_path": STREAM_URL.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"content-type", b"application/x-ndjson")],
+        "client": ("test", 1),
+        "server": ("test", 80),
+    }
+    asyncio.run(app(scope, receive, send))
+
+    streamed = b"".join(m.get("body", b"") for m in sent if m["type"] == "http.response.body")
+    assert b"summary" not in streamed
+    assert streamed.count(b"\n") < 2000
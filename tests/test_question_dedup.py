@@ -0,0 +1,92 @@
+"""
+Tests for exact and MinHash near-duplicate question detection
+"""
+
+import pytest
+
+from agents.agent_2_simulation.tools.question_dedup import (
+    DUPLICATE,
+    NEAR_DUPLICATE,
+    UNIQUE,
+    QuestionDedupIndex,
+    dedupe_questions,
+    minhash_signature,
+    question_fingerprint,
+)
+
+OPTIONS = ["A) Myocardial infarction", "B) Pulmonary embolism", "C) Aortic dissection", "D) Pericarditis"]
+STEM = (
+    "A 58-year-old man presents to the emergency department with crushing "
+    "substernal chest pain radiating to the left arm for the past two hours, "
+    "associated with diaphoresis and nausea. He has a history of hypertension, "
+    "type 2 diabetes and smoking. ECG shows ST elevation in leads II, III and aVF. "
+    "What is the most likely diagnosis"
+)
+
+
+def _question(question_id, text=STEM, options=OPTIONS):
+    return {"question_id": question_id, "question_text": text, "options": list(options)}
+
+
+def test_fingerprint_ignores_case_punctuation_and_option_order():
+    original = _question("Q1")
+    variant = _question("Q2", text=STEM.upper() + "??", options=[*reversed(OPTIONS)])
+    assert question_fingerprint(original) == question_fingerprint(variant)
+    assert question_fingerprint(original) != question_fingerprint(_question("Q3", text="Other"))
+
+
+def test_exact_mode():
+    index = QuestionDedupIndex("exact")
+    assert index.add(_question("Q1")) == (UNIQUE, None)
+    assert index.add(_question("Q2", text=STEM + "!")) == (DUPLICATE, "Q1")
+    assert index.add(_question("Q3", text=STEM + " in this patient")) == (UNIQUE, None)
+    assert index.report.to_dict() == {"checked": 3, "unique": 2, "duplicates": 1, "near_duplicates": 0}
+
+
+def test_near_mode_catches_small_edits_only():
+    index = QuestionDedupIndex("near", near_threshold=0.8)
+    assert index.add(_question("Q1")) == (UNIQUE, None)
+    assert index.add(_question("Q2", text=STEM + " in this patient")) == (NEAR_DUPLICATE, "Q1")
+
+    unrelated = _question(
+        "Q3",
+        text="A 7-year-old girl has a barking cough and inspiratory stridor "
+        "after a viral prodrome. Which radiograph finding is expected",
+        options=["A) Steeple sign", "B) Thumb sign", "C) Air bronchograms", "D) Normal"],
+    )
+    assert index.add(unrelated) == (UNIQUE, None)
+    assert index.report.near_duplicates == 1
+
+
+def test_minhash_signature_is_deterministic():
+    signature = minhash_signature(_question("Q1"))
+    assert len(signature) == 32
+    assert signature == minhash_signature(_question("Q9"))
+    assert signature != minhash_signature(_question("Q1", text="Something else entirely"))
+
+
+def test_none_mode_keeps_everything():
+    kept, report = dedupe_questions([_question("Q1"), _question("Q2")], mode="none")
+    assert kept == [0, 1]
+    assert report.unique == 2
+
+
+def test_dedupe_questions_keeps_first_copy():
+    questions = [_question("Q1"), _question("Q2", text="Other stem"), _question("Q3")]
+    kept, report = dedupe_questions(questions, mode="exact")
+    assert kept == [0, 1]
+    assert report.duplicates == 1
+
+
+def test_max_entries_bounds_the_index():
+    index = QuestionDedupIndex("near", max_entries=2)
+    for i in range(5):
+        index.add(_question(f"Q{i}", text=f"Question number {i} about topic {i}"))
+        assert len(index) <= 2
+    # The window was cleared, so an early question is no longer remembered
+    assert index.add(_question("again", text="Question number 0 about topic 0")) == (UNIQUE, None)
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError):
+        QuestionDedupIndex("fuzzy")
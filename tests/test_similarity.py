@@ -0,0 +1,68 @@
+"""
+Tests for the free-text similarity backends
+"""
+
+from difflib import SequenceMatcher
+
+import pytest
+
+from agents.agent_2_simulation.tools.answer_comparator import AnswerComparator
+from agents.agent_2_simulation.tools.similarity import (
+    BoundedSimilarity,
+    DifflibSimilarity,
+    get_similarity_backend,
+)
+from src.config.settings import SimulationSettings
+
+# (model answer, benchmark answer) pairs on both sides of the 0.8 threshold
+REFERENCE_PAIRS = [
+    ("acute myocardial infarction", "acute myocardial infarction"),
+    ("acute myocardial infraction", "acute myocardial infarction"),
+    ("pulmonary embolism", "aortic dissection"),
+    ("start heparin infusion", "start heparin"),
+    ("give aspirin 325 mg", "give aspirin 352 mg"),
+]
+
+# Borderline pairs where the LCS ratio accepts what difflib rejects
+DIVERGING_PAIRS = [
+    ("pericrnistsis", "pericarditis"),
+    ("aortic dissection", "aortcaduisection"),
+]
+
+
+def _lcs_ratio(a, b):
+    previous = [0] * (len(b) + 1)
+    for ch in a:
+        current = [0]
+        for j, other in enumerate(b):
+            current.append(previous[j] + 1 if ch == other else max(previous[j + 1], current[j]))
+        previous = current
+    return 2.0 * previous[-1] / (len(a) + len(b))
+
+
+def test_difflib_is_the_default():
+    assert SimulationSettings.model_fields["similarity_backend"].default == "difflib"
+    assert AnswerComparator().similarity_backend.name == "difflib"
+    assert get_similarity_backend("unknown").name == "difflib"
+
+
+@pytest.mark.parametrize("model_answer, benchmark_answer", REFERENCE_PAIRS + DIVERGING_PAIRS)
+def test_difflib_backend_matches_sequence_matcher(model_answer, benchmark_answer):
+    expected = SequenceMatcher(None, model_answer, benchmark_answer).ratio()
+    backend = DifflibSimilarity()
+    assert backend.ratio(model_answer, benchmark_answer) == expected
+    assert backend.at_least(model_answer, benchmark_answer, 0.8) == (expected >= 0.8)
+
+
+@pytest.mark.parametrize("model_answer, benchmark_answer", REFERENCE_PAIRS + DIVERGING_PAIRS)
+def test_bounded_backend_is_exact_lcs_ratio(model_answer, benchmark_answer):
+    expected = _lcs_ratio(model_answer, benchmark_answer)
+    backend = BoundedSimilarity()
+    assert backend.ratio(model_answer, benchmark_answer) == pytest.approx(expected)
+    assert backend.at_least(model_answer, benchmark_answer, 0.8) == (expected >= 0.8)
+
+
+@pytest.mark.parametrize("model_answer, benchmark_answer", DIVERGING_PAIRS)
+def test_bounded_backend_accepts_borderline_pairs_difflib_rejects(model_answer, benchmark_answer):
+    assert not DifflibSimilarity().at_least(model_answer, benchmark_answer, 0.8)
+    assert BoundedSimilarity().at_least(model_answer, benchmark_answer, 0.8)
@@ -0,0 +1,38 @@
+"""
+Tests for the hot-reloaded question template catalog
+"""
+
+import json
+
+from agents.agent_2_simulation.tools.template_catalog import TemplateCatalog
+
+VALID = {
+    "template_id": "neuro_001",
+    "domain": "neurology",
+    "difficulty": "easy",
+    "question": "Sudden worst headache of life. Most likely diagnosis?",
+    "options": ["A) Subarachnoid hemorrhage", "B) Migraine"],
+    "correct_answer": "A) Subarachnoid hemorrhage",
+}
+
+
+def test_invalid_entries_are_skipped(tmp_path):
+    path = tmp_path / "templates.jsonl"
+    lines = [[1, 2], "text", {**VALID, "template_id": "bad", "domain": ["neurology"]}, VALID]
+    path.write_text("\n".join(json.dumps(line) for line in lines) + "\n", encoding="utf-8")
+
+    catalog = TemplateCatalog(str(path), poll_interval=0)
+
+    assert len(catalog) == 1
+    assert catalog.keys() == [("neurology", "easy")]
+
+
+def test_unreadable_catalog_keeps_previous_index(tmp_path):
+    path = tmp_path / "templates.jsonl"
+    path.write_text(json.dumps(VALID) + "\n", encoding="utf-8")
+    catalog = TemplateCatalog(str(path), poll_interval=0)
+
+    path.write_text("{not json\n", encoding="utf-8")
+
+    assert not catalog.reload(force=True)
+    assert len(catalog) == 1